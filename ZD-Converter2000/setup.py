@@ -14,7 +14,8 @@ setuptools.setup(
     # entry_points={
     #     'console_scripts': ['mycli=mymodule:cli'],
     # },
-    install_requires= ["pyserial","colorama"],
+    # zuss.commands and zuss.log came with zuss 2.2.0
+    install_requires= ["pyserial","colorama","zuss>=2.2.0"],
     license='MIT',
     classifiers=[
     "Programming Language :: Python :: 3",
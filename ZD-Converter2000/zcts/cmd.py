@@ -1,105 +1,106 @@
-from .usbswsdk import *
+# -----------------------------------------------------------------------------
+# - ZCTS -  ZD Converter 2000 python SDK Command Line
+# - File              cmd.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    command line
+# - Brief             command line for ZD Converter 2000
+# -----------------------------------------------------------------------------
+"""
+Operations run in the order given, pipelined over one open port::
+
+    python -m zcts.cmd -P /dev/ttyUSB1 --setethspeed 1 100 --setbrrrole 2 1 -s
+    python -m zcts.cmd -P /dev/ttyUSB1 --snapshot
+
+New settings are active after a reboot (-r) and persistent after a save (-s).
+"""
 import argparse
-import colorama
-colorama.init()
-class bcolors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
-parser = argparse.ArgumentParser(prog=f'{bcolors.OKCYAN}zuss{bcolors.ENDC}',description=f'{bcolors.OKGREEN}Python sdk for USB Switch{bcolors.ENDC}',epilog=f"{bcolors.OKGREEN}Caution: Please implement only{bcolors.ENDC} {bcolors.WARNING}ONE{bcolors.ENDC} {bcolors.OKGREEN}function each time.{bcolors.ENDC}")
-parser.add_argument('-P','--port', type=str, help=f'Port name of USB switch.This arg is {bcolors.WARNING}REQUIRED{bcolors.ENDC} when manipulating the USB Switch')
+import sys
+
+from zuss import cmd
+from zuss.cmd import ColorArgumentParser, ScriptAction, add_flag, add_value, bcolors
+from zuss.commands import CONVERTER, REBOOT
+from zcts.zcts import TIMEOUT
+
+# time to wait for the answer to a reboot (seconds)
+REBOOT_TIMEOUT = CONVERTER.timeouts[REBOOT]
+
+# option: command of zuss.commands, see zuss.cmd.OPERATIONS
+OPERATIONS = {
+    'V': CONVERTER['GET_SW_VERSION'],
+    'r': CONVERTER['REBOOT_SYS'],
+    's': CONVERTER['SAVE_CONFIG'],
+    'R': CONVERTER['CLEAR_CONFIG'],
+    'd': CONVERTER['DISP_CONFIG'],
+    'status': CONVERTER['DISP_PORT_STATUS'],
+    'statistics': CONVERTER['DISP_PORT_STATISTICS'],
+    'setopmode': CONVERTER['SET_OP_MODE'],
+    'getopmode': CONVERTER['GET_OP_MODE'],
+    'setethspeed': CONVERTER['SET_ETH_SPEED'],
+    'getethspeed': CONVERTER['GET_ETH_SPEED'],
+    'setethdown': CONVERTER['SET_ETH_DOWN'],
+    'getethdown': CONVERTER['GET_ETH_DOWN'],
+    'setbrrspeed': CONVERTER['SET_BRR_SPEED'],
+    'getbrrspeed': CONVERTER['GET_BRR_SPEED'],
+    'setbrrdown': CONVERTER['SET_BRR_DOWN'],
+    'getbrrdown': CONVERTER['GET_BRR_DOWN'],
+    'setbrrrole': CONVERTER['SET_BRR_ROLE'],
+    'getbrrrole': CONVERTER['GET_BRR_ROLE'],
+    'setbrrmode': CONVERTER['SET_BRR_MODE'],
+    'getbrrmode': CONVERTER['GET_BRR_MODE'],
+}
+
+# everything readable, in one pipeline
+SNAPSHOT = ['-V', '--getopmode']
+for _port in ('1', '2'):
+    SNAPSHOT += ['--getethspeed', _port, '--getethdown', _port]
+for _port in ('1', '2'):
+    SNAPSHOT += ['--getbrrspeed', _port, '--getbrrdown', _port,
+                 '--getbrrrole', _port, '--getbrrmode', _port]
+SNAPSHOT += ['-d', '--status', '--statistics']
+
+class SnapshotAction(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        parser.parse_args(SNAPSHOT, namespace)
+
+def _flag(*names, **kwargs):
+    add_flag(parser, *names, spec=OPERATIONS[names[-1].lstrip('-')], **kwargs)
+
+def _value(*names, **kwargs):
+    add_value(parser, *names, spec=OPERATIONS[names[-1].lstrip('-')], type=int, **kwargs)
+
+parser = ColorArgumentParser(prog=f'{bcolors.OKCYAN}zcts{bcolors.ENDC}',description=f'{bcolors.OKGREEN}Python sdk for ZD Converter 2000{bcolors.ENDC}',epilog=f"{bcolors.OKGREEN}Operations run in the given order over{bcolors.ENDC} {bcolors.WARNING}ONE{bcolors.ENDC} {bcolors.OKGREEN}open port.{bcolors.ENDC}")
+parser.add_argument('-P','--port', type=str, help=f'Port name of the converter.This arg is {bcolors.WARNING}REQUIRED{bcolors.ENDC} when manipulating the converter')
 parser.add_argument('-v','--version', action='version', version='%(prog)s 1.0')
-parser.add_argument('-l',action="store_true", help='Print the list of serial COM ports in use.')
-parser.add_argument('-V',action="store_true", help='Current USB switch version information.')
-parser.add_argument('-r',action="store_true",help='Reboot the USB switch, about 10s.')
-parser.add_argument('-s',action="store_true",help='Save configuration into flash')
-parser.add_argument('-R',action="store_true",help='Reset configuration')
-parser.add_argument('-d',action="store_true",help='Display configuration')
-parser.add_argument('--sethost',type=int,help='Set enable host port,input from 1 to 4')
-parser.add_argument('--gethost',action="store_true",help='Show currently enabled host port')
-parser.add_argument('--setdev',type=int,help='Set enable device port,input from 1 to 4')
-parser.add_argument('--getdev',action="store_true",help='Show currently enabled device port')
-parser.add_argument('--setrelay',type=int,help='Set Relay Mask, 4bit Mask value, Bit0 to Bit3 stand for Relay1 to Relay4,input from 0 to 15')
-parser.add_argument('--getrelay',action="store_true",help='Show currently Relay Mask,Bit0 to Bit3 stand for Relay1 to Relay4')
-parser.add_argument('--setpwr',type=int,help='Set Power Supply Mask,Set the Mask of the Device Ports enable to power supply, Bit0 to Bit3 stand for Port1 to Port4.input from 0 to 15')
-parser.add_argument('--getpwr',action="store_true",help='Show currently Power Supply Mask')
-if __name__ == '__main__':
-    args  = parser.parse_args()
-    if args.l:
-        detect_comports()
-    elif args.V:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-V requires -P{bcolors.ENDC}")
-        else:
-            get_version(args.port)
-    elif args.r:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-r requires -P{bcolors.ENDC}")
-        else:
-            reboot_sys(args.port)
-    elif args.s:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-s requires -P{bcolors.ENDC}")
-        else:
-            save_config(args.port)
-    elif args.R:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-R requires -P{bcolors.ENDC}")
-        else:
-            clr_config(args.port)
-    elif args.d:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-d requires -P{bcolors.ENDC}")
-        else:
-            disp_config(args.port)
-    elif args.sethost:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-sethost requires -P{bcolors.ENDC}")
-        else:
-            set_host_port(args.port, args.sethost)
-    elif args.gethost:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-gethost requires -P{bcolors.ENDC}")
-        else:
-        
-            get_host_port(args.port)
-    elif args.setdev:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setdev requires -P{bcolors.ENDC}")
-        else:
-        
-            set_dev_port(args.port, args.setdev)
-    elif args.getdev:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getdev requires -P{bcolors.ENDC}")
-        else:
-        
-            get_dev_port(args.port)
-    elif args.setrelay:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setrelay requires -P{bcolors.ENDC}")
-        else:
-        
-            set_relay_mask(args.port,args.setrelay)
-    elif args.getrelay:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getrelay requires -P{bcolors.ENDC}")
-        else:
-            get_relay_mask(args.port)
-    elif args.setpwr:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setpwr requires -P{bcolors.ENDC}")
-        else:
-            set_pwr_mask(args.port,args.setpwr)
-    elif args.getpwr:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getpwr requires -P{bcolors.ENDC}")
-        else:
-            get_pwr_mask(args.port)
+add_flag(parser,'-l', help='Print the list of serial COM ports in use.')
+_flag('-V', help='Current converter software version.')
+_flag('-r', help='Reboot the converter, activates the new configuration.')
+_flag('-s', help='Save configuration into flash')
+_flag('-R', help='Clear configuration in flash')
+_flag('-d', help='Display configuration')
+_flag('--status', help='Display port status: speed, role, link')
+_flag('--statistics', help='Display port statistics: frames, bytes, drops')
+_value('--setopmode', help='Set operation mode, 0 to 3')
+_flag('--getopmode', help='Show operation mode: enable, config, status')
+_value('--setethspeed', nargs=2, metavar=('PORT', 'SPEED'), help='Set ETH speed: port 1/2, 100/1000')
+_value('--getethspeed', metavar='PORT', help='Show ETH speed: config, active')
+_value('--setethdown', nargs=2, metavar=('PORT', 'DOWN'), help='Set ETH force down: port 1/2, 0/1')
+_value('--getethdown', metavar='PORT', help='Show ETH force down')
+_value('--setbrrspeed', nargs=2, metavar=('PORT', 'SPEED'), help='Set BRR speed: port 1/2, 100/1000')
+_value('--getbrrspeed', metavar='PORT', help='Show BRR speed')
+_value('--setbrrdown', nargs=2, metavar=('PORT', 'DOWN'), help='Set BRR force down: port 1/2, 0/1')
+_value('--getbrrdown', metavar='PORT', help='Show BRR force down')
+_value('--setbrrrole', nargs=2, metavar=('PORT', 'ROLE'), help='Set BRR role: port 1/2, 0: master 1: slave')
+_value('--getbrrrole', metavar='PORT', help='Show BRR role')
+_value('--setbrrmode', nargs=2, metavar=('PORT', 'MODE'), help='Set BRR mode: port 1/2, 0: ieee-compliant 1: legacy')
+_value('--getbrrmode', metavar='PORT', help='Show BRR mode')
+parser.add_argument('--snapshot', action=SnapshotAction, nargs=0, default=argparse.SUPPRESS, help='Read all settings, status and statistics')
+parser.add_argument('--script', action=ScriptAction, default=argparse.SUPPRESS, help='Run the options in this file, at this place')
+parser.add_argument('--verbose', action="store_true", help='Also show the requests and answer frames')
+
+def main(argv=None):
+    return cmd.main(argv, parser, timeout=TIMEOUT, reboot_timeout=REBOOT_TIMEOUT)
 
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# -----------------------------------------------------------------------------
+# - File              cmd_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    cmd_unittest
+# - Brief             cmd_unittest for the zcts command line
+# -----------------------------------------------------------------------------
+import contextlib
+import io
+import unittest
+
+from zcts import cmd
+from zuss import metrics
+from zuss.transport import FakeTransport
+
+
+def run(*argv):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        code = cmd.main(list(argv))
+    return code, out.getvalue().splitlines()
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        FakeTransport.devices.clear()
+        self.records = []
+        metrics.add_hook(self.records.append)
+
+    def tearDown(self):
+        metrics.remove_hook(self.records.append)
+
+    def test_settings_with_one_save(self):
+        code, lines = run("-P", "fake://converter", "--setethspeed", "1", "100",
+                          "--setethdown", "2", "1", "--setbrrrole", "2", "1",
+                          "--setbrrmode", "1", "1", "--setopmode", "3", "-s")
+        self.assertEqual(0, code)
+        self.assertEqual(6, len(lines))
+        saved = FakeTransport.devices["converter"].saved
+        self.assertEqual(100, saved["ETH1_speed"])
+        self.assertEqual(1, saved["ETH2_down"])
+        self.assertEqual(1, saved["BRR2_role"])
+        self.assertEqual(1, saved["BRR1_mode"])
+        self.assertEqual(3, saved["op_mode"])
+        self.assertEqual(["SAVE_CONFIG"], [r.name for r in self.records if r.name.startswith("SAVE")])
+
+    def test_snapshot(self):
+        code, lines = run("-P", "fake://converter", "--snapshot")
+        self.assertEqual(0, code)
+        report = [line for line in lines if line.startswith("-")]
+        self.assertEqual(len([a for a in cmd.SNAPSHOT if a.startswith("-")]), len(report))
+        self.assertTrue(any(line.startswith("ETH1: TxFrames=") for line in lines))
+        self.assertTrue(any(line.startswith("BRR2: speed=") for line in lines))
+        # one pipeline on one open port
+        self.assertEqual(1, len({record.batch for record in self.records}))
+
+    def test_invalid_argument(self):
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            with self.assertRaises(SystemExit):
+                cmd.main(["-P", "fake://converter", "--setbrrspeed", "1", "10"])
+        self.assertIn("speed:10 error", err.getvalue())
+        self.assertEqual([], self.records)
+
+
+if __name__ == "__main__":
+    unittest.main()
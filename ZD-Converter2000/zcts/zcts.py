@@ -7,12 +7,10 @@
 # - Brief             Python SDK for ZD converter2000
 # ----------------------------------------------------------------------------- 
 
-import serial
-from serial import Serial
-import serial.tools.list_ports as port_list
-import time
-import colorama
-colorama.init()
+from zuss.commands import CONVERTER, NORMAL
+from zuss.log import enable_color
+# time to wait for the answer of a command (seconds)
+TIMEOUT = CONVERTER.timeouts[NORMAL]
 class bcolors:
     HEADER = '\033[95m'
     OKBLUE = '\033[94m'
@@ -29,8 +27,10 @@ class bcolors:
 # Returns: The list of serial COM ports in use :list                           #    
 ################################################################################  
 def detect_comports():
+    import serial.tools.list_ports as port_list
     com_ports_details = list(port_list.comports())
     com_ports = []
+    enable_color()
     for p in com_ports_details:
         print(f"{bcolors.OKGREEN}{p}{bcolors.ENDC}")
         com_ports.append(str(p).split(" ")[0])
@@ -39,57 +39,22 @@ def detect_comports():
 ################################################################################
 # Description : Get Current Version Information                                #
 # Argument: serial_num: str                                                    #                             
-# Returns: None                                                                #    
+# Returns: version: str                                                        #    
 # Get the current version information of ZD-Converter2000 software
 ################################################################################  
-def get_sw_version(serial_num: str): 
-    time_start=time.time()  
-    serialPort = Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(b"<GET_SW_VERSION{}>")
-    serialString = ""  # Used to hold data coming over UART
-    
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass
+def get_sw_version(serial_num: str):
+    return CONVERTER["GET_SW_VERSION"].run(serial_num)
 
 ################################################################################
 # Description : Reboot System                                                  #
 # Argument: serial_num: str                                                    #                             
-# Returns: None                                                                #    
+# Returns: Reboot status: bool                                                 #    
 # Reboot system. After saving configuration, new configuration parameters can only be activated
 # when system is rebooted.
 ################################################################################
 def reboot_sys(serial_num: str):
-    time_start=time.time() 
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(b"<REBOOT_SYS{}>")
-    serialString = ""  # Used to hold data coming over UART
-
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>1.5:
-            return  
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+    return CONVERTER["REBOOT_SYS"].run(serial_num)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-           
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass
 ################################################################################
 # Description : Save Configuration into Flash                                  #
 # Argument: serial_num: str                                                    #                             
@@ -100,27 +65,7 @@ def reboot_sys(serial_num: str):
 # when system is rebooted.
 ################################################################################     
 def save_config(serial_num: str):
-    time_start=time.time() 
-    res = False
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(b"<SAVE_CONFIG{}>")
-    serialString = ""  # Used to hold data coming over UART
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.5:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[SAVE_CONFIG{ok}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass
+    return CONVERTER["SAVE_CONFIG"].run(serial_num)
 
 ################################################################################
 # Description : Clear Configuration in Flash                                   #
@@ -130,28 +75,7 @@ def save_config(serial_num: str):
 # Erase the configuration in ZD-Converter2000’s internal flash memory.
 ################################################################################   
 def clear_config(serial_num: str):
-    time_start=time.time() 
-    res = False
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(b"<CLEAR_CONFIG{}>")
-    serialString = ""  # Used to hold data coming over UART
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.5:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[CLEAR_CONFIG{ok}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass
-
+    return CONVERTER["CLEAR_CONFIG"].run(serial_num)
 
 ################################################################################
 # Description : Display Current Configuration in Ram                           #
@@ -160,28 +84,17 @@ def clear_config(serial_num: str):
 # Display the current configuration parameters, including newly settings which are not in flash
 # Memory  
 ################################################################################
-def disp_config(serial_num: str): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(b"<DISP_CONFIG{}>")
-    res = False
-    serialString = ""  # Used to hold data coming over UART
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.5:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def disp_config(serial_num: str):
+    return CONVERTER["DISP_CONFIG"].run(serial_num)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[DISP_CONFIG{ok}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass
+################################################################################
+# Description : Stream Current Configuration                                   #
+# Argument: serial_num: str                                                    #
+# Returns: Generator of configuration lines: zuss.frames.Display               #
+# Yields the lines as the device sends them, stop early with break.
+################################################################################
+def stream_config(serial_num: str):
+    return CONVERTER["DISP_CONFIG"].stream(serial_num)
 
 ################################################################################
 # Description : Display Port Status                                     #
@@ -189,28 +102,17 @@ def disp_config(serial_num: str):
 # Returns: Display result: bool                                                #    
 # Show the status of ZD-Converter2000’s four ethernet ports Speed, Role, Link up Status etc
 ################################################################################
-def disp_port_status(serial_num: str): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(b"<DISP_PORT_STATUS{}>")
-    res = False
-    serialString = ""  # Used to hold data coming over UART
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def disp_port_status(serial_num: str):
+    return CONVERTER["DISP_PORT_STATUS"].run(serial_num)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[DISP_PORT_STATUS{ok}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass
+################################################################################
+# Description : Stream Port Status                                             #
+# Argument: serial_num: str                                                    #
+# Returns: Generator of port status: zuss.frames.Display                       #
+# Yields the lines as the device sends them, stop early with break.
+################################################################################
+def stream_port_status(serial_num: str):
+    return CONVERTER["DISP_PORT_STATUS"].stream(serial_num)
 
 ################################################################################
 # Description : Display Statistics Information                                 #
@@ -221,28 +123,18 @@ def disp_port_status(serial_num: str):
 # frames, broadcast frames, counts the transmitted and received number of frames which were
 # dropped.
 ################################################################################
-def disp_port_statistics(serial_num: str): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(b"<DISP_PORT_STATISTICS{}>")
-    res = False
-    serialString = ""  # Used to hold data coming over UART
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def disp_port_statistics(serial_num: str):
+    return CONVERTER["DISP_PORT_STATISTICS"].run(serial_num)
+
+################################################################################
+# Description : Stream Statistics Information                                  #
+# Argument: serial_num: str                                                    #
+# Returns: Generator of port statistics: zuss.frames.Display                   #
+# Yields the lines as the device sends them, stop early with break.
+################################################################################
+def stream_port_statistics(serial_num: str):
+    return CONVERTER["DISP_PORT_STATISTICS"].stream(serial_num)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[DISP_PORT_STATISTICS{ok}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass
 ################################################################################
 # Description : Set Operation Mode                                             #
 # Argument: serial_num: str, 1~4 : int           0: mode 0; 1: mode 1          #  
@@ -251,63 +143,20 @@ def disp_port_statistics(serial_num: str):
 # • Set the configuration of operation mode.
 # • Notice: this setting can only be persistent after SAVE_CONFIG command is issued.  
 ################################################################################    
-def set_op_mode(serial_num: str,value:int): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    if value not in [0,1,2,3]:
-        print(f"Input value:{value} error! Valid options: 0: mode 0; 1: mode 1; 2: mode 2; 3: mode 3")
-        return False
-    serialPort.write( bytes(f"<SET_OP_MODE{{{value}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = False 
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.5:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if f"[SET_OP_MODE{{{value}}}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
+def set_op_mode(serial_num: str,value:int):
+    return CONVERTER["SET_OP_MODE"].run(serial_num, value)
+
 ################################################################################
 # Description : Get Operation Mode                                             #
 # Argument: serial_num: str                                                    #                             
-# Returns:  Currently Operation Mode:list( enable:int, config:int,status:int ) #  
+# Returns:  Currently Operation Mode: zuss.frames.OpMode(enable, config, status)
 # enable 0: Manual Mode 1: Program Mode  
 # config -1: default 0: mode 0; 1: mode 1 2: mode 2; 3: mode 3
 # status 0: mode 0; 1: mode 12: mode 2; 3: mode 3
 ################################################################################  
-def get_op_mode(serial_num: str): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write( b"<GET_OP_MODE{}>")
-    serialString = ""  # Used to hold data coming over UART
-    res = [-1,-1,-1]
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def get_op_mode(serial_num: str):
+    return CONVERTER["GET_OP_MODE"].run(serial_num)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[GET_OP_MODE{" in serialString:   
-                for i in range(0,3):
-                    res[i] = serialString.lstrip('[GET_OP_MODE{').rstrip("}]\r\n").split(",")[i]
-
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-                
-            except:
-                pass  
 ################################################################################
 # Description : Set ETH Speed                                                  #
 # Argument: serial_num: str, port : int, speed:int                             #                             
@@ -315,63 +164,16 @@ def get_op_mode(serial_num: str):
 # • Set the Configuration of ETH Speed
 # • Notice: this setting can only be persistent after SAVE_CONFIG command is issued.
 ################################################################################  
-def set_eth_speed(serial_num: str,port:int,speed:int): 
-    time_start=time.time()
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    if speed not in [100,1000]:
-        print(f"Input speed:{speed} error! Valid options: 100: 100M; 1000: 1000M")
-        return False
-    elif port not in [1,2]:
-        print(f"Input port number:{port} error! Valid options: 1: ETH 1; 2: ETH 2(GE)")
-        return False
-    serialPort.write( bytes(f"<SET_ETH_SPEED{{{port},{speed}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = False
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def set_eth_speed(serial_num: str,port:int,speed:int):
+    return CONVERTER["SET_ETH_SPEED"].run(serial_num, port, speed)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if f"[SET_ETH_SPEED{{{port},{speed}}}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass  
 ################################################################################
 # Description :  Get ETH Speed                                           #
 # Argument: serial_num: str, port:int                                                    #                             
-# Returns:  list of the Configuration of ETH Speed in Ram and current Setting: list                            #    
+# Returns:  ETH Speed in Ram and in use: zuss.frames.Setting(port, config, active)
 ################################################################################  
-def get_eth_speed(serial_num: str,port:int): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(bytes(f"<GET_ETH_SPEED{{{port}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = [-1,-1,-1]
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[GET_ETH_SPEED{" in serialString:   
-                for i in range(0,3):
-                    res[i] = serialString.lstrip('[GET_ETH_SPEED{').rstrip("}]\r\n").split(",")[i]
-
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
+def get_eth_speed(serial_num: str,port:int):
+    return CONVERTER["GET_ETH_SPEED"].run(serial_num, port)
 
 ################################################################################
 # Description : Set ETH Operator of Force Down                                                 #
@@ -380,63 +182,17 @@ def get_eth_speed(serial_num: str,port:int):
 # • Set the Operator of Force Down
 # • Notice: this setting can only be persistent after SAVE_CONFIG command is issued
 ################################################################################  
-def set_eth_down(serial_num: str,port:int,com:int): 
-    time_start=time.time()
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    if com not in [0,1]:
-        print(f"Input com:{com} error! Valid options: 0: not down; 1: down")
-        return False
-    elif port not in [1,2]:
-        print(f"Input port number:{port} error! Valid options: 1: ETH 1; 2: ETH 2(GE)")
-        return False
-    serialPort.write( bytes(f"<SET_ETH_DOWN{{{port},{com}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = False
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def set_eth_down(serial_num: str,port:int,com:int):
+    return CONVERTER["SET_ETH_DOWN"].run(serial_num, port, com)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if f"[SET_ETH_DOWN{{{port}, {com}}}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
 ################################################################################
 # Description : Get ETH Operator of Force Down                                         #
 # Argument: serial_num: str, port : int                                                      #                             
-# Returns:  list of Currently ETH Operator of Force Down  :list                              #    
+# Returns:  ETH Operator of Force Down in Ram and in use: zuss.frames.Setting
 ################################################################################  
-def get_eth_down(serial_num: str,port:int): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(bytes(f"<GET_ETH_DOWN{{{port}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = [-1,-1,-1]
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def get_eth_down(serial_num: str,port:int):
+    return CONVERTER["GET_ETH_DOWN"].run(serial_num, port)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[GET_ETH_DOWN{" in serialString:  
-                for i in range(0,3):
-                    res[i] = serialString.lstrip('[GET_ETH_DOWN{').rstrip("}]\r\n").split(",")[i]
-
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
 ################################################################################
 # Description : Set BRR Speed                                                  #
 # Argument: serial_num: str, port : int, speed:int                             #                             
@@ -444,64 +200,16 @@ def get_eth_down(serial_num: str,port:int):
 # • Set the Configuration of BRR Speed
 # • Notice: this setting can only be persistent after SAVE_CONFIG command is issued.
 ################################################################################  
-def set_brr_speed(serial_num: str,port:int,speed:int): 
-    time_start=time.time()
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    if speed not in [100,1000]:
-        print(f"Input speed:{speed} error! Valid options: 100: 100M; 1000: 1000M")
-        return False
-    elif port not in [1,2]:
-        print(f"Input port number:{port} error! Valid options: 1: BRR 1; 2: BRR 2")
-        return False
-    serialPort.write( bytes(f"<SET_BRR_SPEED{{{port},{speed}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = False
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if f"[SET_BRR_SPEED{{{port},{speed}}}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass  
+def set_brr_speed(serial_num: str,port:int,speed:int):
+    return CONVERTER["SET_BRR_SPEED"].run(serial_num, port, speed)
 
 ################################################################################
 # Description :  Get BRR Speed                                         #
 # Argument: serial_num: str, port:int                                                    #                             
-# Returns:   list ofCurrently Get BRR Speed: list                               #    
+# Returns:  BRR Speed in Ram and in use: zuss.frames.Setting(port, config, active)
 ################################################################################  
-def get_brr_speed(serial_num: str,port:int): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(bytes(f"<GET_BRR_SPEED{{{port}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = [-1,-1,-1]
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[GET_BRR_SPEED{" in serialString:   
-                for i in range(0,3):
-                    res[i] = serialString.lstrip('[GET_BRR_SPEED{').rstrip("}]\r\n").split(",")[i]
-
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
+def get_brr_speed(serial_num: str,port:int):
+    return CONVERTER["GET_BRR_SPEED"].run(serial_num, port)
 
 ################################################################################
 # Description : Set BRR Operator of Force Down                                                #
@@ -510,63 +218,17 @@ def get_brr_speed(serial_num: str,port:int):
 # • Set the Operator of Force Down
 # • Notice: this setting can only be persistent after SAVE_CONFIG command is issued
 ################################################################################  
-def set_brr_down(serial_num: str,port:int,com:int): 
-    time_start=time.time()
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    if com not in [0,1]:
-        print(f"Input com:{com} error! Valid options: 0: not down; 1: down")
-        return False
-    elif port not in [1,2]:
-        print(f"Input port number:{port} error! Valid options: 1: BRR 1; 2: BRR 2")
-        return False
-    serialPort.write( bytes(f"<SET_BRR_DOWN{{{port},{com}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = False
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def set_brr_down(serial_num: str,port:int,com:int):
+    return CONVERTER["SET_BRR_DOWN"].run(serial_num, port, com)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if f"[SET_BRR_DOWN{{{port}, {com}}}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
 ################################################################################
 # Description : Get BRR Operator of Force Down                                         #
 # Argument: serial_num: str, port : int                                                      #                             
-# Returns:  • Get the Configuration of the Operator of Force Down in Ram and current Link Status of BRR                              #    
+# Returns:  • Get the Configuration of the Operator of Force Down in Ram and current Link Status of BRR: zuss.frames.Setting
 ################################################################################  
-def get_brr_down(serial_num: str,port:int): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(bytes(f"<GET_BRR_DOWN{{{port}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = [-1,-1,-1]
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[GET_BRR_DOWN{" in serialString:
-                for i in range(0,3):
-                    res[i] = serialString.lstrip('[GET_BRR_DOWN{').rstrip("}]\r\n").split(",")[i]
+def get_brr_down(serial_num: str,port:int):
+    return CONVERTER["GET_BRR_DOWN"].run(serial_num, port)
 
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
 ################################################################################
 # Description : Set BRR Role                                                 #
 # Argument: serial_num: str, port : int, com:int                             #                             
@@ -574,63 +236,17 @@ def get_brr_down(serial_num: str,port:int):
 # • Set the Configuration of BRR Role
 # • Notice: this setting can only be persistent after SAVE_CONFIG command is issued
 ################################################################################  
-def set_brr_role(serial_num: str,port:int,com:int): 
-    time_start=time.time()
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    if com not in [0,1]:
-        print(f"Input com:{com} error! Valid options: 0: master; 1: slave")
-        return False
-    elif port not in [1,2]:
-        print(f"Input port number:{port} error! Valid options: 1: BRR 1; 2: BRR 2")
-        return False
-    serialPort.write( bytes(f"<SET_BRR_ROLE{{{port},{com}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = False
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def set_brr_role(serial_num: str,port:int,com:int):
+    return CONVERTER["SET_BRR_ROLE"].run(serial_num, port, com)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if f"[SET_BRR_ROLE{{{port}, {com}}}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
 ################################################################################
 # Description : Get BRR Role                                         #
 # Argument: serial_num: str, port : int                                                      #                             
-# Returns:  • Get the Configuration of BRR Role and current Role status                           #    
+# Returns:  • Get the Configuration of BRR Role and current Role status: zuss.frames.Setting of zuss.frames.Role
 ################################################################################  
-def get_brr_role(serial_num: str,port:int): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(bytes(f"<GET_BRR_ROLE{{{port}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = [-1,-1,-1]
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[GET_BRR_ROLE{" in serialString:               
-                for i in range(0,3):
-                    res[i] = serialString.lstrip('[GET_BRR_ROLE{').rstrip("}]\r\n").split(",")[i]
+def get_brr_role(serial_num: str,port:int):
+    return CONVERTER["GET_BRR_ROLE"].run(serial_num, port)
 
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
 ################################################################################
 # Description : Set BRR Mode                                                #
 # Argument: serial_num: str, port : int, com:int                             #                             
@@ -638,62 +254,13 @@ def get_brr_role(serial_num: str,port:int):
 # • Set the Configuration of BRR mode
 # • Notice: this setting can only be persistent after SAVE_CONFIG command is issued
 ################################################################################  
-def set_brr_mode(serial_num: str,port:int,com:int): 
-    time_start=time.time()
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    if com not in [0,1]:
-        print(f"Input com:{com} error! Valid options: 0: ieee-compliant; 1: legacy")
-        return False
-    elif port not in [1,2]:
-        print(f"Input port number:{port} error! Valid options: 1: BRR 1; 2: BRR 2")
-        return False
-    serialPort.write( bytes(f"<SET_BRR_MODE{{{port},{com}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = False
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
+def set_brr_mode(serial_num: str,port:int,com:int):
+    return CONVERTER["SET_BRR_MODE"].run(serial_num, port, com)
 
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if f"[SET_BRR_MODE{{{port}, {com}}}]" in serialString:
-                res =  True
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
 ################################################################################
 # Description : Get BRR mode                                         #
 # Argument: serial_num: str, port : int                                                      #                             
-# Returns:  • Get the Configuration of BRR mode and current mode status                           #    
+# Returns:  • Get the Configuration of BRR mode and current mode status: zuss.frames.Setting of zuss.frames.BrrMode
 ################################################################################  
-def get_brr_mode(serial_num: str,port:int): 
-    time_start=time.time()  
-    serialPort = serial.Serial(port=serial_num, baudrate=115200, bytesize=8, timeout=2, stopbits=serial.STOPBITS_ONE)
-    serialPort.write(bytes(f"<GET_BRR_MODE{{{port}}}>", encoding = "utf8"))
-    serialString = ""  # Used to hold data coming over UART
-    res = [-1,-1,-1]
-    while 1 :
-        time_end=time.time()
-        if (time_end-time_start)>0.1:
-            return res
-        # Wait until there is data waiting in the serial buffer
-        if serialPort.in_waiting > 0:
-
-            # Read data out of the buffer until a carraige return / new line is found
-            serialString = serialPort.readline().decode("Ascii")
-            if "[GET_BRR_MODE{" in serialString:               
-                # res = serialString.lstrip('Return: [GET_BRR_MODE{').rstrip('}]')[0]
-                for i in range(0,3):
-
-                    res[i] = serialString.lstrip('[GET_BRR_MODE{').rstrip("}]\r\n").split(",")[i]
-
-            # Print the contents of the serial data
-            try:
-                print(serialString)
-            except:
-                pass 
\ No newline at end of file
+def get_brr_mode(serial_num: str,port:int):
+    return CONVERTER["GET_BRR_MODE"].run(serial_num, port)
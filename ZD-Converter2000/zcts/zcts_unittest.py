@@ -5,9 +5,31 @@
 # - Date              21.06.2021
 # - Classification    converter2000_sdk_unittest
 # ----------------------------------------------------------------------------- 
+import os
 import unittest
 from zcts import *
-comport = "COM186"
+from zuss.frames import Role
+
+# Set ZCTS_TEST_PORT (e.g. COM186) to run against real hardware, otherwise the
+# tests run against a converter simulated by zuss.simulator.
+comport = os.environ.get("ZCTS_TEST_PORT")
+simulator = None
+
+
+def setUpModule():
+    global comport, simulator
+    if comport is None:
+        from zuss.simulator import Simulator
+
+        simulator = Simulator().start()
+        comport = simulator.add_converter().port
+
+
+def tearDownModule():
+    if simulator is not None:
+        simulator.stop()
+
+
 class TestTemplate(unittest.TestCase):
     def test_detect_comports(self):
         detect_comports()
@@ -30,6 +52,16 @@ class TestTemplate(unittest.TestCase):
     def test_disp_port_statistics(self):##### VERBINDUNG benotigen
         a = disp_port_statistics(comport)
         self.assertEqual(True,a)
+    def test_stream_port_status(self):
+        a = [d.port for d in stream_port_status(comport)]
+        self.assertEqual(["ETH1","ETH2","BRR1","BRR2"],a)
+    def test_stream_port_statistics(self):
+        for d in stream_port_statistics(comport):
+            self.assertEqual("ETH1",d.port)
+            self.assertIn("TxFrames",d.values)
+            break
+        a = [d.port for d in stream_port_statistics(comport)]
+        self.assertEqual(4,len(a))
 
 
     def test_set_op_mode(self): #####no return value
@@ -38,8 +70,9 @@ class TestTemplate(unittest.TestCase):
             self.assertEqual(True,a)
     def test_get_op_mode(self):
         a = get_op_mode(comport)
-        for i in range(0,3):
-            self.assertNotEqual(-1,a[i])
+        # config -1 is the default mode, enable and status are always known
+        self.assertIn(a.enable,[0,1])
+        self.assertIn(a.status,[0,1,2,3])
     
 
     def test_set_eth_speed(self):
@@ -56,7 +89,7 @@ class TestTemplate(unittest.TestCase):
             for j in [100,1000]:
                 set_eth_speed(comport,i,j)
                 a = get_eth_speed(comport,i)
-                self.assertEqual(str(j),a[1])
+                self.assertEqual(j,a.config)
     
     
     def test_set_eth_down(self):
@@ -67,7 +100,7 @@ class TestTemplate(unittest.TestCase):
     def test_get_eth_down(self):
         for i in [1,2]:
             a = get_eth_down(comport,i)
-            self.assertEqual(str(i),a[0])
+            self.assertEqual(i,a.port)
     
     
     def test_set_brr_speed(self):
@@ -87,7 +120,7 @@ class TestTemplate(unittest.TestCase):
             for j in [100,1000]:
                 set_brr_speed(comport,i,j)
                 a = get_brr_speed(comport,i)
-                self.assertEqual(str(j),a[1])
+                self.assertEqual(j,a.config)
 
 
     def test_set_brr_down(self):
@@ -98,7 +131,7 @@ class TestTemplate(unittest.TestCase):
     def test_get_brr_down(self):
         for i in [1,2]:
             a = get_brr_down(comport,i)
-            self.assertEqual(str(i),a[0])
+            self.assertEqual(i,a.port)
 
 
 
@@ -109,8 +142,10 @@ class TestTemplate(unittest.TestCase):
                 self.assertEqual(True,a)
     def test_get_brr_role(self):
         for i in [1,2]:
+            set_brr_role(comport,i,1)
             a = get_brr_role(comport,i)
-            self.assertEqual(str(i),a[0])
+            self.assertEqual(i,a.port)
+            self.assertIs(Role.SLAVE,a.config)
 
     def test_set_brr_mode(self):
         for i in [1,2]:
@@ -123,7 +158,7 @@ class TestTemplate(unittest.TestCase):
             for j in [0,1]:
                 set_brr_mode(comport,i,j)
                 a = get_brr_mode(comport,i)
-                self.assertEqual(j,int(a[1]))
+                self.assertEqual(j,a.config)
     
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
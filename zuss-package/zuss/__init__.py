@@ -11,7 +11,7 @@
 #       2021.09.27    Add set_relay/set_power commands.  Yu-Ling Xie
 # ----------------------------------------------------------------------------- 
 name = "zuss"
-__version__ = '2.1.0'
+__version__ = '2.2.0'
 __all__ = [
     'detect_comports',
     'get_version',
@@ -19,6 +19,7 @@ __all__ = [
     'save_config',
     'clr_config',
     'disp_config',
+    'stream_config',
     'set_host_port',
     'get_host_port',
     'set_dev_port',
@@ -30,6 +31,8 @@ __all__ = [
     'set_relay',
     'get_relay',
     'set_pwr',
-    'get_pwr'
+    'get_pwr',
+    'set_relays',
+    'set_pwrs'
 ]
 from .usbswsdk import *
@@ -0,0 +1,283 @@
+# -----------------------------------------------------------------------------
+# - File              benchmark.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Command latency / throughput / CPU benchmark
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Benchmark of the zuss (and, if installed, zcts) command functions.
+
+Runs against simulated devices by default, or against real hardware with
+``--port`` / ``--converter-port``::
+
+    python -m zuss.benchmark --iterations 50 --output bench.json
+    python -m zuss.benchmark --baseline bench.json
+
+For every case the result holds p50/p99 latency, commands per second, CPU
+seconds per command and the number of file descriptors still held after the
+run.  Cached answers (zuss.cache) are dropped before every call, so each
+case measures the device.  With ``--baseline`` every metric is compared against a stored result and
+the exit code is 1 if one of them got worse by more than ``--tolerance``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import zuss
+from zuss.cache import RESULTS
+from zuss.session import Session, frame_name
+
+# metric name: True if a higher value is better
+METRICS = {
+    "p50_ms": False,
+    "p99_ms": False,
+    "cps": True,
+    "cpu_s_per_cmd": False,
+    "fds": False,
+}
+
+SWITCH_CASES = {
+    "get_version": lambda port: zuss.get_version(port),
+    "get_host_port": lambda port: zuss.get_host_port(port),
+    "set_host_port": lambda port: zuss.set_host_port(port, 2),
+    "get_relay_mask": lambda port: zuss.get_relay_mask(port),
+    "set_pwr_mask": lambda port: zuss.set_pwr_mask(port, 0xF),
+}
+
+SWITCH_PIPELINE = b"<GET_HOST_PORT{}>"
+# case run on all ports at once, not a cached command
+SWITCH_FANOUT = "get_host_port"
+
+
+def _converter_cases():
+    try:
+        import zcts
+    except ImportError:
+        return {}
+    return {
+        "get_sw_version": lambda port: zcts.get_sw_version(port),
+        "get_op_mode": lambda port: zcts.get_op_mode(port),
+        "get_eth_speed": lambda port: zcts.get_eth_speed(port, 1),
+        "set_eth_speed": lambda port: zcts.set_eth_speed(port, 1, 1000),
+    }
+
+
+CONVERTER_PIPELINE = b"<GET_OP_MODE{}>"
+CONVERTER_FANOUT = "get_op_mode"
+
+
+def percentile(values, q: float):
+    """Nearest-rank percentile of a list of numbers, q from 0 to 100."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def open_fds():
+    """Number of file descriptors of this process, None where unknown."""
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+def _result(latencies, wall, cpu, count, fds_before):
+    fds_after = open_fds()
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "cps": round(count / wall, 2) if wall else None,
+        "cpu_s_per_cmd": round(cpu / count, 6),
+        "fds": None if fds_before is None else fds_after - fds_before,
+    }
+
+
+def run_sequential(func, port: str, iterations: int):
+    """Call one SDK function ``iterations`` times, one after the other."""
+    fds = open_fds()
+    latencies = []
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(iterations):
+        RESULTS.clear()
+        start = time.perf_counter()
+        func(port)
+        latencies.append(time.perf_counter() - start)
+    wall = time.perf_counter() - wall_start
+    return _result(latencies, wall, time.process_time() - cpu_start, iterations, fds)
+
+
+def run_pipelined(request: bytes, port: str, iterations: int, depth: int = 8):
+    """
+    Keep ``depth`` requests in flight on one open Session.  The latency of a
+    command is the time of its batch divided by the batch size.
+    """
+    fds = open_fds()
+    latencies = []
+    expect = f"[{frame_name(request)}{{"
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    with Session(port, window=depth) as session:
+        done = 0
+        while done < iterations:
+            batch = min(depth, iterations - done)
+            start = time.perf_counter()
+            session.pipeline([(request, expect)] * batch)
+            latencies.extend([(time.perf_counter() - start) / batch] * batch)
+            done += batch
+    wall = time.perf_counter() - wall_start
+    return _result(latencies, wall, time.process_time() - cpu_start, iterations, fds)
+
+
+def run_fanout(func, ports, iterations: int):
+    """Run the sequential loop on all ``ports`` concurrently, one thread each."""
+    fds = open_fds()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    def worker(port):
+        samples = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            func(port)
+            samples.append(time.perf_counter() - start)
+        return samples
+
+    with ThreadPoolExecutor(max_workers=len(ports)) as pool:
+        latencies = [t for samples in pool.map(worker, ports) for t in samples]
+    wall = time.perf_counter() - wall_start
+    count = iterations * len(ports)
+    return _result(latencies, wall, time.process_time() - cpu_start, count, fds)
+
+
+def run_suite(switches, converters, iterations: int, only: str = None):
+    """
+    Run all cases against the given switch and converter ports.
+    Returns ``{case name: metrics}``.
+    """
+    results = {}
+
+    def wanted(name):
+        return only is None or only in name
+
+    groups = [("zuss", switches, SWITCH_CASES, SWITCH_PIPELINE, SWITCH_FANOUT)]
+    if converters:
+        groups.append(("zcts", converters, _converter_cases(), CONVERTER_PIPELINE,
+                       CONVERTER_FANOUT))
+    for sdk, ports, cases, pipeline, fanout in groups:
+        if not ports or not cases:
+            continue
+        for name, func in cases.items():
+            if wanted(f"{sdk}.{name}"):
+                results[f"{sdk}.{name}"] = run_sequential(func, ports[0], iterations)
+        if wanted(f"{sdk}.pipelined"):
+            results[f"{sdk}.pipelined"] = run_pipelined(pipeline, ports[0], iterations)
+        if len(ports) > 1 and wanted(f"{sdk}.fanout"):
+            results[f"{sdk}.fanout"] = run_fanout(cases[fanout], ports, iterations)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.2):
+    """
+    Compare two result dicts.  Returns a list of
+    ``(case, metric, baseline value, value, relative change, regressed)``
+    where a positive change always means "got worse".
+    """
+    rows = []
+    for case, metrics in results.items():
+        reference = baseline.get(case)
+        if reference is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = reference.get(metric), metrics.get(metric)
+            if old is None or new is None:
+                continue
+            if metric == "fds":
+                change = float(new - old)
+            elif old == 0:
+                change = 0.0 if new == 0 else float("inf")
+            else:
+                change = (new - old) / old
+            if higher_is_better:
+                change = -change
+            rows.append((case, metric, old, new, change, change > tolerance))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="zuss-benchmark", description="Benchmark of the ZD UART SDKs"
+    )
+    parser.add_argument("--port", action="append", help="Real USB switch port")
+    parser.add_argument("--converter-port", action="append", help="Real converter port")
+    parser.add_argument("--devices", type=int, default=4, help="Simulated devices per type")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated latency in s")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Simulated jitter in s")
+    parser.add_argument("--iterations", type=int, default=20, help="Commands per case")
+    parser.add_argument("--only", type=str, help="Run only cases containing this text")
+    parser.add_argument("--output", type=str, help="Write results to this JSON file")
+    parser.add_argument("--baseline", type=str, help="Compare with this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed change")
+    args = parser.parse_args(argv)
+
+    simulator = None
+    switches, converters = args.port or [], args.converter_port or []
+    if not switches and not converters:
+        from zuss.simulator import Simulator
+
+        simulator = Simulator(args.latency, args.jitter, seed=0).start()
+        switches = [simulator.add_switch().port for _ in range(args.devices)]
+        converters = [simulator.add_converter().port for _ in range(args.devices)]
+    try:
+        results = run_suite(switches, converters, args.iterations, args.only)
+    finally:
+        if simulator is not None:
+            simulator.stop()
+
+    report = {
+        "meta": {
+            "zuss": zuss.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "target": "simulator" if simulator is not None else "hardware",
+            "latency": args.latency,
+            "iterations": args.iterations,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    for case, metrics in results.items():
+        values = "  ".join(f"{k}={v}" for k, v in metrics.items())
+        print(f"{case:28} {values}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressed = False
+        for case, metric, old, new, change, worse in compare(
+            results, baseline, args.tolerance
+        ):
+            mark = "REGRESSION" if worse else ""
+            delta = f"{change:+.0f}" if metric == "fds" else f"{change:+.1%}"
+            print(f"{case:28} {metric:14} {old} -> {new} ({delta}) {mark}")
+            regressed = regressed or worse
+        return 1 if regressed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
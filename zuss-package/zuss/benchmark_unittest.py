@@ -0,0 +1,42 @@
+# -----------------------------------------------------------------------------
+# - File              benchmark_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    benchmark_unittest
+# - Brief             benchmark_unittest for the SDK benchmark suite
+# -----------------------------------------------------------------------------
+import unittest
+
+from zuss.benchmark import compare, percentile, run_pipelined
+from zuss.simulator import Simulator
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(50, percentile(values, 50))
+        self.assertEqual(99, percentile(values, 99))
+        self.assertEqual(7, percentile([7], 99))
+        self.assertIsNone(percentile([], 50))
+
+    def test_compare(self):
+        baseline = {"zuss.get_host_port": {"p50_ms": 10.0, "cps": 100.0, "fds": 0}}
+        results = {"zuss.get_host_port": {"p50_ms": 13.0, "cps": 110.0, "fds": 1}}
+        rows = {row[1]: row for row in compare(results, baseline, tolerance=0.2)}
+        self.assertTrue(rows["p50_ms"][5])
+        self.assertAlmostEqual(-0.1, rows["cps"][4])
+        self.assertFalse(rows["cps"][5])
+        self.assertTrue(rows["fds"][5])
+
+    def test_pipelined(self):
+        with Simulator() as sim:
+            port = sim.add_switch().port
+            result = run_pipelined(b"<GET_HOST_PORT{}>", port, 32)
+        self.assertGreater(result["cps"], 0)
+        self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertEqual(0, result["fds"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+# -----------------------------------------------------------------------------
+# - File              cache.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Short lived cache of read-only device answers
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Answers which rarely change, the firmware version and the configuration
+display, are kept for ``TTL`` seconds per device, so the version logged at the
+start of every test costs nothing after the first::
+
+    zuss.get_version("/dev/ttyUSB0")    # asks the device
+    zuss.get_version("/dev/ttyUSB0")    # from RESULTS
+
+Entries are keyed by device (the USB serial number if there is one, see
+zuss.identity), command and values; at most ``SIZE`` are kept, the least
+recently used goes first.  A command of this process changing the device
+drops its entries: every setting the configuration display, REBOOT_SYS,
+CLEAR_CONFIG and SAVE_CONFIG all of them.  Commands run by zuss.fleet workers
+count as this process's, they are applied when their answers arrive; changes
+made by other processes show after ``TTL`` seconds at the latest.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from zuss import session
+from zuss.session import READS, Session, frame_name
+
+# entries kept, seconds an entry is used
+SIZE = 256
+TTL = 30.0
+
+# commands after which nothing cached of the device holds
+RESETS = ("REBOOT_SYS", "CLEAR_CONFIG", "SAVE_CONFIG")
+
+# device -> (expiry, firmware version), see zuss.commands.Registry.firmware;
+# kept until the device reboots, at most FIRMWARE_TTL seconds: without a USB
+# serial number the device is its tty, where another one may turn up
+FIRMWARE_TTL = 300.0
+firmware = {}
+
+
+def device_key(port):
+    """
+    The name a port or session is cached under: ``usb-serial://<serial>`` for
+    a USB serial adapter, the port name otherwise.  None for a transport
+    object, it has no identity and its answers are not kept.
+    """
+    if isinstance(port, Session):
+        port = port.device or port.port
+    if not isinstance(port, str):
+        return None
+    from zuss.identity import identity
+
+    return identity(port)
+
+
+class ResultCache:
+    """
+    Results by (device, command name, values), bounded and expiring, thread
+    safe.  Commands change devices through session.observers.
+    """
+
+    def __init__(self, size: int = SIZE, ttl: float = TTL):
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expiry, result)
+        self._lock = threading.Lock()
+        self._observing = False
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        self.watch()
+
+    def watch(self):
+        """Follow the commands of all sessions, from the first entry on."""
+        with self._lock:
+            if not self._observing:
+                self._observing = True
+                session.observers.append(self._observe)
+
+    def forget(self, device: str, prefix: str = ""):
+        """Drop the entries of ``device`` whose command starts with ``prefix``."""
+        with self._lock:
+            for key in [key for key in self._entries
+                        if key[0] == device and key[1].startswith(prefix)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _observe(self, device: str, request: bytes, line: str):
+        self.changed(device, request)
+
+    def changed(self, device: str, request: bytes):
+        """Drop the entries ``request``, answered by ``device``, made stale."""
+        name = frame_name(request)
+        if name.startswith(READS):
+            return
+        key = device_key(device)
+        if name in RESETS:
+            self.forget(key)
+            if name == "REBOOT_SYS":
+                # a new firmware starts with a reboot
+                firmware.pop(key, None)
+        else:
+            self.forget(key, "DISP_")
+
+
+RESULTS = ResultCache()
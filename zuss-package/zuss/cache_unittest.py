@@ -0,0 +1,104 @@
+# -----------------------------------------------------------------------------
+# - File              cache_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    cache_unittest
+# - Brief             cache_unittest for the cache of read-only answers
+# -----------------------------------------------------------------------------
+import time
+import unittest
+
+from zuss import *
+from zuss import metrics
+from zuss.cache import RESULTS, ResultCache
+from zuss.transport import FakeTransport
+
+
+class TestResultCache(unittest.TestCase):
+    def test_least_recently_used_goes(self):
+        cache = ResultCache(size=2)
+        cache.put(("a", "GET_SW_VERSION", ()), 1)
+        cache.put(("b", "GET_SW_VERSION", ()), 2)
+        cache.get(("a", "GET_SW_VERSION", ()))
+        cache.put(("c", "GET_SW_VERSION", ()), 3)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get(("b", "GET_SW_VERSION", ())))
+        self.assertEqual(1, cache.get(("a", "GET_SW_VERSION", ())))
+
+    def test_expires(self):
+        cache = ResultCache(ttl=0.05)
+        cache.put(("a", "GET_SW_VERSION", ()), 1)
+        self.assertEqual(1, cache.get(("a", "GET_SW_VERSION", ())))
+        time.sleep(0.06)
+        self.assertIsNone(cache.get(("a", "GET_SW_VERSION", ())))
+        self.assertEqual(0, len(cache))
+
+    def test_forget(self):
+        cache = ResultCache()
+        cache.put(("a", "GET_SW_VERSION", ()), 1)
+        cache.put(("a", "DISP_CONFIG", ()), ())
+        cache.put(("b", "DISP_CONFIG", ()), ())
+        cache.forget("a", "DISP_")
+        self.assertEqual(1, cache.get(("a", "GET_SW_VERSION", ())))
+        self.assertIsNone(cache.get(("a", "DISP_CONFIG", ())))
+        self.assertEqual((), cache.get(("b", "DISP_CONFIG", ())))
+
+
+class TestCachedCommands(unittest.TestCase):
+    def setUp(self):
+        self.records = []
+        metrics.add_hook(self.records.append)
+        self.port = f"fake://switch/cache-{self.id()}"
+
+    def tearDown(self):
+        metrics.remove_hook(self.records.append)
+
+    def names(self):
+        names = [record.name for record in self.records]
+        del self.records[:]
+        return names
+
+    def test_version_asked_once(self):
+        self.assertEqual("v2.1.2", get_version(self.port))
+        self.assertEqual("v2.1.2", get_version(self.port))
+        self.assertEqual(["GET_SW_VERSION"], self.names())
+
+    def test_dropped_by_reboot_save_clear(self):
+        for reset, name in ((reboot_sys, "REBOOT_SYS"), (save_config, "SAVE_CONFIG"),
+                            (clr_config, "CLEAR_CONFIG")):
+            get_version(self.port)
+            self.names()
+            self.assertTrue(reset(self.port))
+            get_version(self.port)
+            get_version(self.port)
+            self.assertEqual([name, "GET_SW_VERSION"], self.names())
+
+    def test_config_display(self):
+        first = list(stream_config(self.port))
+        self.assertEqual(first, list(stream_config(self.port)))
+        self.assertEqual(["DISP_CONFIG"], self.names())
+        # a setting changes the display, not the version
+        get_version(self.port)
+        self.assertTrue(set_host_port(self.port, 3))
+        get_version(self.port)
+        display = list(stream_config(self.port))
+        self.assertEqual(["GET_SW_VERSION", "SET_HOST_PORT", "DISP_CONFIG"], self.names())
+        self.assertEqual("host_port=3", display[0].text)
+
+    def test_stopped_display_not_kept(self):
+        for display in stream_config(self.port):
+            break
+        self.assertEqual(4, len(list(stream_config(self.port))))
+        self.assertEqual(["DISP_CONFIG", "DISP_CONFIG"], self.names())
+
+    def test_transport_not_kept(self):
+        transport = FakeTransport.from_url(self.port)
+        get_version(transport)
+        get_version(transport)
+        self.assertEqual(["GET_SW_VERSION", "GET_SW_VERSION"], self.names())
+        self.assertIsNone(RESULTS.get((self.port, "GET_SW_VERSION", ())))
+
+
+if __name__ == "__main__":
+    unittest.main()
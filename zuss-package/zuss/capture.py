@@ -0,0 +1,223 @@
+# -----------------------------------------------------------------------------
+# - File              capture.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Record and replay of serial traffic
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Record every byte exchanged with the devices and feed it back later.
+
+Recording wraps each port the SDK opens while a capture is active::
+
+    with capture.record("rack7.jsonl"):
+        zuss.set_host_port("/dev/ttyUSB0", 3)
+
+The capture is a JSONL file: a header line, then one event per line with a
+monotonic timestamp relative to the start of the capture::
+
+    {"t": 0.000412, "port": "/dev/ttyUSB0", "op": "w", "data": "<SET_HOST_PORT{3}>"}
+
+:class:`ReplayTransport` plays a capture back in place of the port.  In
+deterministic mode (``speed=None``) the device answers as soon as the SDK has
+written the request; with a ``speed`` factor the recorded delays are kept,
+scaled (2.0 = twice as fast)::
+
+    replay = capture.ReplayTransport("rack7.jsonl", port="/dev/ttyUSB0")
+    zuss.get_host_port(replay)
+
+or, as a port URL, ``replay://rack7.jsonl?port=/dev/ttyUSB0&speed=1``.
+"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from zuss.transport import QueueTransport
+
+_recorder = None
+
+
+class Recorder:
+    """Appends capture events to a JSONL file, thread safe."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = open(path, "w", encoding="utf8", buffering=1)
+        header = {"zuss_capture": 1, "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        self._file.write(json.dumps(header) + "\n")
+
+    def event(self, port: str, op: str, data: bytes = b""):
+        line = {
+            "t": round(time.monotonic() - self._start, 6),
+            "port": port,
+            "op": op,
+            "data": data.decode("latin-1"),
+        }
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(json.dumps(line) + "\n")
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def start_recording(path: str) -> Recorder:
+    """
+    Record all ports opened from now on into ``path``.  Cached answers
+    (zuss.cache) are dropped, so the capture holds all a replay asks for.
+    """
+    global _recorder
+    from zuss.cache import RESULTS, firmware
+
+    RESULTS.clear()
+    firmware.clear()
+    stop_recording()
+    _recorder = Recorder(path)
+    return _recorder
+
+
+def stop_recording():
+    global _recorder
+    if _recorder is not None:
+        _recorder.close()
+        _recorder = None
+
+
+@contextmanager
+def record(path: str):
+    recorder = start_recording(path)
+    try:
+        yield recorder
+    finally:
+        stop_recording()
+
+
+def wrap(serial_con, port: str):
+    """Wrap a freshly opened pyserial object if a capture is active."""
+    if _recorder is None:
+        return serial_con
+    return RecordingTransport(serial_con, _recorder, port)
+
+
+class RecordingTransport:
+    """pyserial-like proxy which logs all writes and reads to a Recorder."""
+
+    def __init__(self, serial_con, recorder: Recorder, port: str):
+        self._serial = serial_con
+        self._recorder = recorder
+        self.port = port
+        recorder.event(port, "open")
+
+    def __getattr__(self, name):
+        return getattr(self._serial, name)
+
+    @property
+    def in_waiting(self):
+        return self._serial.in_waiting
+
+    def write(self, data: bytes):
+        self._recorder.event(self.port, "w", bytes(data))
+        return self._serial.write(data)
+
+    def read(self, size: int = 1):
+        data = self._serial.read(size)
+        if data:
+            self._recorder.event(self.port, "r", data)
+        return data
+
+    def readline(self):
+        data = self._serial.readline()
+        if data:
+            self._recorder.event(self.port, "r", data)
+        return data
+
+    def close(self):
+        self._recorder.event(self.port, "close")
+        self._serial.close()
+
+
+def load(path: str, port: str = None):
+    """Read the events of a capture, optionally only those of one port."""
+    events = []
+    with open(path, encoding="utf8") as f:
+        header = json.loads(f.readline())
+        if "zuss_capture" not in header:
+            raise ValueError(f"{path} is not a zuss capture")
+        for line in f:
+            event = json.loads(line)
+            if port is None or event["port"] == port:
+                events.append(event)
+    return events
+
+
+class ReplayTransport(QueueTransport):
+    """
+    pyserial-like object answering with the reads of a capture.
+
+    Reads recorded after a write are released once the SDK performs its next
+    write.  Closing the transport is ignored, so one ReplayTransport can be
+    handed to any number of SDK calls.
+
+    :param path: capture file written by :func:`record`
+    :param port: replay only the traffic of this port
+    :param speed: None for deterministic replay, otherwise the time scale
+    :param strict: raise if the SDK writes something else than recorded
+    """
+
+    def __init__(self, path: str, port: str = None, speed: float = None,
+                 strict: bool = False, timeout: float = 2):
+        super().__init__(port or path, timeout)
+        self.speed = speed
+        self.strict = strict
+        self._events = [e for e in load(path, port) if e["op"] in ("w", "r")]
+        self._position = 0
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 2):
+        """``replay://path/to/capture.jsonl?port=/dev/ttyUSB0&speed=1&strict=1``"""
+        from zuss.transport import _query
+
+        parts, query = _query(url)
+        speed = query.get("speed")
+        return cls(
+            parts.netloc + parts.path,
+            port=query.get("port"),
+            speed=float(speed) if speed else None,
+            strict=query.get("strict", "0") not in ("0", "false"),
+            timeout=timeout,
+        )
+
+    @property
+    def finished(self):
+        return self._position >= len(self._events) and not self._pending
+
+    def write(self, data: bytes):
+        events = self._events
+        if self._position < len(events) and events[self._position]["op"] == "w":
+            expected = events[self._position]["data"].encode("latin-1")
+            if self.strict and expected != bytes(data):
+                raise ValueError(f"replay expected {expected!r}, got {bytes(data)!r}")
+            written_at = events[self._position]["t"]
+            self._position += 1
+            now = time.monotonic()
+            while self._position < len(events) and events[self._position]["op"] == "r":
+                event = events[self._position]
+                delay = 0.0
+                if self.speed:
+                    delay = (event["t"] - written_at) / self.speed
+                self._push(event["data"].encode("latin-1"), now + delay)
+                self._position += 1
+        elif self.strict:
+            raise ValueError(f"replay has no write left for {bytes(data)!r}")
+        return len(data)
+
+    def close(self):
+        pass
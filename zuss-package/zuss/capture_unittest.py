@@ -0,0 +1,67 @@
+# -----------------------------------------------------------------------------
+# - File              capture_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    capture_unittest
+# - Brief             capture_unittest for record and replay of serial traffic
+# -----------------------------------------------------------------------------
+import os
+import tempfile
+import time
+import unittest
+
+from zuss import *
+from zuss import capture
+from zuss.serial_manager import SerialPort
+from zuss.simulator import Simulator
+
+
+class TestCapture(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        with Simulator(latency=0.05) as sim:
+            self.port = sim.add_switch().port
+            with capture.record(self.path):
+                self.version = get_version(self.port)
+                with SerialPort(port=self.port) as serial_con:
+                    serial_con.write(b"<GET_HOST_PORT{}>")
+                    serial_con.readline()
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_recorded_events(self):
+        events = capture.load(self.path)
+        self.assertEqual(
+            ["open", "w", "r", "close", "open", "w", "r", "close"],
+            [e["op"] for e in events],
+        )
+        self.assertEqual("[GET_HOST_PORT{1}]\r\n", events[6]["data"])
+        self.assertGreaterEqual(events[2]["t"] - events[1]["t"], 0.05)
+
+    def test_deterministic_replay(self):
+        replay = capture.ReplayTransport(self.path, port=self.port, strict=True)
+        start = time.monotonic()
+        self.assertEqual(self.version, get_version(replay))
+        self.assertLess(time.monotonic() - start, 0.05)
+        with SerialPort(port=replay) as serial_con:
+            serial_con.write(b"<GET_HOST_PORT{}>")
+            self.assertEqual("[GET_HOST_PORT{1}]\r\n", serial_con.readline())
+        self.assertTrue(replay.finished)
+
+    def test_time_scaled_replay(self):
+        replay = capture.ReplayTransport(self.path, speed=1.0)
+        start = time.monotonic()
+        get_version(replay)
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_strict_mismatch(self):
+        replay = capture.ReplayTransport(self.path, strict=True)
+        with self.assertRaises(ValueError):
+            replay.write(b"<REBOOT_SYS{}>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+# -----------------------------------------------------------------------------
+# - File              client.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Client of the zussd device daemon
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Calls the SDK functions inside a running ``zussd`` (zuss.daemon), which keeps
+the ports open, with the signatures of the SDK::
+
+    from zuss.client import Client
+
+    client = Client()
+    client.zuss.set_host_port("/dev/ttyUSB0", 2)
+    client.zcts.get_eth_speed("/dev/ttyUSB1", 1)
+
+A call costs one local round-trip plus the time on the UART.  When the
+daemon restarted in between, a call is sent once more on a new connection if
+all the commands it runs are idempotent in zuss.commands; otherwise the
+ConnectionError is raised, the command may or may not have run.  A call
+which times out closes the connection too, the next call opens a new one.
+"""
+
+import json
+import os
+import socket
+import threading
+
+DEFAULT_SOCKET = os.environ.get("ZUSSD_SOCKET") or os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or "/tmp",
+    f"zussd-{os.getuid()}.sock" if hasattr(os, "getuid") else "zussd.sock",
+)
+
+
+# methods of the daemon itself, they do not change a device
+_OWN_METHODS = ("ports", "metrics", "detect_comports")
+
+
+def idempotent(method: str, params=()) -> bool:
+    """
+    Whether ``method`` may be sent twice: all the commands it runs are
+    idempotent in the tables of zuss.commands.  False for what is not known.
+    """
+    if method in _OWN_METHODS:
+        return True
+    from zuss.commands import CONVERTER, FUNCTIONS, SWITCH
+    from zuss.session import frame_name
+
+    if method == "request":
+        try:
+            name = frame_name(params[1].encode("ascii"))
+        except (IndexError, AttributeError, ValueError):
+            return False
+        command = SWITCH.get(name) or CONVERTER.get(name)
+        return command is not None and command.idempotent
+    commands = FUNCTIONS.get(method)
+    return commands is not None and all(command.idempotent for command in commands)
+
+
+class RemoteError(Exception):
+    """Error reported by the daemon."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"{message} ({code})")
+        self.code = code
+
+
+class _Namespace:
+    """``client.zuss``: the functions of one SDK, called in the daemon."""
+
+    def __init__(self, client, name: str):
+        self._client = client
+        self._name = name
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = f"{self._name}.{name}"
+        client = self._client
+
+        def call(*params):
+            return client.call(method, *params)
+
+        call.__name__ = name
+        call.__qualname__ = method
+        return call
+
+
+class Client:
+    """
+    Connection to a zussd, thread safe; reconnects once if the daemon restarted
+    and the call is :func:`idempotent`.
+
+    :param path: socket of the daemon
+    :param timeout: seconds to wait for an answer, None waits forever
+    """
+
+    def __init__(self, path: str = DEFAULT_SOCKET, timeout: float = 60):
+        self.path = path
+        self.timeout = timeout
+        self.zuss = _Namespace(self, "zuss")
+        self.zcts = _Namespace(self, "zcts")
+        self._socket = None
+        self._file = None
+        self._id = 0
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self._socket = sock
+        self._file = sock.makefile("rb")
+
+    def _disconnect(self):
+        if self._socket is not None:
+            try:
+                self._file.close()
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = self._file = None
+
+    def close(self):
+        with self._lock:
+            self._disconnect()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _exchange(self, data: bytes, request_id: int):
+        if self._socket is None:
+            self._connect()
+        try:
+            self._socket.sendall(data)
+            line = self._file.readline()
+        except OSError:
+            # a timed out file object cannot be read again, and a late answer
+            # must not be taken for the next request
+            self._disconnect()
+            raise
+        if not line:
+            self._disconnect()
+            raise ConnectionError("zussd closed the connection")
+        response = json.loads(line)
+        if response.get("id") != request_id:
+            self._disconnect()
+            raise ConnectionError(f"zussd answered request {response.get('id')} "
+                                  f"instead of {request_id}")
+        return response
+
+    def call(self, method: str, *params):
+        """Run ``method`` in the daemon and return its result."""
+        with self._lock:
+            self._id += 1
+            request_id = self._id
+            data = json.dumps(
+                {"jsonrpc": "2.0", "id": request_id, "method": method, "params": list(params)}
+            ).encode("utf8") + b"\n"
+            try:
+                response = self._exchange(data, request_id)
+            except ConnectionError:
+                if not idempotent(method, params):
+                    # it may have run before the daemon went away
+                    raise
+                # a restarted daemon: one new attempt on a new connection
+                response = self._exchange(data, request_id)
+        if "error" in response:
+            error = response["error"]
+            raise RemoteError(error.get("code"), error.get("message"))
+        return response["result"]
+
+    def ports(self):
+        return self.call("ports")
+
+    def request(self, port: str, request: str, expect: str, timeout: float = None):
+        """One raw command, ``request("/dev/ttyUSB0", "<GET_HOST_PORT{}>", "[GET_HOST_PORT{")``"""
+        params = [port, request, expect] + ([] if timeout is None else [timeout])
+        return self.call("request", *params)
+
+    def metrics(self, port: str = None):
+        return self.call("metrics", *([] if port is None else [port]))
@@ -2,18 +2,35 @@
 # - ZUSS -  ZD USB SWITCH SDK Python Command Line
 # - File              zuss.py
 # - Owner             Zhengkun Li
-# - Version           1.1
+# - Version           1.2
 # - Date              09.06.2021
 # - Classification    command line
 # - Brief             command line for ZD USB Switch
-# - History        
+# - History
 #       2021.06.09    Initial version.                   Zhengkun Li
 #       2021.09.27    Add set_relay/set_power commands.  Yu-Ling Xie
-# ----------------------------------------------------------------------------- 
-from zuss import *
+#       2026.10.19    Several operations per call over one open port,
+#                     --script, per-operation status report.
+#       2026.10.19    Operations are the commands of zuss.commands.
+# -----------------------------------------------------------------------------
+"""
+Operations run in the order given, pipelined over one open port::
+
+    python -m zuss.cmd -P /dev/ttyUSB0 --sethost 2 --setdev 3 --setpwr_mask 5 -s
+    python -m zuss.cmd -P /dev/ttyUSB0 --script setup.txt
+
+A script holds the same options, any number per line, ``#`` starts a comment.
+The exit code is 0 if every operation succeeded.
+"""
 import argparse
-import colorama
-colorama.init()
+import logging
+import shlex
+import sys
+
+from zuss import log, metrics
+from zuss.commands import REBOOT, SWITCH, VALUE, Unsupported
+from zuss.session import Session
+
 class bcolors:
     HEADER = '\033[95m'
     OKBLUE = '\033[94m'
@@ -24,131 +41,208 @@ class bcolors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
-parser = argparse.ArgumentParser(prog=f'{bcolors.OKCYAN}zuss{bcolors.ENDC}',description=f'{bcolors.OKGREEN}Python sdk for USB Switch{bcolors.ENDC}',epilog=f"{bcolors.OKGREEN}Caution: Please implement only{bcolors.ENDC} {bcolors.WARNING}ONE{bcolors.ENDC} {bcolors.OKGREEN}function each time.{bcolors.ENDC}")
+
+# time to wait for the answer to a reboot (seconds)
+REBOOT_TIMEOUT = SWITCH.timeouts[REBOOT]
+
+# option: command of zuss.commands
+OPERATIONS = {
+    'V': SWITCH['GET_SW_VERSION'],
+    'r': SWITCH['REBOOT_SYS'],
+    's': SWITCH['SAVE_CONFIG'],
+    'R': SWITCH['CLEAR_CONFIG'],
+    'd': SWITCH['DISP_CONFIG'],
+    'sethost': SWITCH['SET_HOST_PORT'],
+    'gethost': SWITCH['GET_HOST_PORT'],
+    'setdev': SWITCH['SET_DEVICE_PORT'],
+    'getdev': SWITCH['GET_DEVICE_PORT'],
+    'setrelay_mask': SWITCH['SET_RELAY_MASK'],
+    'getrelay_mask': SWITCH['GET_RELAY_MASK'],
+    'setpwr_mask': SWITCH['SET_POWER_MASK'],
+    'getpwr_mask': SWITCH['GET_POWER_MASK'],
+    'setrelay': SWITCH['SET_RELAY'],
+    'getrelay': SWITCH['GET_RELAY'],
+    'setpwr': SWITCH['SET_POWER'],
+    'getpwr': SWITCH['GET_POWER'],
+}
+
+class Operation:
+    """One operation of the command line and its outcome, spec None: list the ports."""
+    def __init__(self, option: str, values=None, spec=None):
+        self.option = option
+        self.values = values
+        self.outcome = None
+        self.result = None
+        self.elapsed = None
+        self.request = None
+        self.spec = spec
+        self.barrier = False
+        if spec is None:
+            return
+        given = [] if values is None else values if isinstance(values, list) else [values]
+        args = [arg.type(v) if isinstance(v, str) else v for arg, v in zip(spec.args, given)]
+        self.request, self.expect = spec.encode(*args)
+        self.answer = spec.answer
+        # the device restarts, nothing may be in flight behind it
+        self.barrier = spec.timeout == REBOOT
+
+    @property
+    def label(self):
+        name = f"-{self.option}" if len(self.option) == 1 else f"--{self.option}"
+        if self.values is None:
+            return name
+        values = self.values if isinstance(self.values, list) else [self.values]
+        return f"{name} {' '.join(str(v) for v in values)}"
+
+    def finish(self, line, record):
+        self.outcome = record.outcome
+        self.elapsed = record.total_s
+        if line is not None and self.answer == VALUE:
+            self.result = line.strip()[len(self.expect):].rstrip('}]')
+
+class OperationAction(argparse.Action):
+    """Appends the option to namespace.ops, so the command line order is kept."""
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            op = Operation(self.dest, values if self.nargs != 0 else None, self.const)
+        except ValueError as e:
+            parser.error(f"{bcolors.FAIL}{option_string}: {e}{bcolors.ENDC}")
+        namespace.ops = (getattr(namespace, 'ops', None) or []) + [op]
+
+class ScriptAction(argparse.Action):
+    """Inserts the operations of a script file at its place."""
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            with open(values) as f:
+                text = f.read()
+        except OSError as e:
+            parser.error(f"{bcolors.FAIL}cannot read script {values}: {e}{bcolors.ENDC}")
+        parser.parse_args(shlex.split(text, comments=True), namespace)
+
+class ColorArgumentParser(argparse.ArgumentParser):
+    """Prepares the console for the coloured help only when it is printed."""
+    def _print_message(self, message, file=None):
+        log.enable_color()
+        super()._print_message(message, file)
+
+def add_flag(parser, *names, spec=None, **kwargs):
+    """Operation without value, ``spec`` a zuss.commands.Command."""
+    parser.add_argument(*names, action=OperationAction, nargs=0, const=spec,
+                        default=argparse.SUPPRESS, **kwargs)
+
+def add_value(parser, *names, spec=None, **kwargs):
+    """Operation with value(s), ``spec`` a zuss.commands.Command."""
+    parser.add_argument(*names, action=OperationAction, const=spec,
+                        default=argparse.SUPPRESS, **kwargs)
+
+parser = ColorArgumentParser(prog=f'{bcolors.OKCYAN}zuss{bcolors.ENDC}',description=f'{bcolors.OKGREEN}Python sdk for USB Switch{bcolors.ENDC}',epilog=f"{bcolors.OKGREEN}Operations run in the given order over{bcolors.ENDC} {bcolors.WARNING}ONE{bcolors.ENDC} {bcolors.OKGREEN}open port.{bcolors.ENDC}")
 parser.add_argument('-P','--port', type=str, help=f'Port name of USB switch.This arg is {bcolors.WARNING}REQUIRED{bcolors.ENDC} when manipulating the USB Switch')
-parser.add_argument('-v','--version', action='version', version='%(prog)s 1.0')
-parser.add_argument('-l',action="store_true", help='Print the list of serial COM ports in use.')
-parser.add_argument('-V',action="store_true", help='Current USB switch version information.')
-parser.add_argument('-r',action="store_true",help='Reboot the USB switch, about 10s.')
-parser.add_argument('-s',action="store_true",help='Save configuration into flash')
-parser.add_argument('-R',action="store_true",help='Reset configuration')
-parser.add_argument('-d',action="store_true",help='Display configuration')
-parser.add_argument('--sethost',type=int,help='Set enable host port,input from 1 to 4')
-parser.add_argument('--gethost',action="store_true",help='Show currently enabled host port')
-parser.add_argument('--setdev',type=int,help='Set enable device port,input from 1 to 4')
-parser.add_argument('--getdev',action="store_true",help='Show currently enabled device port')
-parser.add_argument('--setrelay_mask',type=str,help='Set Relay Mask, 4bit Mask value, Bit0 to Bit3 stand for Relay1 to Relay4,input from 0 to 15')
-parser.add_argument('--getrelay_mask',action="store_true",help='Show current Relay Mask,Bit0 to Bit3 stand for Relay1 to Relay4')
-parser.add_argument('--setpwr_mask',type=str,help='Set Power Supply Mask,Set the Mask of the Device Ports enable to power supply, Bit0 to Bit3 stand for Port1 to Port4.input from 0 to 15')
-parser.add_argument('--getpwr_mask',action="store_true",help='Show currently Power Supply Mask')
-parser.add_argument('--setrelay',type=int,nargs=2,help='Set Relay: relay_port, control')
-parser.add_argument('--getrelay',type=int,help='Show current Relay: relay_port')
-parser.add_argument('--setpwr',type=int,nargs=2,help='Set Power Supply: power_device, control')
-parser.add_argument('--getpwr',type=int,help='Show currently Power Supply: power_device')
-if __name__ == '__main__':
-    args  = parser.parse_args()
-    if args.l:
-        detect_comports()
-    elif args.V:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-V requires -P{bcolors.ENDC}")
-        else:
-            get_version(args.port)
-    elif args.r:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-r requires -P{bcolors.ENDC}")
-        else:
-            reboot_sys(args.port)
-    elif args.s:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-s requires -P{bcolors.ENDC}")
-        else:
-            save_config(args.port)
-    elif args.R:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-R requires -P{bcolors.ENDC}")
-        else:
-            clr_config(args.port)
-    elif args.d:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-d requires -P{bcolors.ENDC}")
-        else:
-            disp_config(args.port)
-    elif args.sethost:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-sethost requires -P{bcolors.ENDC}")
-        else:
-            set_host_port(args.port, args.sethost)
-    elif args.gethost:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-gethost requires -P{bcolors.ENDC}")
-        else:
-        
-            get_host_port(args.port)
-    elif args.setdev:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setdev requires -P{bcolors.ENDC}")
-        else:        
-            set_dev_port(args.port, args.setdev)
-    elif args.getdev:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getdev requires -P{bcolors.ENDC}")
-        else:        
-            get_dev_port(args.port)
-    elif args.setrelay_mask:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setrelay_mask requires -P{bcolors.ENDC}")
-        else:
-            # hex
-            if '0x' in args.setrelay_mask:
-                set_relay_mask(args.port,int(args.setrelay_mask,16))
-            # binary
-            elif '0b' in args.setrelay_mask:
-                set_relay_mask(args.port,int(args.setrelay_mask,2))
-            # decimal
-            else:
-                set_relay_mask(args.port,int(args.setrelay_mask,10))
-    elif args.getrelay_mask:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getrelay_mask requires -P{bcolors.ENDC}")
-        else:
-            get_relay_mask(args.port)
-    elif args.setpwr_mask:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setpwr_mask requires -P{bcolors.ENDC}")
-        else:
-            # hex
-            if '0x' in args.setpwr_mask:
-                set_pwr_mask(args.port,int(args.setpwr_mask,16))
-            # binary
-            elif '0b' in args.setpwr_mask:
-                set_pwr_mask(args.port,int(args.setpwr_mask,2))
-            # decimal
-            else:
-                set_pwr_mask(args.port,int(args.setpwr_mask,10))
-    elif args.getpwr_mask:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getpwr_mask requires -P{bcolors.ENDC}")
-        else:
-            get_pwr_mask(args.port)
-    elif args.setrelay:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setrelay requires -P{bcolors.ENDC}")
-        else:        
-            set_relay(args.port,args.setrelay[0],args.setrelay[1])
-    elif args.getrelay:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getrelay requires -P{bcolors.ENDC}")
-        else:
-            get_relay(args.port,args.getrelay)
-    elif args.setpwr:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-setpwr requires -P{bcolors.ENDC}")
-        else:
-            set_pwr(args.port,args.setpwr[0],args.setpwr[1])
-    elif args.getpwr:
-        if args.port is None:
-            parser.error(f"{bcolors.FAIL}-getpwr requires -P{bcolors.ENDC}")
+parser.add_argument('-v','--version', action='version', version='%(prog)s 1.2')
+add_flag(parser,'-l', help='Print the list of serial COM ports in use.')
+add_flag(parser,'-V',spec=OPERATIONS['V'], help='Current USB switch version information.')
+add_flag(parser,'-r',spec=OPERATIONS['r'],help='Reboot the USB switch, about 10s.')
+add_flag(parser,'-s',spec=OPERATIONS['s'],help='Save configuration into flash')
+add_flag(parser,'-R',spec=OPERATIONS['R'],help='Reset configuration')
+add_flag(parser,'-d',spec=OPERATIONS['d'],help='Display configuration')
+add_value(parser,'--sethost',spec=OPERATIONS['sethost'],type=int,help='Set enable host port,input from 1 to 4')
+add_flag(parser,'--gethost',spec=OPERATIONS['gethost'],help='Show currently enabled host port')
+add_value(parser,'--setdev',spec=OPERATIONS['setdev'],type=int,help='Set enable device port,input from 1 to 4')
+add_flag(parser,'--getdev',spec=OPERATIONS['getdev'],help='Show currently enabled device port')
+add_value(parser,'--setrelay_mask',spec=OPERATIONS['setrelay_mask'],type=str,help='Set Relay Mask, 4bit Mask value, Bit0 to Bit3 stand for Relay1 to Relay4,input from 0 to 15')
+add_flag(parser,'--getrelay_mask',spec=OPERATIONS['getrelay_mask'],help='Show current Relay Mask,Bit0 to Bit3 stand for Relay1 to Relay4')
+add_value(parser,'--setpwr_mask',spec=OPERATIONS['setpwr_mask'],type=str,help='Set Power Supply Mask,Set the Mask of the Device Ports enable to power supply, Bit0 to Bit3 stand for Port1 to Port4.input from 0 to 15')
+add_flag(parser,'--getpwr_mask',spec=OPERATIONS['getpwr_mask'],help='Show currently Power Supply Mask')
+add_value(parser,'--setrelay',spec=OPERATIONS['setrelay'],type=int,nargs=2,help='Set Relay: relay_port, control')
+add_value(parser,'--getrelay',spec=OPERATIONS['getrelay'],type=int,help='Show current Relay: relay_port')
+add_value(parser,'--setpwr',spec=OPERATIONS['setpwr'],type=int,nargs=2,help='Set Power Supply: power_device, control')
+add_value(parser,'--getpwr',spec=OPERATIONS['getpwr'],type=int,help='Show currently Power Supply: power_device')
+parser.add_argument('--script',action=ScriptAction,default=argparse.SUPPRESS,help='Run the options in this file, at this place')
+parser.add_argument('--verbose',action="store_true",help='Also show the requests and answer frames')
+
+def _batches(ops):
+    """Split into runs which can be pipelined, -l and a reboot run on their own."""
+    batch = []
+    for op in ops:
+        if op.request is None or op.barrier:
+            if batch:
+                yield batch
+            yield [op]
+            batch = []
         else:
-            get_pwr(args.port,args.getpwr)
+            batch.append(op)
+    if batch:
+        yield batch
 
+def run(port: str, ops, timeout: float = None, reboot_timeout: float = REBOOT_TIMEOUT):
+    """Run the operations in order over one Session, fills in their outcome."""
+    records = []
+    metrics.add_hook(records.append)
+    session = Session(port) if timeout is None else Session(port, timeout)
+    try:
+        for batch in _batches(ops):
+            if batch[0].request is None:
+                from zuss.usbswsdk import detect_comports
+                detect_comports()
+                batch[0].outcome = metrics.OK
+                continue
+            session.open()
+            # like the SDK: what the firmware lacks is not sent to wait for nothing
+            supported = []
+            for op in batch:
+                try:
+                    op.spec.require(session)
+                except Unsupported as e:
+                    session.log.warning("%s", e)
+                    op.outcome = metrics.REJECTED
+                else:
+                    supported.append(op)
+            if not supported:
+                continue
+            del records[:]
+            lines = session.pipeline([(op.request, op.expect) for op in supported],
+                                     reboot_timeout if batch[0].barrier else None)
+            for op, line, record in zip(supported, lines, records):
+                op.finish(line, record)
+            if batch[0].barrier:
+                # the port may disappear during the restart
+                session.close()
+    finally:
+        session.close()
+        metrics.remove_hook(records.append)
+    return ops
+
+def report(ops, file=None, color: bool = False):
+    """Print one status line per operation."""
+    file = file or sys.stdout
+    for op in ops:
+        outcome = f"{op.outcome:8}"
+        if color:
+            mark = bcolors.OKGREEN if op.outcome == metrics.OK else bcolors.FAIL
+            outcome = f"{mark}{outcome}{bcolors.ENDC}"
+        elapsed = '' if op.elapsed is None else f"{op.elapsed * 1000:8.1f} ms"
+        result = '' if op.result is None else f"  {op.result}"
+        print(f"{op.label:24} {outcome}{elapsed}{result}", file=file)
+
+def main(argv=None, parser=parser, **kwargs):
+    """Parse, run and report; ``kwargs`` go to :func:`run`."""
+    args = parser.parse_args(argv)
+    ops = getattr(args, 'ops', [])
+    if not ops:
+        parser.print_usage()
+        return 0
+    missing = [op.label for op in ops if op.request is not None and args.port is None]
+    if missing:
+        parser.error(f"{bcolors.FAIL}{', '.join(missing)} requires -P{bcolors.ENDC}")
+    # the SDK is quiet, the command line shows the device output
+    handler = log.verbose(logging.DEBUG if args.verbose else logging.INFO, sys.stdout)
+    color = sys.stdout.isatty()
+    if color:
+        log.enable_color()
+    try:
+        report(run(args.port, ops, **kwargs), color=color)
+    finally:
+        log.quiet(handler)
+    return 0 if all(op.outcome == metrics.OK for op in ops) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
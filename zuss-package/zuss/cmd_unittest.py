@@ -0,0 +1,102 @@
+# -----------------------------------------------------------------------------
+# - File              cmd_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    cmd_unittest
+# - Brief             cmd_unittest for the zuss command line
+# -----------------------------------------------------------------------------
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from zuss import cmd, metrics
+from zuss.transport import FakeTransport
+
+
+def run(*argv):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        code = cmd.main(list(argv))
+    return code, out.getvalue().splitlines()
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        FakeTransport.devices.clear()
+        self.records = []
+        metrics.add_hook(self.records.append)
+
+    def tearDown(self):
+        metrics.remove_hook(self.records.append)
+
+    def test_operations_in_order(self):
+        code, lines = run("-P", "fake://switch", "--sethost", "2", "--setdev", "3",
+                          "--setpwr_mask", "0x5", "-s", "--gethost")
+        self.assertEqual(0, code)
+        self.assertEqual(["--sethost 2", "--setdev 3", "--setpwr_mask 0x5", "-s", "--gethost"],
+                         [line[:24].strip() for line in lines])
+        self.assertTrue(all(" ok " in line for line in lines))
+        self.assertTrue(lines[-1].endswith("  2"))
+        model = FakeTransport.devices["switch"]
+        self.assertEqual({"host_port": 2, "device_port": 3, "power_mask": 5},
+                         {k: model.saved[k] for k in ("host_port", "device_port", "power_mask")})
+        # one open port, one pipeline
+        self.assertEqual(1, len({record.batch for record in self.records}))
+        self.assertEqual(1, sum(1 for record in self.records if record.open_s))
+
+    def test_reboot_is_a_barrier(self):
+        code, lines = run("-P", "fake://switch", "--sethost", "3", "-r", "--gethost")
+        self.assertEqual(0, code)
+        self.assertEqual(3, len({record.batch for record in self.records}))
+
+    def test_script(self):
+        handle, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(handle, "w") as f:
+            f.write("# relays\n--setrelay_mask 0b0011  --setrelay 4 1\n\n--getrelay_mask\n")
+        try:
+            code, lines = run("-P", "fake://switch", "--sethost", "4", "--script", path, "-s")
+        finally:
+            os.remove(path)
+        self.assertEqual(0, code)
+        self.assertEqual(["--sethost 4", "--setrelay_mask 0b0011", "--setrelay 4 1",
+                          "--getrelay_mask", "-s"], [line[:24].strip() for line in lines])
+        self.assertTrue(lines[3].endswith("0xb"))
+
+    def test_failure_report(self):
+        model = FakeTransport.from_url("fake://switch/refusing").model
+        handle = model.handle
+        model.handle = lambda name, args: (
+            [f"[{name}{{error}}]"] if name == "SET_HOST_PORT" else handle(name, args))
+        code, lines = run("-P", "fake://switch/refusing", "--sethost", "2", "--gethost")
+        self.assertEqual(1, code)
+        self.assertIn(" error ", lines[0])
+        self.assertIn(" ok ", lines[1])
+
+    def test_unsupported(self):
+        code, lines = run("-P", "fake://switch/old?version=v2.0.5", "--setrelay", "1", "1",
+                          "--gethost")
+        self.assertEqual(1, code)
+        self.assertIn("SET_RELAY needs firmware v2.1", lines[0])
+        self.assertTrue(lines[1].endswith(" rejected"))
+        self.assertIn(" ok ", lines[2])
+        # nothing waited for an answer which cannot come
+        self.assertEqual(["GET_SW_VERSION", "GET_HOST_PORT"],
+                         [record.name for record in self.records])
+        self.assertEqual([metrics.OK] * 2, [record.outcome for record in self.records])
+
+    def test_invalid_value(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                cmd.main(["-P", "fake://switch", "--sethost", "9"])
+
+    def test_port_required(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            with self.assertRaises(SystemExit):
+                cmd.main(["--gethost"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,433 @@
+# -----------------------------------------------------------------------------
+# - File              commands.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Table of the commands of the switch and the converter
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Every command of both devices is declared once, in :data:`SWITCH` and
+:data:`CONVERTER`: its arguments and their valid values, the answer the
+device gives, the parser of a result, a timeout class and whether sending it
+twice does harm.  The SDK functions, the command lines, pipelines and the
+futures of a zuss.reactor.Reactor all run commands from these tables::
+
+    SWITCH["SET_HOST_PORT"].run("/dev/ttyUSB0", 2)            # True
+    CONVERTER.pipeline("/dev/ttyUSB1", [("GET_ETH_SPEED", 1), ("GET_OP_MODE",)])
+    SWITCH["GET_HOST_PORT"].submit(reactor, "/dev/ttyUSB0")  # Future of 2
+
+Values are checked before the port is opened; arguments without valid
+values are left to the device, which answers with an error frame.
+Commands newer than the firmware of a device fail at once with
+:class:`Unsupported` (the firmware ignores them, so they would wait out the
+timeout); the version is asked once per device, see :meth:`Registry.firmware`.
+Results of cached commands (version, configuration display) are kept for a
+while, see zuss.cache.  The
+request and the expected answer of every value in the (small) domain of the
+arguments, e.g. all masks 0-15, are built with the table; encoding them is a
+dict lookup.
+"""
+
+import itertools
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+
+from zuss import metrics
+from zuss.cache import FIRMWARE_TTL, RESULTS, device_key, firmware
+from zuss.frames import (
+    UNKNOWN_OP_MODE, UNKNOWN_SETTING, BrrMode, Control, Role, frame_value, parse_control,
+    parse_display, parse_int, parse_op_mode, parse_setting,
+)
+from zuss.log import device_logger
+from zuss.session import open_session
+
+# answers: {ok}, the arguments repeated, the arguments repeated with ", ",
+# or a result to parse
+OK = "ok"
+ECHO = "echo"
+SPACED = "spaced"
+VALUE = "value"
+
+# timeout classes
+NORMAL = "normal"
+REBOOT = "reboot"
+
+
+def parse_mask(text: str) -> int:
+    """'0x5', '0b101' or '5'"""
+    # hex
+    if "0x" in text:
+        return int(text, 16)
+    # binary
+    if "0b" in text:
+        return int(text, 2)
+    # decimal
+    return int(text, 10)
+
+
+class Unsupported(ValueError):
+    """The firmware of the device does not know the command."""
+
+
+def firmware_version(text: str) -> tuple:
+    """``v2.1.2`` -> (2, 1, 2), () if it is no version"""
+    try:
+        return tuple(int(part) for part in text.lstrip("vV").split("."))
+    except ValueError:
+        return ()
+
+
+# valid: the values the SDK accepts, None: any; help: shown when invalid;
+# type: converts a command line value; domain: values encoded in advance,
+# default: the valid ones
+Arg = namedtuple("Arg", "name valid help type domain", defaults=(None, "", int, None))
+
+
+def _version(line: str) -> str:
+    """``[GET_SW_VERSION{v2.1.2 2021-09-27}]`` -> ``v2.1.2``"""
+    return frame_value(line).split(" ")[0]
+
+
+class Command:
+    """One command of a device, see the module documentation."""
+
+    __slots__ = ("name", "args", "format", "answer", "parse", "timeout", "idempotent",
+                 "default", "since", "cached", "registry", "_codes")
+
+    def __init__(self, name: str, args=(), answer: str = OK, parse=None, format=None,
+                 timeout: str = NORMAL, idempotent: bool = True, default=None, since=None,
+                 cached: bool = False):
+        self.name = name
+        self.args = tuple(args)
+        self.answer = answer
+        # result of an answer, default: the text between the braces
+        self.parse = parse or frame_value
+        # argument text of the values, default: joined with ","
+        self.format = format
+        self.timeout = timeout
+        self.idempotent = idempotent
+        # result without an answer: False for settings, None or a record for values
+        self.default = default if answer == VALUE else False
+        # first firmware version with the command, None: all
+        self.since = since
+        # read-only and rarely changing: results kept in zuss.cache.RESULTS
+        self.cached = cached
+        self.registry = None
+        # values -> (request, expect)
+        self._codes = {}
+        domains = [arg.valid if arg.domain is None else arg.domain for arg in self.args]
+        if None not in domains:
+            for values in itertools.product(*domains):
+                self._codes[values] = self._encode(values)
+
+    def __repr__(self):
+        return f"<Command {self.name}>"
+
+    def check(self, values):
+        """Raise ValueError for values the command does not accept."""
+        if len(values) != len(self.args):
+            raise TypeError(f"{self.name} takes {len(self.args)} arguments, got {len(values)}")
+        for arg, value in zip(self.args, values):
+            if arg.valid is not None and value not in arg.valid:
+                raise ValueError(f"Input {arg.name}:{value} error! Valid options: {arg.help}")
+
+    def encode(self, *values):
+        """(request, expected answer) for ``session.pipeline``, checks the values."""
+        try:
+            return self._codes[values]
+        except (KeyError, TypeError):
+            return self._encode(values)
+
+    def _encode(self, values):
+        self.check(values)
+        if self.format is not None:
+            text = self.format(*values)
+        else:
+            text = ",".join(str(value) for value in values)
+        request = f"<{self.name}{{{text}}}>".encode("utf8")
+        if self.answer == OK:
+            return request, f"[{self.name}{{ok}}]"
+        if self.answer == ECHO:
+            return request, f"[{self.name}{{{text}}}]"
+        if self.answer == SPACED:
+            return request, f"[{self.name}{{{text.replace(',', ', ')}}}]"
+        return request, f"[{self.name}{{"
+
+    def require(self, session):
+        """Raise Unsupported if the firmware behind ``session`` lacks the command."""
+        if self.since is None:
+            return
+        version = self.registry.firmware(session)
+        # unknown (no answer): let the command try
+        if version and version < self.since:
+            raise Unsupported(
+                f"{self.name} needs firmware v{'.'.join(map(str, self.since))}, "
+                f"{session.name} runs v{'.'.join(map(str, version))}")
+
+    def result(self, line):
+        """The result of answer ``line``, None if there was none."""
+        if line is None:
+            return self.default
+        return self.parse(line) if self.answer == VALUE else True
+
+    @property
+    def seconds(self) -> float:
+        """Time to wait for the answer, None: the default of the session."""
+        return self.registry.timeouts[self.timeout]
+
+    def _key(self, port, values):
+        """Key of the result in zuss.cache.RESULTS, None if it is not kept."""
+        device = device_key(port) if self.cached else None
+        return None if device is None else (device, self.name, values)
+
+    def run(self, port, *values):
+        """Send the command to ``port`` (name or open Session), returns its result."""
+        try:
+            request, expect = self.encode(*values)
+        except ValueError as e:
+            # a call which cannot succeed does not open the port
+            device_logger(port).warning("%s", e)
+            return self.default
+        # a display shows its lines, it is cached by stream()
+        key = self._key(port, values) if self.answer == VALUE else None
+        if key is not None:
+            result = RESULTS.get(key)
+            if result is not None:
+                return result
+        with open_session(port, **self.registry.session) as session:
+            try:
+                self.require(session)
+            except Unsupported as e:
+                session.log.warning("%s", e)
+                return self.default
+            line = session.request(request, expect, self.seconds)
+        if key is not None and line is not None:
+            RESULTS.put(key, self.result(line))
+        return self.result(line)
+
+    def stream(self, port, *values):
+        """Yield the display lines of the command as zuss.frames.Display records."""
+        request, expect = self.encode(*values)
+        key = self._key(port, values)
+        if key is not None:
+            displays = RESULTS.get(key)
+            if displays is not None:
+                yield from displays
+                return
+        displays = []
+        with open_session(port, **self.registry.session) as session:
+            lines = session.stream(request, expect, self.seconds)
+            try:
+                while True:
+                    try:
+                        line = next(lines)
+                    except StopIteration as end:
+                        # the outcome: only a complete display is kept
+                        outcome = end.value
+                        break
+                    displays.append(parse_display(line))
+                    yield displays[-1]
+            finally:
+                # also when the consumer stops early, before the session closes
+                lines.close()
+        if key is not None and outcome == metrics.OK:
+            RESULTS.put(key, tuple(displays))
+
+    def submit(self, reactor, port: str, *values, priority: int = None) -> Future:
+        """Run on a zuss.reactor.Reactor or zuss.fleet.Fleet, a Future of the result."""
+        commands = [self.encode(*values)]
+        future = Future()
+
+        def resolve(done):
+            # runs in the reactor thread, an exception raised here would be lost
+            try:
+                future.set_result(self.result(done.result()[0]))
+            except Exception as e:
+                future.set_exception(e)
+
+        reactor.submit(port, commands, self.seconds, priority).add_done_callback(resolve)
+        return future
+
+
+class Registry(dict):
+    """
+    The commands of one device by name.
+
+    :param timeouts: seconds per timeout class
+    :param session: arguments of the Session the commands open
+    """
+
+    def __init__(self, kind: str, commands, timeouts, session=None):
+        super().__init__((command.name, command) for command in commands)
+        self.kind = kind
+        self.timeouts = timeouts
+        self.session = session or {}
+        for command in self.values():
+            command.registry = self
+
+    def pipeline(self, port, calls, priority: int = None):
+        """
+        Run ``calls``, tuples of command name and values, back to back over one
+        session; returns their results.  Invalid values raise ValueError
+        before anything is sent, commands the firmware lacks Unsupported.
+        """
+        commands = [self[name] for name, *_ in calls]
+        encoded = [command.encode(*values) for command, (_, *values) in zip(commands, calls)]
+        timeout = max((command.seconds for command in commands if command.seconds is not None),
+                      default=None)
+        with open_session(port, **self.session) as session:
+            for command in commands:
+                command.require(session)
+            lines = session.pipeline(encoded, timeout, priority)
+        return [command.result(line) for command, line in zip(commands, lines)]
+
+    def firmware(self, session) -> tuple:
+        """
+        Firmware version of the device behind ``session``, e.g. (2, 1, 2).
+        Asked once per device (USB serial number or port) and FIRMWARE_TTL,
+        () while the device does not answer.
+        """
+        key = device_key(session) or session.name
+        entry = firmware.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        command = self["GET_SW_VERSION"]
+        line = session.request(*command.encode(), command.seconds)
+        if line is None:
+            return ()
+        version = firmware_version(command.result(line))
+        firmware[key] = (time.monotonic() + FIRMWARE_TTL, version)
+        # forgotten when the device reboots
+        RESULTS.watch()
+        return version
+
+
+_PORTS = range(1, 5)
+_CONTROLS = (0, 1)
+_port = Arg("port_num", _PORTS, "1 - 4")
+_mask = Arg("mask", range(16), "0x0 - 0xf", parse_mask)
+_relay = (Arg("relay_port", _PORTS, "1 - 4"), Arg("control", _CONTROLS, "0: open; 1: close"))
+_power = (Arg("power_device", _PORTS, "1 - 4"),
+          Arg("control", _CONTROLS, "0: power off; 1: power on"))
+
+SWITCH = Registry("zuss", [
+    Command("GET_SW_VERSION", answer=VALUE, parse=_version, cached=True),
+    Command("REBOOT_SYS", timeout=REBOOT, idempotent=False),
+    Command("SAVE_CONFIG"),
+    Command("CLEAR_CONFIG"),
+    Command("DISP_CONFIG", cached=True),
+    Command("SET_HOST_PORT", [_port], ECHO),
+    Command("GET_HOST_PORT", answer=VALUE, parse=parse_int),
+    Command("SET_DEVICE_PORT", [_port], ECHO),
+    Command("GET_DEVICE_PORT", answer=VALUE, parse=parse_int),
+    Command("SET_RELAY_MASK", [_mask], ECHO, format=hex),
+    Command("GET_RELAY_MASK", answer=VALUE, parse=parse_int),
+    Command("SET_POWER_MASK", [_mask], ECHO, format=hex),
+    Command("GET_POWER_MASK", answer=VALUE, parse=parse_int),
+    # added with firmware v2.1 (SDK of 2021-09-27)
+    Command("SET_RELAY", _relay, ECHO, since=(2, 1)),
+    Command("GET_RELAY", _relay[:1], VALUE, parse_control, default=Control(0, 0), since=(2, 1)),
+    Command("SET_POWER", _power, ECHO, since=(2, 1)),
+    Command("GET_POWER", _power[:1], VALUE, parse_control, default=Control(0, 0), since=(2, 1)),
+], timeouts={NORMAL: None, REBOOT: 10})
+
+
+_eth = Arg("port number", (1, 2), "1: ETH 1; 2: ETH 2(GE)")
+_brr = Arg("port number", (1, 2), "1: BRR 1; 2: BRR 2")
+_speed = Arg("speed", (100, 1000), "100: 100M; 1000: 1000M")
+_down = Arg("com", (0, 1), "0: not down; 1: down")
+_role = Arg("com", (0, 1), "0: master; 1: slave")
+_brr_mode = Arg("com", (0, 1), "0: ieee-compliant; 1: legacy")
+_op_mode = Arg("value", (0, 1, 2, 3), "0: mode 0; 1: mode 1; 2: mode 2; 3: mode 3")
+
+
+def _setting(kind=int):
+    return lambda line: parse_setting(line, kind)
+
+
+CONVERTER = Registry("zcts", [
+    Command("GET_SW_VERSION", answer=VALUE, parse=_version, cached=True),
+    Command("REBOOT_SYS", timeout=REBOOT, idempotent=False),
+    Command("SAVE_CONFIG"),
+    Command("CLEAR_CONFIG"),
+    Command("DISP_CONFIG", cached=True),
+    Command("DISP_PORT_STATUS"),
+    Command("DISP_PORT_STATISTICS"),
+    Command("SET_OP_MODE", [_op_mode], ECHO),
+    Command("GET_OP_MODE", answer=VALUE, parse=parse_op_mode, default=UNKNOWN_OP_MODE),
+    Command("SET_ETH_SPEED", [_eth, _speed], ECHO),
+    Command("GET_ETH_SPEED", [_eth], VALUE, _setting(), default=UNKNOWN_SETTING),
+    Command("SET_ETH_DOWN", [_eth, _down], SPACED),
+    Command("GET_ETH_DOWN", [_eth], VALUE, _setting(), default=UNKNOWN_SETTING),
+    Command("SET_BRR_SPEED", [_brr, _speed], ECHO),
+    Command("GET_BRR_SPEED", [_brr], VALUE, _setting(), default=UNKNOWN_SETTING),
+    Command("SET_BRR_DOWN", [_brr, _down], SPACED),
+    Command("GET_BRR_DOWN", [_brr], VALUE, _setting(), default=UNKNOWN_SETTING),
+    Command("SET_BRR_ROLE", [_brr, _role], SPACED),
+    Command("GET_BRR_ROLE", [_brr], VALUE, _setting(Role), default=UNKNOWN_SETTING),
+    Command("SET_BRR_MODE", [_brr, _brr_mode], SPACED),
+    Command("GET_BRR_MODE", [_brr], VALUE, _setting(BrrMode), default=UNKNOWN_SETTING),
+], timeouts={NORMAL: 1, REBOOT: 1.5}, session={"timeout": 1})
+
+
+def _functions(namespace: str, table: Registry, functions: dict) -> dict:
+    return {f"{namespace}.{name}": tuple(table[command] for command in commands.split())
+            for name, commands in functions.items()}
+
+
+# the commands each SDK function runs, by its zussd method name; zuss.client
+# sends a call again only if all of them are idempotent
+FUNCTIONS = {
+    **_functions("zuss", SWITCH, {
+        "get_version": "GET_SW_VERSION",
+        "reboot_sys": "REBOOT_SYS",
+        "save_config": "SAVE_CONFIG",
+        "clr_config": "CLEAR_CONFIG",
+        "disp_config": "DISP_CONFIG",
+        "stream_config": "DISP_CONFIG",
+        "set_host_port": "SET_HOST_PORT",
+        "get_host_port": "GET_HOST_PORT",
+        "set_dev_port": "SET_DEVICE_PORT",
+        "get_dev_port": "GET_DEVICE_PORT",
+        "set_relay_mask": "SET_RELAY_MASK",
+        "get_relay_mask": "GET_RELAY_MASK",
+        "set_pwr_mask": "SET_POWER_MASK",
+        "get_pwr_mask": "GET_POWER_MASK",
+        "set_relay": "SET_RELAY",
+        "get_relay": "GET_RELAY",
+        "set_pwr": "SET_POWER",
+        "get_pwr": "GET_POWER",
+        "set_relays": "SET_RELAY SET_RELAY_MASK GET_RELAY_MASK",
+        "set_pwrs": "SET_POWER SET_POWER_MASK GET_POWER_MASK",
+    }),
+    **_functions("zcts", CONVERTER, {
+        "get_sw_version": "GET_SW_VERSION",
+        "reboot_sys": "REBOOT_SYS",
+        "save_config": "SAVE_CONFIG",
+        "clear_config": "CLEAR_CONFIG",
+        "disp_config": "DISP_CONFIG",
+        "stream_config": "DISP_CONFIG",
+        "disp_port_status": "DISP_PORT_STATUS",
+        "stream_port_status": "DISP_PORT_STATUS",
+        "disp_port_statistics": "DISP_PORT_STATISTICS",
+        "stream_port_statistics": "DISP_PORT_STATISTICS",
+        "set_op_mode": "SET_OP_MODE",
+        "get_op_mode": "GET_OP_MODE",
+        "set_eth_speed": "SET_ETH_SPEED",
+        "get_eth_speed": "GET_ETH_SPEED",
+        "set_eth_down": "SET_ETH_DOWN",
+        "get_eth_down": "GET_ETH_DOWN",
+        "set_brr_speed": "SET_BRR_SPEED",
+        "get_brr_speed": "GET_BRR_SPEED",
+        "set_brr_down": "SET_BRR_DOWN",
+        "get_brr_down": "GET_BRR_DOWN",
+        "set_brr_role": "SET_BRR_ROLE",
+        "get_brr_role": "GET_BRR_ROLE",
+        "set_brr_mode": "SET_BRR_MODE",
+        "get_brr_mode": "GET_BRR_MODE",
+    }),
+}
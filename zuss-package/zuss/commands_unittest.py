@@ -0,0 +1,176 @@
+# -----------------------------------------------------------------------------
+# - File              commands_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    commands_unittest
+# - Brief             commands_unittest for the command tables
+# -----------------------------------------------------------------------------
+import time
+import unittest
+from unittest import mock
+
+from zuss import *
+from zuss import cmd, metrics
+from zuss.commands import CONVERTER, SWITCH, VALUE, Unsupported
+from zuss.frames import UNKNOWN_SETTING, Control, Setting
+from zuss.reactor import Reactor
+from zuss.simulator import Simulator
+from zuss.transport import FakeTransport
+
+
+class TestCommands(unittest.TestCase):
+    def setUp(self):
+        self.records = []
+        metrics.add_hook(self.records.append)
+
+    def tearDown(self):
+        metrics.remove_hook(self.records.append)
+
+    def test_encode(self):
+        self.assertEqual((b"<SET_RELAY_MASK{0xa}>", "[SET_RELAY_MASK{0xa}]"),
+                         SWITCH["SET_RELAY_MASK"].encode(10))
+        self.assertEqual((b"<SET_BRR_DOWN{2,1}>", "[SET_BRR_DOWN{2, 1}]"),
+                         CONVERTER["SET_BRR_DOWN"].encode(2, 1))
+        self.assertEqual((b"<GET_RELAY{3}>", "[GET_RELAY{"), SWITCH["GET_RELAY"].encode(3))
+
+    def test_encoded_in_advance(self):
+        command = SWITCH["SET_POWER"]
+        self.assertIs(command.encode(4, 1), command.encode(4, 1))
+        with self.assertRaises(ValueError):
+            command.encode(5, 1)
+
+    def test_invalid_value_is_not_sent(self):
+        with self.assertLogs("zuss", "WARNING") as logs:
+            self.assertFalse(CONVERTER["SET_ETH_SPEED"].run("/dev/does-not-exist", 1, 10))
+        # checked before the port is opened
+        self.assertEqual(1, len(logs.output))
+        self.assertIn("speed:10 error", logs.output[0])
+        # getters keep their typed result
+        with self.assertLogs("zuss", "WARNING"):
+            self.assertEqual(UNKNOWN_SETTING, CONVERTER["GET_ETH_SPEED"].run("/dev/does-not-exist", 3))
+        with self.assertRaises(ValueError):
+            CONVERTER.pipeline("fake://converter/commands",
+                               [("GET_OP_MODE",), ("SET_BRR_ROLE", 3, 0)])
+        self.assertEqual([], self.records)
+
+    def test_error_answer(self):
+        for registry, kind in ((SWITCH, "switch"), (CONVERTER, "converter")):
+            port = f"fake://{kind}/errors"
+            model = FakeTransport.from_url(port).model
+            model.handle = lambda name, args: [f"[{name}{{error}}]"]
+            for command in registry.values():
+                if command.answer != VALUE:
+                    continue
+                values = [next(iter(arg.domain if arg.valid is None else arg.valid))
+                          for arg in command.args]
+                del self.records[:]
+                self.assertEqual(command.default, command.run(port, *values), command.name)
+                self.assertEqual(metrics.ERROR, self.records[-1].outcome, command.name)
+
+    def test_invalid_switch_value_opens_nothing(self):
+        opened = []
+        with mock.patch("zuss.session.open_transport", side_effect=opened.append):
+            with self.assertLogs("zuss", "WARNING"):
+                self.assertFalse(set_host_port("fake://switch/commands", 9))
+                self.assertFalse(set_relay_mask("fake://switch/commands", 0x10))
+                self.assertFalse(set_pwr("fake://switch/commands", 5, 1))
+                self.assertEqual(Control(0, 0), get_relay("fake://switch/commands", 0))
+        self.assertEqual([], opened)
+        self.assertEqual([], self.records)
+
+    def test_pipeline(self):
+        results = SWITCH.pipeline("fake://switch/commands", [
+            ("SET_RELAY_MASK", 0x4), ("GET_RELAY", 3), ("GET_HOST_PORT",), ("SET_HOST_PORT", 4),
+        ])
+        self.assertEqual([True, Control(3, 1), 1, True], results)
+        # GET_RELAY asked for the firmware version first
+        self.assertEqual(1, len({record.batch for record in self.records
+                                 if record.name != "GET_SW_VERSION"}))
+
+    def test_submit(self):
+        with Simulator() as simulator:
+            port = simulator.add_converter().port
+            with Reactor() as reactor:
+                self.assertTrue(CONVERTER["SET_ETH_SPEED"].submit(reactor, port, 2, 100).result(5))
+                future = CONVERTER["GET_ETH_SPEED"].submit(reactor, port, 2)
+                self.assertEqual(Setting(2, 100, 1000), future.result(5))
+
+    def test_unsupported_fails_fast(self):
+        port = "fake://switch/commands-old?version=v2.0.5+2021-06-09"
+        start = time.monotonic()
+        with self.assertLogs("zuss", "WARNING") as logs:
+            self.assertFalse(set_relay(port, 1, 1))
+            self.assertFalse(set_pwr(port, 2, 0))
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertIn("SET_RELAY needs firmware v2.1", logs.output[0])
+        # the version was asked once, nothing else was sent
+        self.assertEqual(["GET_SW_VERSION"], [record.name for record in self.records])
+        with self.assertRaises(Unsupported):
+            SWITCH.pipeline(port, [("GET_HOST_PORT",), ("GET_RELAY", 1)])
+        self.assertTrue(set_relay_mask(port, 0x1))
+
+    def test_firmware_asked_once(self):
+        port = "fake://switch/commands-new"
+        self.assertTrue(set_relay(port, 1, 1))
+        self.assertEqual(Control(1, 1), get_relay(port, 1))
+        names = [record.name for record in self.records]
+        self.assertEqual(["GET_SW_VERSION", "SET_RELAY", "GET_RELAY"], names)
+
+    def test_firmware_expires(self):
+        port = "fake://switch/commands-expires"
+        # another device may be on the tty by now
+        with mock.patch("zuss.commands.FIRMWARE_TTL", 0):
+            self.assertTrue(set_relay(port, 1, 1))
+            self.assertTrue(set_relay(port, 1, 0))
+        names = [record.name for record in self.records]
+        self.assertEqual(["GET_SW_VERSION", "SET_RELAY"] * 2, names)
+
+    def test_set_relays(self):
+        for port, single in (("fake://switch/relays-new", True),
+                             ("fake://switch/relays-old?version=v2.0.5", False)):
+            self.assertTrue(set_relay_mask(port, 0b0101))
+            self.assertTrue(set_relays(port, {2: 1, 3: 0}))
+            # old firmware: read and write the mask
+            self.assertEqual(single, "SET_RELAY" in [record.name for record in self.records])
+            self.assertEqual(0b0011, get_relay_mask(port))
+            del self.records[:]
+            self.assertTrue(set_pwrs(port, {1: 0, 2: 1, 3: 0, 4: 1}))
+            self.assertEqual(0b1010, get_pwr_mask(port))
+            # all four: one mask write
+            self.assertEqual(["SET_POWER_MASK", "GET_POWER_MASK"],
+                             [record.name for record in self.records])
+
+    def test_set_relays_invalid(self):
+        port = "fake://switch/relays-invalid"
+        for controls in ({}, {5: 1}, {1: 1, 2: 2}):
+            with self.assertLogs(level="WARNING"):
+                self.assertFalse(set_relays(port, controls))
+                self.assertFalse(set_pwrs(port, controls))
+        # nothing was sent
+        self.assertEqual([], self.records)
+
+    def test_submit_error_answer(self):
+        with Simulator() as simulator:
+            device = simulator.add_switch()
+            device.model.handle = lambda name, args: [f"[{name}{{error}}]"]
+            with Reactor() as reactor:
+                future = SWITCH["GET_RELAY"].submit(reactor, device.port, 3)
+                self.assertEqual(Control(0, 0), future.result(3))
+                future = SWITCH["GET_HOST_PORT"].submit(reactor, device.port)
+                self.assertIsNone(future.result(3))
+
+    def test_submit_parse_failure(self):
+        with Simulator() as simulator:
+            device = simulator.add_switch()
+            device.model.handle = lambda name, args: [f"[{name}{{garbage}}]"]
+            with Reactor() as reactor:
+                future = SWITCH["GET_HOST_PORT"].submit(reactor, device.port)
+                with self.assertRaises(ValueError):
+                    future.result(3)
+
+    def test_command_line_covers_the_table(self):
+        self.assertEqual(set(SWITCH.values()), set(cmd.OPERATIONS.values()))
+
+if __name__ == "__main__":
+    unittest.main()
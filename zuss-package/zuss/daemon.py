@@ -0,0 +1,333 @@
+# -----------------------------------------------------------------------------
+# - File              daemon.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             zussd: device daemon with JSON-RPC on a Unix socket
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+``zussd`` owns the ports of the switches and converters, keeps one open
+:class:`zuss.session.Session` per port and runs the commands of all its
+clients one device at a time::
+
+    python -m zuss.daemon --port /dev/ttyUSB0 --port /dev/ttyUSB1
+    python -m zuss.daemon --discover --socket /run/zussd.sock
+
+Clients use zuss.client.  The protocol is JSON-RPC 2.0, one JSON object per
+line.  Methods are the SDK functions, ``zuss.set_host_port`` or
+``zcts.get_eth_speed``, with the same parameters (port first); besides that:
+
+* ``request`` [port, request, expect, timeout]: one raw command
+* ``ports``: the ports of the daemon
+* ``metrics`` [port]: zuss.metrics.summary()
+"""
+
+import argparse
+import errno
+import inspect
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import threading
+
+from zuss import metrics
+from zuss.client import DEFAULT_SOCKET
+from zuss.session import Session
+
+logger = logging.getLogger("zuss.daemon")
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _sdk(namespace: str):
+    """Public functions of the zuss or zcts SDK by name."""
+    if namespace == "zuss":
+        import zuss
+
+        return {name: getattr(zuss, name) for name in zuss.__all__}
+    if namespace == "zcts":
+        try:
+            import zcts.zcts as module
+        except ImportError:
+            return {}
+        return {
+            name: value
+            for name, value in vars(module).items()
+            if callable(value) and not name.startswith("_")
+            and getattr(value, "__module__", None) == module.__name__
+        }
+    return {}
+
+
+class _Device:
+    """An open session and the lock which serialises the calls on it."""
+
+    def __init__(self, port: str, watchdog: float = None):
+        self.session = Session(port)
+        self.lock = threading.Lock()
+        self.watchdog = None
+        if watchdog is not None:
+            from zuss.watchdog import Watchdog
+
+            self.watchdog = Watchdog(self.session, idle=watchdog).start()
+
+
+class Daemon:
+    """
+    The RPC dispatcher, independent of the socket.
+
+    :param ports: ports to own from the start, more are added on first use
+        unless ``strict``
+    :param watchdog: probe a device idle for this long (seconds) and reopen
+        its port when it stops answering, see zuss.watchdog
+    """
+
+    def __init__(self, ports=(), strict: bool = False, watchdog: float = None):
+        self.strict = strict
+        self.watchdog = watchdog
+        self._devices = {}
+        self._lock = threading.Lock()
+        self._functions = {}
+        for port in ports:
+            self._devices[port] = _Device(port, watchdog)
+
+    def device(self, port: str) -> _Device:
+        with self._lock:
+            device = self._devices.get(port)
+            if device is None:
+                if self.strict:
+                    raise RpcError(INVALID_PARAMS, f"{port} is not a port of this daemon")
+                device = self._devices[port] = _Device(port, self.watchdog)
+            return device
+
+    def ports(self):
+        with self._lock:
+            return sorted(self._devices)
+
+    def _function(self, method: str):
+        namespace, _, name = method.partition(".")
+        functions = self._functions.get(namespace)
+        if functions is None:
+            functions = self._functions[namespace] = _sdk(namespace)
+        function = functions.get(name)
+        if function is None:
+            raise RpcError(METHOD_NOT_FOUND, f"unknown method {method}")
+        return function
+
+    def _on_device(self, port, call):
+        if not isinstance(port, str):
+            raise RpcError(INVALID_PARAMS, "the first parameter is the port")
+        device = self.device(port)
+        with device.lock:
+            device.session.open()
+            try:
+                result = call(device.session)
+                if inspect.isgenerator(result):
+                    # stream_* functions: collect the records while the port is ours
+                    result = [item._asdict() if hasattr(item, "_asdict") else item
+                              for item in result]
+                return result
+            except Exception:
+                # e.g. the device was unplugged: reopen on the next call
+                device.session.close()
+                raise
+
+    def call(self, method: str, params):
+        if not isinstance(params, list):
+            raise RpcError(INVALID_PARAMS, "params must be a list")
+        if method == "ports":
+            return self.ports()
+        if method == "metrics":
+            return metrics.summary(*params[:1])
+        if method == "request":
+            if not 3 <= len(params) <= 4:
+                raise RpcError(INVALID_PARAMS, "request takes port, request, expect[, timeout]")
+            port, request, expect, *timeout = params
+            return self._on_device(
+                port,
+                lambda session: session.request(request.encode("ascii"), expect, *timeout),
+            )
+        if method == "detect_comports":
+            from zuss.usbswsdk import detect_comports
+
+            return detect_comports()
+        function = self._function(method)
+        if not params:
+            raise RpcError(INVALID_PARAMS, "the first parameter is the port")
+        return self._on_device(params[0], lambda session: function(session, *params[1:]))
+
+    def handle(self, line: bytes) -> dict:
+        """Answer one JSON-RPC request line, None for a notification."""
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                raise RpcError(PARSE_ERROR, str(e))
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise RpcError(INVALID_REQUEST, "not a JSON-RPC request")
+            request_id = request.get("id")
+            try:
+                result = self.call(request["method"], request.get("params", []))
+            except TypeError as e:
+                raise RpcError(INVALID_PARAMS, str(e))
+            if "id" not in request:
+                return None
+            return {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except RpcError as e:
+            error = {"code": e.code, "message": e.message}
+        except Exception as e:
+            logger.exception("request failed")
+            error = {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+
+    def close(self):
+        with self._lock:
+            for device in self._devices.values():
+                if device.watchdog is not None:
+                    device.watchdog.stop()
+                with device.lock:
+                    device.session.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.rpc.handle(line)
+            if response is not None:
+                try:
+                    self.wfile.write(json.dumps(response).encode("utf8") + b"\n")
+                    self.wfile.flush()
+                except ConnectionError:
+                    # the client gave up waiting (timeout) and closed
+                    return
+
+
+def _live(path: str) -> bool:
+    """Whether a daemon accepts connections on ``path``."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix socket server, one thread per connected client.  Raises OSError
+    (EADDRINUSE) while another daemon serves ``path``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str = DEFAULT_SOCKET, daemon: Daemon = None):
+        if os.path.exists(path):
+            if _live(path):
+                raise OSError(errno.EADDRINUSE, "another zussd serves the socket", path)
+            # left behind by a daemon which did not shut down
+            os.unlink(path)
+        super().__init__(path, _Handler)
+        self.path = path
+        self.rpc = daemon or Daemon()
+
+    def start(self):
+        """Serve from a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, args=(0.1,), name="zussd", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        self.rpc.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def discover():
+    """Ports of the system answering GET_SW_VERSION."""
+    import serial.tools.list_ports as port_list
+
+    found = []
+    for info in port_list.comports():
+        with Session(info.device, timeout=0.5) as session:
+            if session.request(b"<GET_SW_VERSION{}>", "[GET_SW_VERSION{") is not None:
+                found.append(info.device)
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="zussd", description="ZD UART device daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument("--port", action="append", default=[], help="Port to own")
+    parser.add_argument("--discover", action="store_true", help="Own all answering ports")
+    parser.add_argument("--strict", action="store_true", help="Refuse other ports")
+    parser.add_argument("--verbose", action="store_true", help="Log the device traffic")
+    parser.add_argument("--state", nargs="?", const="zuss-state", default=None,
+                        help="Publish the device states to this zuss.state table")
+    parser.add_argument("--watchdog", nargs="?", type=float, const=10.0, default=None,
+                        metavar="IDLE", help="Probe idle devices (seconds) and reconnect")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(name)s %(message)s",
+    )
+    if args.state is not None:
+        from zuss.state import publish
+
+        publish(args.state)
+    ports = list(args.port)
+    if args.discover:
+        ports += [port for port in discover() if port not in ports]
+    try:
+        server = Server(args.socket, Daemon(ports, args.strict, args.watchdog))
+    except OSError as e:
+        logger.error("%s", e)
+        return 1
+    logger.info("serving %s on %s", ", ".join(ports) or "no ports yet", args.socket)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.rpc.close()
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+# -----------------------------------------------------------------------------
+# - File              daemon_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    daemon_unittest
+# - Brief             daemon_unittest for zussd and its client
+# -----------------------------------------------------------------------------
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+
+from zuss import metrics
+from zuss.client import Client, RemoteError, idempotent
+from zuss.commands import FUNCTIONS
+from zuss.daemon import METHOD_NOT_FOUND, INVALID_PARAMS, Daemon, Server
+
+
+class _WrongId(socketserver.StreamRequestHandler):
+    """Answers every request with the id of another one."""
+
+    def handle(self):
+        for line in self.rfile:
+            self.wfile.write(b'{"jsonrpc": "2.0", "id": 999, "result": true}\n')
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "zussd.sock")
+        self.server = Server(self.path, Daemon(["fake://switch/d1"])).start()
+        self.client = Client(self.path, timeout=5)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def test_sdk_functions(self):
+        port = "fake://switch/d1"
+        self.assertTrue(self.client.zuss.set_host_port(port, 3))
+        self.assertEqual(3, self.client.zuss.get_host_port(port))
+        self.assertEqual(2, self.client.zuss.get_relay(port, 2)[0])
+        self.assertEqual("[GET_HOST_PORT{3}]\r\n",
+                         self.client.request(port, "<GET_HOST_PORT{}>", "[GET_HOST_PORT{"))
+        self.assertEqual(["fake://switch/d1"], self.client.ports())
+
+    def test_zcts_functions(self):
+        try:
+            import zcts  # noqa: F401
+        except ImportError:
+            self.skipTest("zcts is not installed")
+        port = "fake://converter/d2"
+        self.assertTrue(self.client.zcts.set_eth_speed(port, 1, 100))
+        self.assertEqual(100, self.client.zcts.get_eth_speed(port, 1)[1])
+
+    def test_session_stays_open(self):
+        records = []
+        metrics.add_hook(records.append)
+        try:
+            for _ in range(5):
+                self.client.zuss.get_dev_port("fake://switch/d1")
+        finally:
+            metrics.remove_hook(records.append)
+        self.assertEqual(5, len(records))
+        self.assertLessEqual(sum(1 for record in records if record.open_s), 1)
+
+    def test_clients_in_parallel(self):
+        errors = []
+
+        def worker(number):
+            try:
+                with Client(self.path) as client:
+                    for i in range(10):
+                        port = number % 4 + 1
+                        self.assertTrue(client.zuss.set_dev_port("fake://switch/d1", port))
+                        self.assertIsNotNone(client.zuss.get_dev_port("fake://switch/d1"))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+
+    def test_errors(self):
+        with self.assertRaises(RemoteError) as raised:
+            self.client.zuss.no_such_function("fake://switch/d1")
+        self.assertEqual(METHOD_NOT_FOUND, raised.exception.code)
+        with self.assertRaises(RemoteError) as raised:
+            self.client.zuss.set_host_port("fake://switch/d1")
+        self.assertEqual(INVALID_PARAMS, raised.exception.code)
+        # the connection is still usable
+        self.assertTrue(self.client.zuss.set_host_port("fake://switch/d1", 1))
+
+    def drop(self):
+        """The connection breaks, as when the daemon restarts; returns its socket."""
+        old = self.client._socket
+        old.shutdown(socket.SHUT_RDWR)
+        return old
+
+    def test_reconnect(self):
+        self.assertEqual(1, self.client.zuss.get_host_port("fake://switch/d1"))
+        old = self.drop()
+        self.assertEqual(1, self.client.zuss.get_host_port("fake://switch/d1"))
+        self.assertEqual(-1, old.fileno())
+
+    def test_no_second_reboot(self):
+        self.assertTrue(self.client.zuss.get_version("fake://switch/d1"))
+        old = self.drop()
+        with self.assertRaises(ConnectionError):
+            self.client.zuss.reboot_sys("fake://switch/d1")
+        self.assertEqual(-1, old.fileno())
+        # the next call connects again
+        self.assertTrue(self.client.zuss.reboot_sys("fake://switch/d1"))
+
+    def test_timeout(self):
+        with Client(self.path, timeout=0.5) as client:
+            with self.assertRaises(OSError):
+                client.zuss.get_host_port("fake://switch/d4?latency=1.0")
+            self.assertIsNone(client._socket)
+            # a new connection, the late answer is not taken for this call
+            self.assertTrue(client.zuss.set_host_port("fake://switch/d1", 2))
+
+    def test_answer_of_another_request(self):
+        path = os.path.join(self.directory.name, "other.sock")
+        server = socketserver.UnixStreamServer(path, _WrongId)
+        threading.Thread(target=server.serve_forever, args=(0.1,), daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        with Client(path, timeout=5) as client:
+            with self.assertRaises(ConnectionError):
+                client.zuss.reboot_sys("fake://switch/d1")
+            self.assertIsNone(client._socket)
+
+    def test_idempotent(self):
+        self.assertTrue(idempotent("zuss.set_host_port"))
+        self.assertTrue(idempotent("ports"))
+        self.assertTrue(idempotent("request", ["p", "<GET_HOST_PORT{}>", "[GET_HOST_PORT{"]))
+        self.assertFalse(idempotent("zuss.reboot_sys"))
+        self.assertFalse(idempotent("request", ["p", "<REBOOT_SYS{}>", "[REBOOT_SYS{"]))
+        self.assertFalse(idempotent("zuss.no_such_function"))
+        self.assertFalse(idempotent("zcts.reboot_sys"))
+
+    def test_every_function_in_the_table(self):
+        import zuss
+
+        sdk = {f"zuss.{name}" for name in zuss.__all__ if name != "detect_comports"}
+        try:
+            import zcts.zcts
+        except ImportError:
+            self.assertEqual(sdk, {name for name in FUNCTIONS if name.startswith("zuss.")})
+            return
+        sdk |= {f"zcts.{name}" for name, value in vars(zcts.zcts).items()
+                if callable(value) and getattr(value, "__module__", None) == "zcts.zcts"
+                and not name.startswith("_") and name not in ("bcolors", "detect_comports")}
+        self.assertEqual(sdk, set(FUNCTIONS))
+
+    def test_socket_in_use(self):
+        with self.assertRaises(OSError):
+            Server(self.path, Daemon())
+        # the running daemon keeps its socket
+        self.assertEqual(["fake://switch/d1"], self.client.ports())
+
+    def test_stale_socket(self):
+        path = os.path.join(self.directory.name, "stale.sock")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.bind(path)
+        sock.close()
+        with Server(path, Daemon()), Client(path, timeout=5) as client:
+            self.assertEqual([], client.ports())
+
+    def test_strict(self):
+        daemon = Daemon(["fake://switch/d1"], strict=True)
+        response = daemon.handle(b'{"jsonrpc": "2.0", "id": 1, "method": "zuss.get_version",'
+                                 b' "params": ["fake://switch/other"]}')
+        self.assertEqual(INVALID_PARAMS, response["error"]["code"])
+        self.assertIsNone(daemon.handle(b'{"jsonrpc": "2.0", "method": "ports"}'))
+
+    def test_watchdog(self):
+        records = []
+        metrics.add_hook(records.append)
+        self.addCleanup(metrics.remove_hook, records.append)
+        daemon = Daemon(["fake://switch/d3"], watchdog=0.05)
+        try:
+            self.assertEqual(1, daemon.call("zuss.get_host_port", ["fake://switch/d3"]))
+            deadline = time.monotonic() + 5
+            while not any(record.name == "GET_SW_VERSION" for record in records):
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+        finally:
+            daemon.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,302 @@
+# -----------------------------------------------------------------------------
+# - File              fleet.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Devices of a large rig spread over worker processes
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+A :class:`Fleet` spreads the devices of a rig over worker processes, each
+running a zuss.reactor.Reactor, so parsing and bookkeeping use all cores::
+
+    with Fleet(ports, workers=4) as fleet:
+        futures = [fleet.submit(port, [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")])
+                   for port in ports]
+        zuss.set_host_port(fleet.session(ports[0]), 2)
+
+A device belongs to one worker (shard); its commands travel over a pipe to
+that worker and the answers back.  The command records of the workers are
+published with zuss.metrics in this process, so metrics.summary() and the
+hooks (tracing) cover the whole fleet.  A worker which dies is started again
+with the same devices, its unanswered commands fail with CLOSED.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+
+from zuss import metrics
+from zuss.cache import RESULTS
+from zuss.lock import LOCK_TIMEOUT
+from zuss.log import device_name
+from zuss.reactor import Reactor, ReactorSession
+from zuss.session import TIMEOUT, WINDOW, frame_name
+
+logger = logging.getLogger("zuss.fleet")
+
+
+def _serve(conn, ports, timeout, window, lock_timeout, state):
+    """Main function of a worker process."""
+    if state is not None:
+        from zuss.state import publish
+
+        publish(state)
+    records = []
+    send_lock = threading.Lock()
+    metrics.add_hook(lambda record: records.append(record.as_dict()))
+
+    def reply(key, future):
+        # runs in the reactor thread, right after the records were emitted
+        with send_lock:
+            done = records[:]
+            del records[:]
+            conn.send((key, future.result(), done, future.outcomes))
+
+    def send_line(key, line):
+        # a display line for Fleet.submit(on_line=...), before the answer
+        with send_lock:
+            conn.send((key, line, None, None))
+
+    with Reactor(timeout, window, lock_timeout) as reactor:
+        for port in ports:
+            reactor.add(port)
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+            if message is None:
+                break
+            kind, key, port, *args = message
+            if kind == "add":
+                with send_lock:
+                    conn.send((key, reactor.add(port), [], None))
+            else:
+                commands, timeout, priority, lines = args
+                on_line = (lambda line, key=key: send_line(key, line)) if lines else None
+                future = reactor.submit(port, commands, timeout, priority, on_line)
+                future.add_done_callback(lambda future, key=key: reply(key, future))
+
+
+class _Shard:
+    """A worker process, its pipe and the requests it has not answered."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.ports = []
+        self.process = None
+        self.conn = None
+        self.pending = {}  # key -> (future, port, commands)
+        self.on_line = {}  # key -> callback of the display lines
+        self.lock = threading.Lock()
+
+
+class Fleet:
+    """
+    Worker processes running the commands of many devices.
+
+    :param ports: devices to own from the start (more are added on first use)
+    :param workers: number of worker processes, default one per core
+    :param timeout: default time to wait for an answer (seconds)
+    :param state: name of a zuss.state table the workers publish to
+    """
+
+    def __init__(self, ports=(), workers: int = None, timeout: float = TIMEOUT,
+                 window: int = WINDOW, lock_timeout: float = LOCK_TIMEOUT, state: str = None):
+        self.timeout = timeout
+        self.state = state
+        self.window = window
+        self.lock_timeout = lock_timeout
+        self.restarts = 0
+        # spawn: forking a process with threads running is not safe
+        self._context = multiprocessing.get_context("spawn")
+        self._shards = [_Shard(index) for index in range(workers or os.cpu_count() or 1)]
+        self._owner = {}
+        self._keys = itertools.count()
+        self._lock = threading.Lock()
+        self._wake_r, self._wake_w = self._context.Pipe(duplex=False)
+        self._thread = None
+        self._running = False
+        for index, port in enumerate(sorted(set(ports))):
+            shard = self._shards[index % len(self._shards)]
+            shard.ports.append(port)
+            self._owner[port] = shard
+
+    def start(self):
+        if self._thread is None:
+            for shard in self._shards:
+                self._spawn(shard)
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="zuss-fleet", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._wake_w.send(None)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for shard in self._shards:
+            with shard.lock:
+                try:
+                    shard.conn.send(None)
+                except (OSError, ValueError):
+                    pass
+            shard.process.join(5)
+            if shard.process.is_alive():
+                shard.process.kill()
+                shard.process.join()
+            self._fail(shard)
+            shard.conn.close()
+        self._wake_r.close()
+        self._wake_w.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _spawn(self, shard: _Shard):
+        conn, child = self._context.Pipe()
+        shard.process = self._context.Process(
+            target=_serve,
+            args=(child, list(shard.ports), self.timeout, self.window, self.lock_timeout,
+                  self.state),
+            name=f"zuss-fleet-{shard.index}",
+            daemon=True,
+        )
+        shard.process.start()
+        child.close()
+        shard.conn = conn
+
+    def _shard(self, port: str) -> _Shard:
+        with self._lock:
+            shard = self._owner.get(port)
+            if shard is None:
+                # a new device goes to the worker with the fewest
+                shard = min(self._shards, key=lambda s: len(s.ports))
+                shard.ports.append(port)
+                self._owner[port] = shard
+            return shard
+
+    def _send(self, port: str, message, commands, on_line=None) -> Future:
+        shard = self._shard(port)
+        future = Future()
+        key = next(self._keys)
+        with shard.lock:
+            shard.pending[key] = (future, port, commands)
+            if on_line is not None:
+                shard.on_line[key] = on_line
+            try:
+                shard.conn.send((message[0], key, port) + message[1:])
+            except (OSError, ValueError):
+                # the worker died, answered with CLOSED once it is noticed
+                pass
+        return future
+
+    def submit(self, port: str, commands, timeout: float = None, priority: int = None,
+               on_line=None) -> Future:
+        """
+        Like Reactor.submit(), run by the worker owning ``port``; ``on_line``
+        is called in the thread of the fleet.
+        """
+        commands = list(commands)
+        return self._send(port, ("submit", commands, timeout, priority, on_line is not None),
+                          commands, on_line)
+
+    def pipeline(self, port: str, commands, timeout: float = None):
+        return self.submit(port, commands, timeout).result()
+
+    def add(self, port: str) -> bool:
+        """Open ``port`` in its worker now."""
+        return self._send(port, ("add",), None).result()
+
+    def ports(self):
+        with self._lock:
+            return sorted(self._owner)
+
+    def session(self, port: str, timeout: float = None) -> ReactorSession:
+        """A Session for the blocking SDK functions, see Reactor.session()."""
+        return ReactorSession(self, port, timeout)
+
+    def _run(self):
+        while self._running:
+            ready = {self._wake_r: None}
+            for shard in self._shards:
+                ready[shard.conn] = shard
+                ready[shard.process.sentinel] = shard
+            for handle in wait(list(ready)):
+                shard = ready[handle]
+                if handle is self._wake_r:
+                    self._wake_r.recv()
+                elif handle is shard.conn:
+                    self._receive(shard)
+                elif self._running and not shard.process.is_alive():
+                    self._restart(shard)
+
+    def _receive(self, shard: _Shard):
+        try:
+            while shard.conn.poll():
+                key, result, records, outcomes = shard.conn.recv()
+                if records is None:
+                    # a display line, the answer follows
+                    with shard.lock:
+                        on_line = shard.on_line.get(key)
+                    if on_line is not None:
+                        on_line(result)
+                    continue
+                for values in records:
+                    metrics.emit(metrics.CommandRecord.from_dict(values))
+                with shard.lock:
+                    future, port, commands = shard.pending.pop(key)
+                    shard.on_line.pop(key, None)
+                if commands is not None:
+                    # the observers ran in the worker, the cache is here
+                    for (request, _), line in zip(commands, result):
+                        if line is not None:
+                            RESULTS.changed(device_name(port), request)
+                future.outcomes = outcomes
+                future.set_result(result)
+        except (EOFError, OSError):
+            # the sentinel tells the rest
+            pass
+
+    def _fail(self, shard: _Shard):
+        with shard.lock:
+            pending, shard.pending = shard.pending, {}
+            shard.on_line.clear()
+        self._closed(pending)
+
+    @staticmethod
+    def _closed(pending):
+        for future, port, commands in pending.values():
+            if commands is None:
+                future.set_result(False)
+                continue
+            for request, _ in commands:
+                record = metrics.CommandRecord(frame_name(request), device_name(port))
+                record.outcome = metrics.CLOSED
+                metrics.emit(record)
+            future.outcomes = [metrics.CLOSED] * len(commands)
+            future.set_result([None] * len(commands))
+
+    def _restart(self, shard: _Shard):
+        self._receive(shard)
+        logger.warning("worker %d exited with %s, restarting",
+                       shard.index, shard.process.exitcode)
+        with shard.lock:
+            pending, shard.pending = shard.pending, {}
+            shard.on_line.clear()
+            shard.conn.close()
+            self._spawn(shard)
+        self._closed(pending)
+        self.restarts += 1
@@ -0,0 +1,85 @@
+# -----------------------------------------------------------------------------
+# - File              fleet_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    fleet_unittest
+# - Brief             fleet_unittest for the worker process fleet
+# -----------------------------------------------------------------------------
+import unittest
+
+import zuss
+from zuss import metrics
+from zuss.cache import RESULTS
+from zuss.fleet import Fleet
+from zuss.session import Session
+from zuss.simulator import Simulator
+
+GET_HOST = (b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")
+
+
+class TestFleet(unittest.TestCase):
+    def test_shards(self):
+        records = []
+        metrics.add_hook(records.append)
+        try:
+            with Simulator(latency=0.001) as simulator:
+                ports = [simulator.add_switch().port for _ in range(6)]
+                converter = simulator.add_converter().port
+                with Fleet(ports, workers=2) as fleet:
+                    futures = [fleet.submit(port, [GET_HOST] * 10) for port in ports]
+                    answers = [future.result(20) for future in futures]
+                    self.assertTrue(zuss.set_host_port(fleet.session(ports[0]), 4))
+                    self.assertEqual(4, zuss.get_host_port(fleet.session(ports[0])))
+                    # added on first use
+                    self.assertTrue(fleet.pipeline(converter, [(b"<GET_OP_MODE{}>", "[GET_OP_MODE{")]))
+                    self.assertEqual(sorted(ports + [converter]), fleet.ports())
+        finally:
+            metrics.remove_hook(records.append)
+        self.assertTrue(all(all(lines) for lines in answers))
+        # the records of the workers are published here
+        self.assertEqual(61, sum(r.name == "GET_HOST_PORT" and r.outcome == metrics.OK
+                                 for r in records))
+
+    def test_stream(self):
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            with Session(port) as session:
+                expected = list(session.stream(b"<DISP_CONFIG{}>", "[DISP_CONFIG{ok}]"))
+            with Fleet([port], workers=1) as fleet:
+                lines = fleet.session(port).stream(b"<DISP_CONFIG{}>", "[DISP_CONFIG{ok}]")
+                self.assertEqual(expected, list(lines))
+        self.assertTrue(expected)
+
+    def test_cache_dropped_by_worker_reboot(self):
+        records = []
+        metrics.add_hook(records.append)
+        self.addCleanup(metrics.remove_hook, records.append)
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            # answers of a device an earlier test had on this pty
+            RESULTS.clear()
+            with Fleet([port], workers=1) as fleet:
+                session = fleet.session(port)
+                zuss.get_version(session)
+                zuss.get_version(session)
+                self.assertTrue(zuss.reboot_sys(session))
+                zuss.get_version(session)
+        self.assertEqual(["GET_SW_VERSION", "REBOOT_SYS", "GET_SW_VERSION"],
+                         [record.name for record in records])
+
+    def test_restart(self):
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            with Fleet([port], workers=1) as fleet:
+                self.assertTrue(fleet.pipeline(port, [GET_HOST])[0])
+                fleet._shards[0].process.kill()
+                fleet._shards[0].process.join()
+                # failed or answered by the new worker, never stuck
+                fleet.pipeline(port, [GET_HOST], 2)
+                self.assertTrue(fleet.pipeline(port, [GET_HOST])[0])
+                self.assertEqual(1, fleet.restarts)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# -----------------------------------------------------------------------------
+# - File              frames.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Parsing of the frames and display lines of the devices
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Parsing shared by the switch and the converter SDK.
+
+The ``DISP_*`` commands answer with display lines before their ``{ok}`` frame,
+:func:`parse_display` turns one into a :class:`Display` record::
+
+    >>> parse_display("ETH1: speed=1000 link=up")
+    Display(text='ETH1: speed=1000 link=up', port='ETH1', values={'speed': 1000, 'link': 'up'})
+
+Numbers become int, anything else stays a str; a line without ``key=value``
+items only has its text.
+
+The answer frames of the getters become immutable records with int and enum
+fields, the SDK functions of both devices return them::
+
+    >>> parse_setting("[GET_BRR_ROLE{2,1,0}]", Role)
+    Setting(port=2, config=<Role.SLAVE: 1>, active=<Role.MASTER: 0>)
+
+A device answers a getter with the same few frames over and over, so the
+records are cached by frame: polling allocates no new strings or lists.
+"""
+
+import enum
+import functools
+from collections import namedtuple
+
+Display = namedtuple("Display", "text port values")
+# GET_ETH_SPEED, GET_BRR_DOWN, ...: value in RAM and the one in use
+Setting = namedtuple("Setting", "port config active")
+# GET_OP_MODE: program mode enabled, mode in RAM, mode in use
+OpMode = namedtuple("OpMode", "enable config status")
+# GET_RELAY, GET_POWER
+Control = namedtuple("Control", "index control")
+
+# answers of the converter getters when the device did not answer
+UNKNOWN_SETTING = Setting(-1, -1, -1)
+UNKNOWN_OP_MODE = OpMode(-1, -1, -1)
+
+# frames parsed to records, per parser
+CACHE_SIZE = 256
+
+
+class Role(enum.IntEnum):
+    MASTER = 0
+    SLAVE = 1
+
+
+class BrrMode(enum.IntEnum):
+    IEEE = 0
+    LEGACY = 1
+
+
+def _number(value: str):
+    try:
+        return int(value, 0)
+    except ValueError:
+        return value
+
+
+def parse_display(line: str) -> Display:
+    """``ETH1: speed=1000 link=up`` -> port ``ETH1``, values ``{speed: 1000, link: up}``"""
+    text = line.strip()
+    port, colon, rest = text.partition(":")
+    if not colon or "=" in port or " " in port:
+        port, rest = None, text
+    values = {}
+    for item in rest.split():
+        key, equals, value = item.partition("=")
+        if equals:
+            values[key] = _number(value)
+    return Display(text, port, values)
+
+
+def frame_value(line: str) -> str:
+    """``[GET_HOST_PORT{2}]`` -> ``2``"""
+    return line[line.index("{") + 1 : line.rindex("}")]
+
+
+def _ints(line: str):
+    return [int(value, 0) for value in frame_value(line).split(",")]
+
+
+def _typed(kind, value: int):
+    try:
+        return kind(value)
+    except ValueError:
+        # -1 (not configured) or a value newer firmware added
+        return value
+
+
+@functools.lru_cache(CACHE_SIZE)
+def parse_int(line: str) -> int:
+    """``[GET_RELAY_MASK{0x5}]`` -> 5"""
+    return int(frame_value(line), 0)
+
+
+@functools.lru_cache(CACHE_SIZE)
+def parse_control(line: str) -> Control:
+    """``[GET_RELAY{2,1}]`` -> Control(2, 1)"""
+    return Control(*_ints(line))
+
+
+@functools.lru_cache(CACHE_SIZE)
+def parse_setting(line: str, kind=int) -> Setting:
+    """``[GET_ETH_SPEED{1,100,1000}]`` -> Setting(1, 100, 1000), values as ``kind``"""
+    port, config, active = _ints(line)
+    return Setting(port, _typed(kind, config), _typed(kind, active))
+
+
+@functools.lru_cache(CACHE_SIZE)
+def parse_op_mode(line: str) -> OpMode:
+    """``[GET_OP_MODE{1,2,0}]`` -> OpMode(1, 2, 0)"""
+    return OpMode(*_ints(line))
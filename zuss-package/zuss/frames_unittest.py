@@ -0,0 +1,57 @@
+# -----------------------------------------------------------------------------
+# - File              frames_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    frames_unittest
+# - Brief             frames_unittest for the parsing of device output
+# -----------------------------------------------------------------------------
+import unittest
+
+from zuss import *
+from zuss.frames import (
+    BrrMode, Control, Display, OpMode, Role, Setting, parse_control, parse_display, parse_int,
+    parse_op_mode, parse_setting,
+)
+
+
+class TestDisplay(unittest.TestCase):
+    def test_port_line(self):
+        self.assertEqual(
+            Display("ETH1: speed=1000 link=up", "ETH1", {"speed": 1000, "link": "up"}),
+            parse_display("ETH1: speed=1000 link=up\r\n"),
+        )
+
+    def test_setting_line(self):
+        display = parse_display("relay_mask=0x5")
+        self.assertIsNone(display.port)
+        self.assertEqual({"relay_mask": 5}, display.values)
+
+    def test_text_line(self):
+        self.assertEqual(Display("Version: v1.0", "Version", {}), parse_display("Version: v1.0"))
+
+    def test_records(self):
+        self.assertEqual(5, parse_int("[GET_RELAY_MASK{0x5}]\r\n"))
+        self.assertEqual(Control(2, 1), parse_control("[GET_RELAY{2,1}]"))
+        self.assertEqual(OpMode(1, 2, 0), parse_op_mode("[GET_OP_MODE{1,2,0}]"))
+        setting = parse_setting("[GET_BRR_MODE{1,1,0}]", BrrMode)
+        self.assertEqual(Setting(1, BrrMode.LEGACY, BrrMode.IEEE), setting)
+        self.assertIs(BrrMode.LEGACY, setting.config)
+
+    def test_unknown_enum_value(self):
+        self.assertEqual(Setting(1, -1, Role.SLAVE), parse_setting("[GET_BRR_ROLE{1,-1,1}]", Role))
+
+    def test_records_are_cached(self):
+        line = "[GET_ETH_SPEED{1,100,1000}]"
+        self.assertIs(parse_setting(line), parse_setting(line))
+
+    def test_stream_config(self):
+        self.assertTrue(set_host_port("fake://switch/frames", 3))
+        values = {}
+        for display in stream_config("fake://switch/frames"):
+            values.update(display.values)
+        self.assertEqual(3, values["host_port"])
+
+
+if __name__ == "__main__":
+    unittest.main()
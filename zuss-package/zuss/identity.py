@@ -0,0 +1,219 @@
+# -----------------------------------------------------------------------------
+# - File              identity.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Stable device names across tty renames
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+After a USB reset ``/dev/ttyUSB3`` may come back as ``/dev/ttyUSB7``.  A device
+named by the serial number of its USB adapter keeps its name::
+
+    zuss.set_host_port("usb-serial://A50285BI", 2)
+
+    identity("/dev/ttyUSB3")        # -> "usb-serial://A50285BI"
+    resolve("usb-serial://A50285BI")  # -> "/dev/ttyUSB7"
+
+The serial number of a tty is read from sysfs once per tty device and cached;
+a name which is not found, or whose tty is gone, looks at the ttys again.
+Sessions opened by serial number are watched: a thread compares the links in
+``/sys/class/tty`` every ``POLL`` seconds (sysfs sends no inotify events) and
+reopens a session on its new tty, reading only the ttys which changed.
+
+``python -m zuss.identity`` lists the serial numbers and their ttys.  Linux
+only; elsewhere a serial number is never found.
+"""
+
+import logging
+import os
+import threading
+import weakref
+
+SCHEME = "usb-serial://"
+SYSFS = "/sys/class/tty"
+DEV = "/dev/"
+# time between two looks at the ttys of the system (seconds)
+POLL = 1.0
+
+logger = logging.getLogger("zuss.identity")
+
+_lock = threading.Lock()
+_serials = {}  # sysfs link of a tty -> serial number, None for no USB device
+_ports = {}  # serial number -> tty name
+_watcher = None
+
+
+def _tty(port: str) -> str:
+    return port[len(DEV):] if port.startswith(DEV) else os.path.basename(port)
+
+
+def _links() -> dict:
+    """{tty name: sysfs link} of the ttys backed by a device."""
+    links = {}
+    try:
+        names = os.listdir(SYSFS)
+    except OSError:
+        return links
+    for name in names:
+        try:
+            links[name] = os.readlink(os.path.join(SYSFS, name))
+        except OSError:
+            # a plain directory on old kernels, never a USB serial port
+            pass
+    return links
+
+
+def _read_serial(name: str):
+    device = os.path.realpath(os.path.join(SYSFS, name, "device"))
+    # interface -> USB device; two levels for adapters with a hub inside
+    for _ in range(3):
+        try:
+            with open(os.path.join(device, "serial")) as f:
+                return f.read().strip() or None
+        except OSError:
+            device = os.path.dirname(device)
+    return None
+
+
+def _serial(name: str, link: str):
+    serial = _serials.get(link, False)
+    if serial is False:
+        serial = _serials[link] = _read_serial(name)
+    return serial
+
+
+def _scan(links: dict = None) -> dict:
+    """Rebuild the serial number map, reading only ttys not seen before."""
+    links = _links() if links is None else links
+    known = set(links.values())
+    for link in [link for link in _serials if link not in known]:
+        del _serials[link]
+    ports = {}
+    for name, link in links.items():
+        serial = _serial(name, link)
+        if serial is not None:
+            ports.setdefault(serial, name)
+    _ports.clear()
+    _ports.update(ports)
+    return ports
+
+
+def serials() -> dict:
+    """{serial number: tty path} of the attached USB serial devices."""
+    with _lock:
+        return {serial: DEV + name for serial, name in sorted(_scan().items())}
+
+
+def usb_serial(port: str):
+    """The USB serial number behind tty ``port``, None if there is none."""
+    name = _tty(port)
+    try:
+        link = os.readlink(os.path.join(SYSFS, name))
+    except OSError:
+        return None
+    with _lock:
+        return _serial(name, link)
+
+
+def identity(port: str) -> str:
+    """``/dev/ttyUSB3`` -> ``usb-serial://<serial>``, ``port`` itself without one."""
+    serial = usb_serial(port)
+    return port if serial is None else SCHEME + serial
+
+
+def resolve(port):
+    """The tty of a ``usb-serial://`` name, None if the device is not attached;
+    any other port is returned as it is."""
+    if not isinstance(port, str) or not port.startswith(SCHEME):
+        return port
+    serial = port[len(SCHEME):]
+    with _lock:
+        name = _ports.get(serial)
+        if name is None or not os.path.lexists(os.path.join(SYSFS, name)):
+            name = _scan().get(serial)
+    return None if name is None else DEV + name
+
+
+def watch(session):
+    """Reopen ``session`` on the new tty of its device when it moves or comes back."""
+    global _watcher
+    with _lock:
+        if _watcher is None:
+            _watcher = Watcher()
+        _watcher.sessions.add(session)
+    _watcher.start()
+
+
+def unwatch(session):
+    if _watcher is not None:
+        _watcher.sessions.discard(session)
+
+
+class Watcher:
+    """Thread rebinding the sessions of moved devices, see :func:`watch`."""
+
+    def __init__(self, poll: float = POLL):
+        self.poll = poll
+        self.sessions = weakref.WeakSet()
+        self.changes = 0
+        self._links = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._links = _links()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="zuss-identity",
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> bool:
+        """Look at the ttys once, True if any came or went."""
+        links = _links()
+        if links == self._links:
+            return False
+        self._links = links
+        self.changes += 1
+        with _lock:
+            _scan(links)
+        for session in list(self.sessions):
+            device = resolve(session.port)
+            if device != session.device:
+                logger.info("%s moved from %s to %s", session.port, session.device, device)
+                session.rebind()
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.poll):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("checking the ttys failed")
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="zuss.identity",
+                                     description="List the USB serial numbers of the ttys")
+    parser.parse_args(argv)
+    for serial, port in serials().items():
+        print(f"{SCHEME + serial:40} {port}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
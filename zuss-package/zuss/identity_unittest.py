@@ -0,0 +1,120 @@
+# -----------------------------------------------------------------------------
+# - File              identity_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    identity_unittest
+# - Brief             identity_unittest for devices named by USB serial number
+# -----------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from zuss import *
+from zuss import identity
+from zuss.session import Session
+
+
+class TestIdentity(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        os.makedirs(os.path.join(self.root, "class", "tty"))
+        # a tty without a device, like the virtual consoles
+        os.makedirs(os.path.join(self.root, "devices", "virtual", "tty0"))
+        self.link("tty0", os.path.join(self.root, "devices", "virtual", "tty0"))
+        self.watcher = identity.Watcher(poll=3600)
+        self.addCleanup(self.watcher.stop)
+        for name, value in (("SYSFS", os.path.join(self.root, "class", "tty")),
+                            ("DEV", "fake://switch/identity-"),
+                            ("_serials", {}), ("_ports", {}), ("_watcher", self.watcher)):
+            patcher = mock.patch.object(identity, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def link(self, name, target):
+        os.symlink(target, os.path.join(self.root, "class", "tty", name))
+
+    def plug(self, name, serial, usb="1-2"):
+        """A USB adapter with ``serial`` on USB port ``usb`` appears as ``name``."""
+        device = os.path.join(self.root, "devices", "usb1", usb)
+        tty = os.path.join(device, usb + ":1.0", name)
+        os.makedirs(tty)
+        with open(os.path.join(device, "serial"), "w") as f:
+            f.write(serial + "\n")
+        os.symlink("..", os.path.join(tty, "device"))
+        self.link(name, tty)
+
+    def unplug(self, name, usb="1-2"):
+        os.unlink(os.path.join(self.root, "class", "tty", name))
+        shutil.rmtree(os.path.join(self.root, "devices", "usb1", usb))
+
+    def test_resolve(self):
+        self.plug("ttyUSB3", "A50285BI")
+        self.assertEqual("fake://switch/identity-ttyUSB3", identity.resolve("usb-serial://A50285BI"))
+        self.assertIsNone(identity.resolve("usb-serial://B00000"))
+        self.assertEqual("/dev/ttyUSB0", identity.resolve("/dev/ttyUSB0"))
+        self.assertEqual({"A50285BI": "fake://switch/identity-ttyUSB3"}, identity.serials())
+
+    def test_identity(self):
+        self.plug("ttyUSB3", "A50285BI")
+        self.assertEqual("usb-serial://A50285BI", identity.identity("/dev/ttyUSB3"))
+        self.assertEqual("/dev/tty0", identity.identity("/dev/tty0"))
+        self.assertEqual("/dev/ttyS9", identity.identity("/dev/ttyS9"))
+
+    def test_serial_read_once(self):
+        self.plug("ttyUSB3", "A50285BI")
+        identity.serials()
+        with mock.patch.object(identity, "_read_serial") as read:
+            identity.serials()
+            identity.resolve("usb-serial://A50285BI")
+            read.assert_not_called()
+
+    def test_moved_device_found(self):
+        self.plug("ttyUSB3", "A50285BI")
+        identity.resolve("usb-serial://A50285BI")
+        self.unplug("ttyUSB3")
+        self.plug("ttyUSB7", "A50285BI", usb="1-3")
+        self.assertEqual("fake://switch/identity-ttyUSB7", identity.resolve("usb-serial://A50285BI"))
+
+    def test_session_rebinds(self):
+        self.plug("ttyUSB3", "A50285BI")
+        session = Session("usb-serial://A50285BI", timeout=0.5).open()
+        self.addCleanup(session.close)
+        self.assertEqual("fake://switch/identity-ttyUSB3", session.device)
+        self.assertTrue(set_host_port(session, 2))
+        self.assertFalse(self.watcher.check())
+
+        self.unplug("ttyUSB3")
+        self.assertTrue(self.watcher.check())
+        self.assertFalse(session.is_open)
+
+        self.plug("ttyUSB7", "A50285BI", usb="1-3")
+        self.assertTrue(self.watcher.check())
+        self.assertEqual("fake://switch/identity-ttyUSB7", session.device)
+        self.assertTrue(set_host_port(session, 3))
+
+    def test_closed_session_not_watched(self):
+        self.plug("ttyUSB3", "A50285BI")
+        session = Session("usb-serial://A50285BI").open()
+        session.close()
+        self.unplug("ttyUSB3")
+        self.plug("ttyUSB7", "A50285BI", usb="1-3")
+        self.watcher.check()
+        self.assertFalse(session.is_open)
+
+    def test_not_attached(self):
+        session = Session("usb-serial://A50285BI").open()
+        self.addCleanup(session.close)
+        self.assertFalse(session.is_open)
+        self.assertFalse(get_host_port(session))
+        # opened as soon as it is plugged in
+        self.plug("ttyUSB0", "A50285BI")
+        self.watcher.check()
+        self.assertTrue(session.is_open)
+
+
+if __name__ == "__main__":
+    unittest.main()
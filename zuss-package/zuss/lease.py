@@ -0,0 +1,382 @@
+# -----------------------------------------------------------------------------
+# - File              lease.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Leases of shared switches, converters and switch ports
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Test jobs sharing a lab reserve what they use for a while::
+
+    from zuss.lease import LeaseManager
+
+    leases = LeaseManager()
+    with leases.acquire("/dev/ttyUSB0", host_ports=[2], ttl=300) as lease:
+        with lease.session() as session:
+            ...
+        lease.renew()
+
+A lease covers a whole device, or some host and device ports of a switch, and
+ends with release(), after ``ttl`` seconds without renew(), or when the
+holding process dies.  Jobs waiting for the same things get them in the order
+they asked; they sleep until a release, an expiry or the death of a holder,
+nothing polls the database.
+
+The leases are kept in the SQLite file ``$ZUSS_LEASE_DB``, by default
+``leases.sqlite3`` in the lock directory of zuss.lock, shared by all
+processes of the machine.  ``python -m zuss.lease`` lists them.
+"""
+
+import os
+import select
+import sqlite3
+import threading
+import time
+import uuid
+
+from zuss import lock
+
+# default lease time (seconds)
+TTL = 300
+# how often a dead holder is noticed without os.pidfd_open (seconds)
+DEAD_CHECK = 1.0
+
+DEVICE = "*"
+
+# files of the leases shared by all users; the FIFOs only need to be written
+DB_MODE = 0o666
+FIFO_MODE = 0o622
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    token TEXT, device TEXT, resource TEXT, pid INTEGER, holder TEXT, expires REAL
+);
+CREATE INDEX IF NOT EXISTS leases_device ON leases (device);
+CREATE TABLE IF NOT EXISTS waiters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, device TEXT, resources TEXT, pid INTEGER, fifo TEXT
+);
+"""
+
+
+def default_path() -> str:
+    return os.environ.get("ZUSS_LEASE_DB") or os.path.join(lock.LOCK_DIR, "leases.sqlite3")
+
+
+def resources(host_ports=(), device_ports=()) -> tuple:
+    """The reserved parts of a device, ``("*",)`` for all of it."""
+    parts = tuple(f"host:{port}" for port in host_ports) + tuple(
+        f"device:{port}" for port in device_ports
+    )
+    return tuple(sorted(set(parts))) or (DEVICE,)
+
+
+def _conflict(a, b) -> bool:
+    return DEVICE in a or DEVICE in b or not set(a).isdisjoint(b)
+
+
+def _share(path: str, mode: int):
+    """Give ``path`` its ``mode`` despite the umask; only the owner may."""
+    try:
+        os.chmod(path, mode)
+    except (FileNotFoundError, PermissionError):
+        pass
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # another user's process
+        pass
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # exited, only not yet waited for by its parent
+            return f.read().rpartition(")")[2].split()[0] != "Z"
+    except (OSError, IndexError):
+        return True
+
+
+class Lease:
+    """A granted lease, also a context manager releasing it."""
+
+    def __init__(self, manager, token: str, device: str, parts: tuple, holder: str,
+                 ttl: float, expires: float):
+        self.manager = manager
+        self.token = token
+        self.device = device
+        self.resources = parts
+        self.holder = holder
+        self.ttl = ttl
+        self.expires = expires
+
+    def __repr__(self):
+        return f"<Lease {self.device} {','.join(self.resources)} {self.holder}>"
+
+    @property
+    def remaining(self) -> float:
+        """Seconds until the lease expires unless renewed."""
+        return self.expires - time.time()
+
+    def renew(self, ttl: float = None) -> bool:
+        """Extend by ``ttl`` (default: the ttl it was taken with) from now,
+        False if the lease already expired."""
+        return self.manager.renew(self, ttl)
+
+    def release(self):
+        self.manager.release(self)
+
+    def session(self, **kwargs):
+        """A zuss.session.Session of the leased device."""
+        from zuss.session import Session
+
+        return Session(self.device, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class LeaseManager:
+    """
+    Leases in one SQLite file, thread safe.
+
+    :param path: database file, default ``$ZUSS_LEASE_DB``
+    :param holder: name shown to other jobs, default ``<host>:<pid>``
+    """
+
+    def __init__(self, path: str = None, holder: str = None):
+        self.path = path or default_path()
+        self.holder = holder or f"{os.uname().nodename}:{os.getpid()}"
+        directory = os.path.dirname(os.path.abspath(self.path))
+        if directory == os.path.abspath(lock.LOCK_DIR):
+            # shared with the port locks of all users
+            lock.make_lock_dir()
+        os.makedirs(directory, exist_ok=True)
+        # SQLite creates its -journal and -wal files with the mode of the database
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, DB_MODE))
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            _share(self.path + suffix, DB_MODE)
+        self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def _transaction(self, work):
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(self._db)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            return result
+
+    @staticmethod
+    def _expire(db, device: str, now: float):
+        """Drop the leases and waiters of ``device`` whose time or process ended."""
+        for table, column in (("leases", "token"), ("waiters", "id")):
+            for key, pid in db.execute(f"SELECT DISTINCT {column}, pid FROM {table} "
+                                       "WHERE device = ?", (device,)).fetchall():
+                if not _alive(pid):
+                    db.execute(f"DELETE FROM {table} WHERE {column} = ?", (key,))
+        db.execute("DELETE FROM leases WHERE device = ? AND expires <= ?", (device, now))
+
+    @staticmethod
+    def _blockers(db, device: str, parts: tuple, before: int = None):
+        """Conflicting leases [(pid, expires)] and pids of waiters queued earlier."""
+        leases = [
+            (pid, expires)
+            for resource, pid, expires in db.execute(
+                "SELECT resource, pid, expires FROM leases WHERE device = ?", (device,))
+            if _conflict(parts, (resource,))
+        ]
+        query, args = "SELECT resources, pid FROM waiters WHERE device = ?", (device,)
+        if before is not None:
+            query, args = query + " AND id < ?", (device, before)
+        waiters = [pid for queued, pid in db.execute(query, args)
+                   if _conflict(parts, tuple(queued.split(",")))]
+        return leases, waiters
+
+    def _try(self, device, parts, token, ttl, waiter):
+        def work(db):
+            now = time.time()
+            self._expire(db, device, now)
+            leases, waiters = self._blockers(db, device, parts, waiter)
+            # a new request (waiter None) queues behind every waiter it conflicts with
+            if leases or waiters:
+                return None, leases, waiters
+            expires = now + ttl
+            db.executemany(
+                "INSERT INTO leases VALUES (?, ?, ?, ?, ?, ?)",
+                [(token, device, part, os.getpid(), self.holder, expires) for part in parts],
+            )
+            if waiter is not None:
+                db.execute("DELETE FROM waiters WHERE id = ?", (waiter,))
+            return expires, leases, waiters
+
+        return self._transaction(work)
+
+    def acquire(self, device: str, host_ports=(), device_ports=(), ttl: float = TTL,
+                timeout: float = None):
+        """
+        Lease ``device``, or only the given ports of a switch, for ``ttl`` seconds.
+
+        :param timeout: seconds to wait, None: forever, 0: not at all
+        :return: the Lease, None if it was not granted in time
+        """
+        parts = resources(host_ports, device_ports)
+        token = uuid.uuid4().hex
+        expires, _, _ = self._try(device, parts, token, ttl, None)
+        if expires is not None:
+            return Lease(self, token, device, parts, self.holder, ttl, expires)
+        if timeout == 0:
+            return None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        return self._wait(device, parts, token, ttl, deadline)
+
+    def _wait(self, device, parts, token, ttl, deadline):
+        fifo = os.path.join(os.path.dirname(os.path.abspath(self.path)),
+                            f"lease-{token}.fifo")
+        os.mkfifo(fifo, FIFO_MODE)
+        # others wake us through it, the umask applies to mkfifo
+        _share(fifo, FIFO_MODE)
+        # our own writer keeps the reader from seeing end of file
+        reader = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+        writer = os.open(fifo, os.O_WRONLY)
+        waiter = None
+        try:
+            waiter = self._transaction(lambda db: db.execute(
+                "INSERT INTO waiters (device, resources, pid, fifo) VALUES (?, ?, ?, ?)",
+                (device, ",".join(parts), os.getpid(), fifo)).lastrowid)
+            while True:
+                expires, leases, waiters = self._try(device, parts, token, ttl, waiter)
+                if expires is not None:
+                    waiter = None
+                    return Lease(self, token, device, parts, self.holder, ttl, expires)
+                pause = None if deadline is None else deadline - time.monotonic()
+                if pause is not None and pause <= 0:
+                    return None
+                ends = [end - time.time() for _, end in leases]
+                if ends:
+                    pause = min(ends) if pause is None else min(pause, min(ends))
+                pidfds = []
+                try:
+                    for pid in {pid for pid, _ in leases} | set(waiters):
+                        if pid == os.getpid():
+                            continue
+                        if not hasattr(os, "pidfd_open"):
+                            pause = DEAD_CHECK if pause is None else min(pause, DEAD_CHECK)
+                            break
+                        try:
+                            pidfds.append(os.pidfd_open(pid))
+                        except ProcessLookupError:
+                            pause = 0
+                    select.select([reader] + pidfds, [], [], None if pause is None else max(pause, 0))
+                finally:
+                    for fd in pidfds:
+                        os.close(fd)
+                try:
+                    os.read(reader, 512)
+                except BlockingIOError:
+                    pass
+        finally:
+            if waiter is not None:
+                # leaving the queue may let the ones behind go
+                self._transaction(
+                    lambda db: db.execute("DELETE FROM waiters WHERE id = ?", (waiter,)))
+                self._wake(device)
+            os.close(reader)
+            os.close(writer)
+            os.unlink(fifo)
+
+    def _wake(self, device: str):
+        with self._lock:
+            fifos = [row[0] for row in self._db.execute(
+                "SELECT fifo FROM waiters WHERE device = ? ORDER BY id", (device,))]
+        for fifo in fifos:
+            try:
+                fd = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError:
+                # the waiter is gone
+                continue
+            try:
+                os.write(fd, b"\0")
+            except BlockingIOError:
+                # already woken
+                pass
+            finally:
+                os.close(fd)
+
+    def renew(self, lease: Lease, ttl: float = None) -> bool:
+        ttl = lease.ttl if ttl is None else ttl
+
+        def work(db):
+            now = time.time()
+            return db.execute("UPDATE leases SET expires = ? WHERE token = ? AND expires > ?",
+                              (now + ttl, lease.token, now)).rowcount, now + ttl
+
+        updated, expires = self._transaction(work)
+        if updated:
+            lease.expires = expires
+            lease.ttl = ttl
+        return bool(updated)
+
+    def release(self, lease: Lease):
+        self._transaction(
+            lambda db: db.execute("DELETE FROM leases WHERE token = ?", (lease.token,)))
+        self._wake(lease.device)
+
+    def leases(self, device: str = None):
+        """The current leases [(device, resources, holder, seconds left)]."""
+        now = time.time()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT token, device, resource, holder, expires, pid FROM leases "
+                "WHERE expires > ? ORDER BY device, token", (now,)).fetchall()
+        found = {}
+        for token, name, resource, holder, expires, pid in rows:
+            if (device is None or name == device) and _alive(pid):
+                entry = found.setdefault(token, [name, [], holder, expires - now])
+                entry[1].append(resource)
+        return [(name, tuple(parts), holder, left) for name, parts, holder, left in found.values()]
+
+    def waiting(self, device: str = None) -> int:
+        """Number of queued requests."""
+        query, args = "SELECT COUNT(*) FROM waiters", ()
+        if device is not None:
+            query, args = query + " WHERE device = ?", (device,)
+        with self._lock:
+            return self._db.execute(query, args).fetchone()[0]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="zuss.lease", description="List the device leases")
+    parser.add_argument("--db", default=None, help="Lease database")
+    parser.add_argument("device", nargs="?", help="Only this device")
+    args = parser.parse_args(argv)
+    manager = LeaseManager(args.db)
+    for device, parts, holder, left in manager.leases(args.device):
+        print(f"{device:24} {','.join(parts):20} {holder:24} {left:8.0f} s")
+    manager.close()
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# -----------------------------------------------------------------------------
+# - File              lease_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    lease_unittest
+# - Brief             lease_unittest for the lease manager
+# -----------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from zuss.lease import LeaseManager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HOLD = """
+import sys, time
+from zuss.lease import LeaseManager
+lease = LeaseManager(sys.argv[1]).acquire("/dev/ttyUSB0", ttl=60)
+print("leased", flush=True)
+time.sleep(60)
+"""
+
+
+class TestLease(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "leases.sqlite3")
+        self.manager = LeaseManager(self.path)
+
+    def tearDown(self):
+        self.manager.close()
+        self.directory.cleanup()
+
+    def test_ports(self):
+        host = self.manager.acquire("/dev/ttyUSB0", host_ports=[1], timeout=0)
+        self.assertIsNotNone(host)
+        self.assertIsNotNone(self.manager.acquire("/dev/ttyUSB0", host_ports=[2], timeout=0))
+        self.assertIsNotNone(self.manager.acquire("/dev/ttyUSB0", device_ports=[1], timeout=0))
+        self.assertIsNone(self.manager.acquire("/dev/ttyUSB0", host_ports=[1], timeout=0))
+        self.assertIsNone(self.manager.acquire("/dev/ttyUSB0", timeout=0))
+        self.assertIsNotNone(self.manager.acquire("/dev/ttyUSB1", timeout=0))
+        self.assertEqual(4, len(self.manager.leases()))
+        host.release()
+        self.assertIsNotNone(self.manager.acquire("/dev/ttyUSB0", host_ports=[1], timeout=0))
+
+    def test_expiry_and_renew(self):
+        lease = self.manager.acquire("/dev/ttyUSB0", ttl=0.3)
+        self.assertTrue(lease.renew(0.3))
+        start = time.monotonic()
+        other = self.manager.acquire("/dev/ttyUSB0", timeout=5)
+        self.assertIsNotNone(other)
+        self.assertGreater(time.monotonic() - start, 0.2)
+        self.assertFalse(lease.renew())
+        self.assertIsNone(self.manager.acquire("/dev/ttyUSB0", timeout=0.1))
+
+    def test_fifo(self):
+        lease = self.manager.acquire("/dev/ttyUSB0")
+        order = []
+
+        def job(n):
+            manager = LeaseManager(self.path)
+            with manager.acquire("/dev/ttyUSB0", timeout=10):
+                order.append(n)
+            manager.close()
+
+        threads = []
+        for n in range(4):
+            threads.append(threading.Thread(target=job, args=(n,)))
+            threads[-1].start()
+            while self.manager.waiting() < n + 1:
+                time.sleep(0.005)
+        lease.release()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual([0, 1, 2, 3], order)
+
+    def test_shared_by_all_users(self):
+        path = os.path.join(self.directory.name, "shared.sqlite3")
+        umask = os.umask(0o077)
+        try:
+            manager = LeaseManager(path)
+            self.addCleanup(manager.close)
+            lease = manager.acquire("/dev/ttyUSB0")
+            waiter = threading.Thread(target=manager.acquire, args=("/dev/ttyUSB0",),
+                                      kwargs={"timeout": 10})
+            waiter.start()
+            while manager.waiting() < 1:
+                time.sleep(0.005)
+            fifos = [name for name in os.listdir(self.directory.name) if name.endswith(".fifo")]
+            modes = [os.stat(os.path.join(self.directory.name, name)).st_mode & 0o777
+                     for name in fifos]
+            lease.release()
+            waiter.join(10)
+        finally:
+            os.umask(umask)
+        self.assertEqual(0o666, os.stat(path).st_mode & 0o777)
+        self.assertEqual([0o622], modes)
+
+    def test_dead_holder(self):
+        env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+        holder = subprocess.Popen([sys.executable, "-c", HOLD, self.path],
+                                  env=env, stdout=subprocess.PIPE, text=True)
+        self.assertEqual("leased", holder.stdout.readline().strip())
+        threading.Timer(0.2, holder.kill).start()
+        start = time.monotonic()
+        self.assertIsNotNone(self.manager.acquire("/dev/ttyUSB0", timeout=10))
+        self.assertLess(time.monotonic() - start, 5)
+        holder.communicate()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+# -----------------------------------------------------------------------------
+# - File              lock.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Exclusive use of a port across threads and processes
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+A :class:`PortLock` keeps two users of one port from interleaving their frames.
+It combines a lock for the threads of this process with an advisory
+``fcntl.flock`` on ``<lock dir>/<port>.lock`` for other processes (pytest-xdist
+workers, scripts, zussd).  On systems without fcntl only the first applies.
+
+zuss.session.Session holds the lock while opening the port and for every
+pipeline, so processes take turns command batch by command batch.
+
+The lock directory is ``$ZUSS_LOCK_DIR`` or ``<tmp>/zuss-locks``, created
+sticky and writable for everyone like ``/tmp`` so the users of a shared lab
+controller can all lock; the lock files are writable for everyone too.  The
+default wait is ``$ZUSS_LOCK_TIMEOUT`` seconds (0: fail at once, "none":
+forever).
+"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+def _timeout_from_env():
+    value = os.environ.get("ZUSS_LOCK_TIMEOUT", "60")
+    return None if value.lower() in ("none", "") else float(value)
+
+
+# default time to wait for a port used by someone else (seconds), None: forever
+LOCK_TIMEOUT = _timeout_from_env()
+LOCK_DIR = os.environ.get("ZUSS_LOCK_DIR") or os.path.join(tempfile.gettempdir(), "zuss-locks")
+
+# ports which only exist inside this process need no lock file
+LOCAL_SCHEMES = ("fake://", "replay://", "loop://")
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def make_lock_dir(path: str = None):
+    """Create the lock directory (default LOCK_DIR) for all users of the machine."""
+    path = path or LOCK_DIR
+    try:
+        os.makedirs(path)
+    except FileExistsError:
+        return
+    # the umask applies to makedirs
+    os.chmod(path, 0o1777)
+
+
+def _device(port: str) -> str:
+    """The device behind ``port``: a link such as /dev/serial/by-id/... resolved."""
+    # socket:// and rfc2217:// URLs name no local file
+    if "://" in port or fcntl is None:
+        return port
+    return os.path.realpath(port)
+
+
+def lock_path(port: str) -> str:
+    """``/dev/ttyUSB0`` -> ``<lock dir>/dev_ttyUSB0.lock``"""
+    name = re.sub(r"[^A-Za-z0-9.-]+", "_", _device(port)).strip("_")
+    return os.path.join(LOCK_DIR, name + ".lock")
+
+
+class PortLock:
+    """Thread and process lock of one port, get it with :func:`port_lock`."""
+
+    def __init__(self, port: str):
+        self.port = port
+        self.path = None
+        if fcntl is not None and not port.startswith(LOCAL_SCHEMES):
+            self.path = lock_path(port)
+        self._thread_lock = threading.Lock()
+        self._fd = None
+
+    def __repr__(self):
+        return f"<PortLock {self.port}>"
+
+    def _open(self):
+        # opened per acquire, so no descriptor is held between commands
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        except FileNotFoundError:
+            make_lock_dir(os.path.dirname(self.path))
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            # the umask applies to O_CREAT; only the owner may change it
+            os.fchmod(fd, 0o666)
+        except PermissionError:
+            pass
+        return fd
+
+    def acquire(self, timeout: float = LOCK_TIMEOUT) -> bool:
+        """
+        Wait up to ``timeout`` seconds (None: forever, 0: not at all).  Raises
+        OSError if the lock file cannot be opened.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._thread_lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        if self.path is None:
+            return True
+        fd = None
+        try:
+            fd = self._open()
+            if deadline is None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                self._fd, fd = fd, None
+                return True
+            pause = 0.001
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    self._fd, fd = fd, None
+                    return True
+                except BlockingIOError:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # flock cannot wait with a timeout
+                    time.sleep(min(pause, remaining))
+                    pause = min(pause * 2, 0.02)
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        finally:
+            if fd is not None:
+                os.close(fd)
+        self._thread_lock.release()
+        return False
+
+    def release(self):
+        if self._fd is not None:
+            # closing the descriptor drops the flock
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire(None)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+def port_lock(port: str) -> PortLock:
+    """The PortLock of ``port``, one per device and process."""
+    device = _device(port)
+    with _locks_guard:
+        lock = _locks.get(device)
+        if lock is None:
+            lock = _locks[device] = PortLock(port)
+        return lock
@@ -0,0 +1,153 @@
+# -----------------------------------------------------------------------------
+# - File              lock_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    lock_unittest
+# - Brief             lock_unittest for the cross-process port lock
+# -----------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import zuss
+from zuss import lock, metrics
+from zuss.session import Session
+from zuss.simulator import Simulator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HOLD = """
+import sys, time
+from zuss.lock import port_lock
+with port_lock(sys.argv[1]):
+    print("locked", flush=True)
+    time.sleep(float(sys.argv[2]))
+"""
+
+HAMMER = """
+import sys
+import zuss
+port, value = sys.argv[1], int(sys.argv[2])
+failed = 0
+for _ in range(40):
+    failed += not zuss.set_host_port(port, value)
+    failed += zuss.get_relay_mask(port) is None
+print(failed)
+"""
+
+
+@unittest.skipIf(lock.fcntl is None, "no fcntl on this system")
+class TestPortLock(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.saved_dir, lock.LOCK_DIR = lock.LOCK_DIR, self.directory.name
+        # pty names are reused, so no PortLock of an earlier test may be found
+        self.saved_locks, lock._locks = lock._locks, {}
+        self.env = dict(os.environ, ZUSS_LOCK_DIR=self.directory.name,
+                        PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+
+    def tearDown(self):
+        lock.LOCK_DIR = self.saved_dir
+        lock._locks = self.saved_locks
+        self.directory.cleanup()
+
+    def hold(self, port: str, seconds: float):
+        process = subprocess.Popen([sys.executable, "-c", HOLD, port, str(seconds)],
+                                   env=self.env, stdout=subprocess.PIPE, text=True)
+        self.assertEqual("locked", process.stdout.readline().strip())
+        return process
+
+    def test_other_process(self):
+        port = "/dev/zuss-lock-test"
+        holder = self.hold(port, 0.3)
+        try:
+            port_lock = lock.port_lock(port)
+            self.assertFalse(port_lock.acquire(0))
+            start = time.monotonic()
+            self.assertTrue(port_lock.acquire(5))
+            self.assertGreater(time.monotonic() - start, 0.05)
+            port_lock.release()
+        finally:
+            holder.communicate()
+
+    def test_threads(self):
+        port_lock = lock.port_lock("fake://switch/lock")
+        self.assertIs(port_lock, lock.port_lock("fake://switch/lock"))
+        self.assertIsNone(port_lock.path)
+        self.assertTrue(port_lock.acquire(0))
+        self.assertFalse(port_lock.acquire(0.01))
+        port_lock.release()
+
+    def test_session_fail_fast(self):
+        records = []
+        metrics.add_hook(records.append)
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            with Session(port, lock_timeout=0) as session:
+                holder = self.hold(port, 0.3)
+                try:
+                    self.assertIsNone(session.request(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{"))
+                finally:
+                    holder.communicate()
+                session.lock_timeout = 5
+                self.assertIsNotNone(session.request(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{"))
+        metrics.remove_hook(records.append)
+        self.assertEqual([metrics.REJECTED, metrics.OK], [r.outcome for r in records])
+        self.assertGreater(records[1].lock_hold_s, 0)
+        self.assertIn("lock_hold_ms", metrics.summary(port)[port]["GET_HOST_PORT"])
+
+    def test_shared_by_all_users(self):
+        lock.LOCK_DIR = os.path.join(self.directory.name, "locks")
+        umask = os.umask(0o077)
+        try:
+            port_lock = lock.port_lock("/dev/zuss-lock-test")
+            self.assertTrue(port_lock.acquire(0))
+            port_lock.release()
+        finally:
+            os.umask(umask)
+        self.assertEqual(0o1777, os.stat(lock.LOCK_DIR).st_mode & 0o7777)
+        self.assertEqual(0o666, os.stat(port_lock.path).st_mode & 0o7777)
+
+    def test_link_to_the_device(self):
+        device = os.path.join(self.directory.name, "ttyUSB0")
+        open(device, "w").close()
+        link = os.path.join(self.directory.name, "usb-ZD_USB_Switch-if00-port0")
+        os.symlink(device, link)
+        self.assertEqual(lock.lock_path(device), lock.lock_path(link))
+        self.assertIs(lock.port_lock(device), lock.port_lock(link))
+        self.assertEqual(os.path.join(lock.LOCK_DIR, "socket_host_7000.lock"),
+                         lock.lock_path("socket://host:7000"))
+
+    def test_lock_file_unusable(self):
+        records = []
+        metrics.add_hook(records.append)
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            with Session(port) as session:
+                # the lock file cannot be opened, like one of another user
+                os.remove(lock.lock_path(port))
+                os.makedirs(lock.lock_path(port))
+                with self.assertLogs("zuss", "WARNING"):
+                    self.assertIsNone(session.request(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{"))
+                    self.assertIsNone(zuss.get_host_port(port))
+        metrics.remove_hook(records.append)
+        self.assertEqual(metrics.REJECTED, records[0].outcome)
+
+    def test_processes_share_a_port(self):
+        with Simulator(latency=0.001) as simulator:
+            port = simulator.add_switch().port
+            workers = [
+                subprocess.Popen([sys.executable, "-c", HAMMER, port, str(value)],
+                                 env=self.env, stdout=subprocess.PIPE, text=True)
+                for value in (1, 2, 3)
+            ]
+            failures = [int(worker.communicate()[0]) for worker in workers]
+        self.assertEqual([0, 0, 0], failures)
+
+
+if __name__ == "__main__":
+    unittest.main()
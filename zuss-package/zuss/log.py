@@ -0,0 +1,105 @@
+# -----------------------------------------------------------------------------
+# - File              log.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Logging of device output, quiet by default
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+The SDKs print nothing.  Everything a device sends goes to the logger
+``zuss.device.<port>``:
+
+* INFO: lines which are no answer frame (the body of DISP_CONFIG etc.)
+* DEBUG: every request written and every answer frame
+* WARNING: ports which could not be opened, rejected arguments
+
+The ``zuss`` logger has only a NullHandler, so nothing is formatted or written
+unless the application configures logging or opts in::
+
+    from zuss import log
+
+    log.verbose()                      # device output on stderr
+    with log.capture("/dev/ttyUSB0") as lines:
+        zuss.disp_config("/dev/ttyUSB0")
+
+Coloured console output is prepared by :func:`enable_color`, which imports
+colorama only once colour is actually printed.
+"""
+
+import logging
+from contextlib import contextmanager
+
+LOGGER = "zuss"
+
+_color = False
+
+logger = logging.getLogger(LOGGER)
+logger.addHandler(logging.NullHandler())
+
+
+def device_name(port) -> str:
+    """Name of a port, URL or transport object as used in the logger names."""
+    return port if isinstance(port, str) else getattr(port, "port", repr(port))
+
+
+def device_logger(port) -> logging.Logger:
+    """Logger of one device, ``zuss.device./dev/ttyUSB0``."""
+    # dots would split the name into a logger hierarchy
+    return logging.getLogger(f"{LOGGER}.device.{device_name(port).replace('.', '_')}")
+
+
+def verbose(level: int = logging.INFO, stream=None, fmt: str = "%(message)s"):
+    """Write SDK output of ``level`` and above to ``stream`` (default stderr)."""
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    return handler
+
+
+def quiet(handler: logging.Handler = None):
+    """Undo :func:`verbose`, for the given handler only or for all."""
+    for added in list(logger.handlers):
+        if handler in (None, added) and not isinstance(added, logging.NullHandler):
+            logger.removeHandler(added)
+    logger.setLevel(logging.NOTSET)
+
+
+def enable_color():
+    """Let ANSI colours work on this console (colorama), done on first use."""
+    global _color
+    if not _color:
+        import colorama
+
+        colorama.init()
+        _color = True
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, lines: list):
+        super().__init__()
+        self.lines = lines
+
+    def emit(self, record):
+        self.lines.append(record.getMessage())
+
+
+@contextmanager
+def capture(port=None, level: int = logging.INFO):
+    """Collect the messages of one device (or all) in a list while active."""
+    target = logger if port is None else device_logger(port)
+    lines = []
+    handler = _ListHandler(lines)
+    handler.setLevel(level)
+    previous = target.level
+    target.addHandler(handler)
+    if not target.isEnabledFor(level):
+        target.setLevel(level)
+    try:
+        yield lines
+    finally:
+        target.removeHandler(handler)
+        target.setLevel(previous)
@@ -0,0 +1,52 @@
+# -----------------------------------------------------------------------------
+# - File              log_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    log_unittest
+# - Brief             log_unittest for the device output logging
+# -----------------------------------------------------------------------------
+import contextlib
+import io
+import logging
+import unittest
+
+from zuss import *
+from zuss import log
+
+
+class TestLog(unittest.TestCase):
+    def tearDown(self):
+        log.quiet()
+
+    def test_quiet_by_default(self):
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            self.assertTrue(disp_config("fake://switch/log"))
+            self.assertIsNone(get_host_port("/dev/does-not-exist"))
+        self.assertEqual("", out.getvalue())
+        self.assertEqual("", err.getvalue())
+
+    def test_capture_device(self):
+        with log.capture("fake://switch/log") as lines:
+            self.assertTrue(disp_config("fake://switch/log"))
+            self.assertTrue(disp_config("fake://switch/other"))
+        self.assertIn("host_port=1", lines)
+        self.assertEqual(len(lines), len(set(lines)))
+        self.assertEqual("zuss.device.fake://switch/log", log.device_logger("fake://switch/log").name)
+        self.assertEqual("zuss.device.socket://rack7_lab:4001",
+                         log.device_logger("socket://rack7.lab:4001").name)
+
+    def test_verbose(self):
+        stream = io.StringIO()
+        log.verbose(logging.DEBUG, stream)
+        self.assertTrue(set_host_port("fake://switch/log", 2))
+        self.assertIsNone(get_host_port("/dev/does-not-exist"))
+        text = stream.getvalue().splitlines()
+        self.assertIn("> <SET_HOST_PORT{2}>", text)
+        self.assertIn("< [SET_HOST_PORT{2}]", text)
+        self.assertTrue(any(line.startswith("Failed to open serial port") for line in text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,262 @@
+# -----------------------------------------------------------------------------
+# - File              metrics.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Per-command instrumentation hooks and metrics registry
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Every command run by a zuss.session.Session produces a :class:`CommandRecord`.
+Records are aggregated by the module-wide :data:`registry` (always on, constant
+cost per command) and handed to the hooks registered with :func:`add_hook`::
+
+    from zuss import metrics
+
+    metrics.add_hook(lambda record: print(record.name, record.frame_s))
+    ...
+    print(metrics.summary()["/dev/ttyUSB0"]["SET_HOST_PORT"]["p99_ms"])
+"""
+
+import threading
+
+OK = "ok"  # expected answer received
+ERROR = "error"  # answer frame received, but not the expected one
+TIMEOUT = "timeout"  # no answer frame in time
+CLOSED = "closed"  # port could not be opened
+REJECTED = "rejected"  # refused before anything was sent, e.g. port locked
+DROPPED = "dropped"  # background read not sent, made way for an emergency
+STOPPED = "stopped"  # stream closed by its consumer before the answer frame
+DOWN = "down"  # not sent, the device is down (zuss.watchdog)
+OUTCOMES = (OK, ERROR, TIMEOUT, CLOSED, REJECTED, DROPPED, STOPPED, DOWN)
+
+# upper bounds (seconds) of the latency histogram buckets: 0.5 ms ... 32 s
+BUCKETS = tuple(0.0005 * 2**i for i in range(17))
+
+
+class CommandRecord:
+    """
+    Timings of one command.  All durations are seconds; ``first_byte_s`` and
+    ``frame_s`` are measured from the end of the write, None if nothing came.
+    ``wait_s`` runs from the end of the write until the command finished (by
+    answer or timeout), ``parse_s`` is the time spent on the answer line.
+    ``started`` is the time.perf_counter() value when the write began.
+    ``lock_wait_s`` / ``lock_hold_s`` are the time spent waiting for and
+    holding the port lock (zuss.lock), accounted to the first command of a
+    pipeline like ``open_s``.
+    """
+
+    __slots__ = (
+        "name",
+        "device",
+        "open_s",
+        "lock_wait_s",
+        "lock_hold_s",
+        "write_s",
+        "first_byte_s",
+        "frame_s",
+        "wait_s",
+        "parse_s",
+        "bytes_out",
+        "bytes_in",
+        "outcome",
+        "started",
+        "lane",
+        "batch",
+        "thread",
+    )
+
+    def __init__(self, name: str, device: str):
+        self.name = name
+        self.device = device
+        self.open_s = 0.0
+        self.lock_wait_s = 0.0
+        self.lock_hold_s = 0.0
+        self.write_s = 0.0
+        self.first_byte_s = None
+        self.frame_s = None
+        self.wait_s = 0.0
+        self.parse_s = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.outcome = None
+        self.started = None
+        self.lane = 0  # slot in the window of a pipeline
+        self.batch = 0  # commands of one Session.pipeline() call share it
+        self.thread = None  # threading.get_ident() of the caller
+
+    @property
+    def total_s(self):
+        """Open + write + wait time of the command, a timeout waited in full."""
+        wait = self.wait_s if self.outcome == TIMEOUT else self.frame_s or 0.0
+        return self.open_s + self.write_s + wait
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, values: dict):
+        """The record of :meth:`as_dict`, e.g. sent by another process."""
+        record = cls(values["name"], values["device"])
+        for name in cls.__slots__:
+            if name in values:
+                setattr(record, name, values[name])
+        return record
+
+    def __repr__(self):
+        return f"<CommandRecord {self.device} {self.name} {self.outcome}>"
+
+
+class _Stats:
+    __slots__ = (
+        "count",
+        "outcomes",
+        "total",
+        "minimum",
+        "maximum",
+        "first_byte",
+        "first_byte_count",
+        "open",
+        "lock_wait",
+        "lock_hold",
+        "bytes_out",
+        "bytes_in",
+        "histogram",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.first_byte = 0.0
+        self.first_byte_count = 0
+        self.open = 0.0
+        self.lock_wait = 0.0
+        self.lock_hold = 0.0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def add(self, record: CommandRecord):
+        self.count += 1
+        self.outcomes[record.outcome] = self.outcomes.get(record.outcome, 0) + 1
+        self.open += record.open_s
+        self.lock_wait += record.lock_wait_s
+        self.lock_hold += record.lock_hold_s
+        self.bytes_out += record.bytes_out
+        self.bytes_in += record.bytes_in
+        if record.first_byte_s is not None:
+            self.first_byte += record.first_byte_s
+            self.first_byte_count += 1
+        if record.outcome != OK:
+            return
+        latency = record.total_s
+        self.total += latency
+        self.minimum = latency if self.minimum is None else min(self.minimum, latency)
+        self.maximum = latency if self.maximum is None else max(self.maximum, latency)
+        index = 0
+        while index < len(BUCKETS) and latency > BUCKETS[index]:
+            index += 1
+        self.histogram[index] += 1
+
+    def _percentile(self, q: float):
+        ok = self.outcomes[OK]
+        if not ok:
+            return None
+        rank = q / 100 * ok
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                bound = BUCKETS[index] if index < len(BUCKETS) else self.maximum
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def summary(self):
+        ok = self.outcomes[OK]
+
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "count": self.count,
+            **self.outcomes,
+            "mean_ms": ms(self.total / ok) if ok else None,
+            "min_ms": ms(self.minimum),
+            "max_ms": ms(self.maximum),
+            "p50_ms": ms(self._percentile(50)),
+            "p99_ms": ms(self._percentile(99)),
+            "first_byte_ms": ms(self.first_byte / self.first_byte_count)
+            if self.first_byte_count
+            else None,
+            "open_ms": ms(self.open / self.count),
+            "lock_wait_ms": ms(self.lock_wait / self.count),
+            "lock_hold_ms": ms(self.lock_hold / self.count),
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+        }
+
+
+class MetricsRegistry:
+    """Aggregates CommandRecords per device and command name, thread safe."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def add(self, record: CommandRecord):
+        key = (record.device, record.name)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _Stats()
+            stats.add(record)
+
+    def summary(self, device: str = None):
+        """``{device: {command: {count, ok, ..., p99_ms, ...}}}``"""
+        with self._lock:
+            result = {}
+            for (dev, name), stats in sorted(self._stats.items()):
+                if device is None or dev == device:
+                    result.setdefault(dev, {})[name] = stats.summary()
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+registry = MetricsRegistry()
+_hooks = []
+
+
+def add_hook(callback):
+    """Call ``callback(record)`` after every command, from the calling thread."""
+    _hooks.append(callback)
+
+
+def remove_hook(callback):
+    _hooks.remove(callback)
+
+
+def emit(record: CommandRecord):
+    """Publish a finished command to the registry and all hooks."""
+    registry.add(record)
+    for hook in list(_hooks):
+        try:
+            hook(record)
+        except Exception:
+            # a broken hook must never break the command itself
+            pass
+
+
+def summary(device: str = None):
+    return registry.summary(device)
+
+
+def reset():
+    registry.reset()
@@ -0,0 +1,76 @@
+# -----------------------------------------------------------------------------
+# - File              metrics_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    metrics_unittest
+# - Brief             metrics_unittest for command instrumentation
+# -----------------------------------------------------------------------------
+import unittest
+
+from zuss import *
+from zuss import metrics
+from zuss.session import Session
+from zuss.simulator import SwitchModel
+from zuss.transport import FakeTransport
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        self.records = []
+        metrics.add_hook(self.records.append)
+
+    def tearDown(self):
+        metrics.remove_hook(self.records.append)
+
+    def test_record(self):
+        self.assertTrue(set_host_port("fake://switch/metrics", 2))
+        record = self.records[-1]
+        self.assertEqual("SET_HOST_PORT", record.name)
+        self.assertEqual("fake://switch/metrics", record.device)
+        self.assertEqual(metrics.OK, record.outcome)
+        self.assertEqual(len(b"<SET_HOST_PORT{2}>"), record.bytes_out)
+        self.assertEqual(len("[SET_HOST_PORT{2}]\r\n"), record.bytes_in)
+        self.assertGreater(record.open_s, 0)
+        self.assertIsNotNone(record.first_byte_s)
+        self.assertGreaterEqual(record.frame_s, record.first_byte_s)
+
+    def test_outcomes(self):
+        transport = FakeTransport(SwitchModel(), latency=0.002, port="sw1")
+        with Session(transport, timeout=0.05) as session:
+            session.request(b"<SET_HOST_PORT{2}>", "[SET_HOST_PORT{2}]")
+            session.request(b"<SET_HOST_PORT{9}>", "[SET_HOST_PORT{9}]")
+            session.request(b"<NO_SUCH_CMD{}>", "[NO_SUCH_CMD{")
+            session.request(b"<DISP_CONFIG{}>", "[DISP_CONFIG{ok}]")
+        self.assertEqual(
+            [metrics.OK, metrics.ERROR, metrics.TIMEOUT, metrics.OK],
+            [record.outcome for record in self.records],
+        )
+        # the timeout counts as waited
+        self.assertGreaterEqual(self.records[2].total_s, 0.05)
+        self.assertGreater(self.records[3].bytes_in, len("[DISP_CONFIG{ok}]\r\n"))
+        stats = metrics.summary("sw1")["sw1"]["SET_HOST_PORT"]
+        self.assertEqual(2, stats["count"])
+        self.assertEqual(1, stats["ok"])
+        self.assertEqual(1, stats["error"])
+        self.assertGreaterEqual(stats["p99_ms"], stats["p50_ms"])
+        self.assertLessEqual(stats["p50_ms"], 4.0)
+
+    def test_closed_port(self):
+        self.assertIsNone(get_host_port("/dev/does-not-exist"))
+        self.assertEqual(metrics.CLOSED, self.records[-1].outcome)
+
+    def test_broken_hook(self):
+        def broken(record):
+            raise RuntimeError("broken hook")
+
+        metrics.add_hook(broken)
+        try:
+            self.assertTrue(set_dev_port("fake://switch/metrics", 1))
+        finally:
+            metrics.remove_hook(broken)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,509 @@
+# -----------------------------------------------------------------------------
+# - File              reactor.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             One thread serving the ports of many devices
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+A :class:`Reactor` serves any number of switches and converters from one
+thread: the ports of all devices are registered with a selector (epoll on
+Linux), and the answers of each device are split into lines and matched to
+its commands as they arrive.  No thread and no blocked read per device::
+
+    with Reactor() as reactor:
+        futures = [
+            reactor.submit(port, [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")])
+            for port in ports
+        ]
+        answers = [future.result() for future in futures]
+
+        # the blocking SDK functions of zuss and zcts on top
+        zuss.set_host_port(reactor.session("/dev/ttyUSB0"), 2)
+
+Both command sets use the same framing, see zuss.session.  A device is opened
+on first use and stays open, with its port lock (zuss.lock) held, until it is
+removed or the reactor stops; a device which fails is closed and opened again
+by the next command.  In-memory transports (``fake://``, ``replay://``) have
+no descriptor, the reactor wakes up when their next data is due.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import queue
+import selectors
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from zuss import metrics
+from zuss.lock import LOCK_TIMEOUT, port_lock
+from zuss.log import device_logger, device_name
+from zuss.session import (
+    EMERGENCY, ERROR_FRAME, TIMEOUT, WINDOW, Session, _batches, _Pending, observe, observers,
+)
+from zuss.transport import BAUDRATE, _fileno, open_transport
+
+logger = logging.getLogger("zuss.reactor")
+
+
+class _Job:
+    """The commands of one submit() and the future of their answers."""
+
+    __slots__ = ("commands", "future", "left", "timeout", "on_line")
+
+    def __init__(self, commands, timeout: float, on_line=None):
+        self.commands = commands
+        self.future = Future()
+        self.left = len(commands)
+        self.timeout = timeout
+        self.on_line = on_line
+
+    def complete(self):
+        for command in self.commands:
+            metrics.emit(command.record)
+        # for ReactorSession: the health of the device, see zuss.watchdog
+        self.future.outcomes = [command.record.outcome for command in self.commands]
+        self.future.set_result([command.result for command in self.commands])
+
+
+def _fail_job(job: _Job):
+    for command in job.commands:
+        if not command.done:
+            command.finish(metrics.CLOSED)
+    if not job.future.done():
+        job.complete()
+
+
+class _Device:
+    """One open port, only used by the reactor thread once registered."""
+
+    def __init__(self, port: str, transport, lock, window: int):
+        self.port = port
+        self.name = device_name(port)
+        self.log = device_logger(port)
+        self.transport = transport
+        self.fd = _fileno(transport)
+        self.lock = lock
+        self.window = window
+        self.queue = deque()  # (command, job) not written yet
+        self.in_flight = []  # (command, job)
+        self.buffer = b""
+        self.failed = False
+
+    def __repr__(self):
+        return f"<_Device {self.port}>"
+
+
+class Reactor:
+    """
+    Runs the commands of many devices from one thread.
+
+    :param timeout: default time to wait for an answer (seconds)
+    :param window: requests in flight per device
+    :param lock_timeout: time to wait for a port used by someone else
+    """
+
+    def __init__(self, timeout: float = TIMEOUT, window: int = WINDOW,
+                 lock_timeout: float = LOCK_TIMEOUT, baudrate: int = BAUDRATE):
+        self.timeout = timeout
+        self.window = window
+        self.lock_timeout = lock_timeout
+        self.baudrate = baudrate
+        self._devices = {}
+        self._lock = threading.Lock()
+        # the port lock is kept, so a second opener would wait for it in vain
+        self._open_lock = threading.Lock()
+        self._inbox = deque()  # (device, job, priority) handed to the reactor thread
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._deadlines = []  # heap of (deadline, sequence, device, command, job)
+        self._sequence = itertools.count()
+        self._timed = set()  # devices without a descriptor
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="zuss-reactor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            devices, self._devices = list(self._devices.values()), {}
+            inbox, self._inbox = list(self._inbox), deque()
+        for device, job, _ in inbox:
+            if job is None:
+                devices.append(device)
+            else:
+                _fail_job(job)
+        for device in devices:
+            self._close(device)
+        self._selector.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _wake(self):
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            # woken already
+            pass
+
+    # -- caller side ---------------------------------------------------------
+
+    def _open(self, port: str):
+        """The device of ``port``, opened if needed, or the outcome of the failure."""
+        with self._lock:
+            device = self._devices.get(port)
+        if device is not None:
+            return device
+        with self._open_lock:
+            with self._lock:
+                device = self._devices.get(port)
+            return device or self._open_new(port)
+
+    def _open_new(self, port: str):
+        lock = port_lock(port)
+        try:
+            locked = lock.acquire(self.lock_timeout)
+        except OSError as e:
+            logger.warning("Cannot lock port %s: %s", port, e)
+            return metrics.REJECTED
+        if not locked:
+            logger.warning("Port %s is in use, gave up after %ss", port, self.lock_timeout)
+            return metrics.REJECTED
+        try:
+            transport = open_transport(port, self.baudrate, timeout=0)
+            transport.reset_input_buffer()
+        except Exception as e:
+            lock.release()
+            device_logger(port).warning("Failed to open serial port %s: %s", port, e)
+            return metrics.CLOSED
+        device = _Device(port, transport, lock, self.window)
+        with self._lock:
+            self._devices[port] = device
+        return device
+
+    def add(self, port: str) -> bool:
+        """Open ``port`` now instead of on its first command."""
+        return isinstance(self._open(port), _Device)
+
+    def remove(self, port: str):
+        """Close ``port``, its queued commands fail with CLOSED."""
+        with self._lock:
+            device = self._devices.pop(port, None)
+            if device is not None:
+                self._inbox.append((device, None, None))
+        self._wake()
+
+    def ports(self):
+        with self._lock:
+            return sorted(self._devices)
+
+    def submit(self, port: str, commands, timeout: float = None, priority: int = None,
+               on_line=None) -> Future:
+        """
+        Queue ``[(request bytes, expected text), ...]`` for ``port``.  The
+        future gives the answer lines like Session.pipeline(), its
+        ``outcomes`` attribute the outcome of every command.  EMERGENCY
+        commands go ahead of the queued ones.  ``on_line`` is called in the
+        reactor thread with every display line of the commands.
+        """
+        opened = self._open(port)
+        pending = [_Pending(request, expect, device_name(port)) for request, expect in commands]
+        job = _Job(pending, self.timeout if timeout is None else timeout, on_line)
+        batch = next(_batches)
+        thread = threading.get_ident()
+        for command in pending:
+            command.record.batch = batch
+            command.record.thread = thread
+        if not isinstance(opened, _Device) or not pending:
+            for command in pending:
+                command.finish(opened)
+            job.complete()
+            return job.future
+        with self._lock:
+            self._inbox.append((opened, job, priority))
+        self._wake()
+        return job.future
+
+    def pipeline(self, port: str, commands, timeout: float = None):
+        """Blocking submit()."""
+        return self.submit(port, commands, timeout).result()
+
+    def session(self, port: str, timeout: float = None) -> "ReactorSession":
+        return ReactorSession(self, port, timeout)
+
+    # -- reactor thread ------------------------------------------------------
+
+    def _run(self):
+        while self._running:
+            self._take()
+            events = self._selector.select(self._next_timeout())
+            for key, _ in events:
+                if key.data is None:
+                    try:
+                        os.read(self._wake_r, 4096)
+                    except BlockingIOError:
+                        pass
+                else:
+                    self._on_readable(key.data)
+            for device in list(self._timed):
+                due = device.transport.due()
+                if due is not None and due <= time.monotonic():
+                    self._on_readable(device)
+            self._expire()
+
+    def _take(self):
+        with self._lock:
+            inbox, self._inbox = self._inbox, deque()
+        for device, job, priority in inbox:
+            if job is None:
+                self._close(device)
+                continue
+            if device.failed:
+                _fail_job(job)
+                continue
+            if device.fd is None:
+                self._timed.add(device)
+            elif device.fd not in self._selector.get_map():
+                # stays registered, output between commands is logged too
+                self._selector.register(device.fd, selectors.EVENT_READ, device)
+            entries = [(command, job) for command in job.commands]
+            if priority == EMERGENCY:
+                device.queue.extendleft(reversed(entries))
+            else:
+                device.queue.extend(entries)
+            self._fill(device)
+
+    def _next_timeout(self):
+        wake = self._deadlines[0][0] if self._deadlines else None
+        for device in self._timed:
+            due = device.transport.due()
+            if due is not None:
+                # the in-memory transports count in time.monotonic()
+                due += time.perf_counter() - time.monotonic()
+                wake = due if wake is None else min(wake, due)
+        return None if wake is None else max(0.0, wake - time.perf_counter())
+
+    def _fill(self, device: _Device):
+        try:
+            while device.queue and len(device.in_flight) < device.window:
+                command, job = device.queue.popleft()
+                lanes = {c.record.lane for c, _ in device.in_flight}
+                command.record.lane = next(i for i in itertools.count() if i not in lanes)
+                start = command.record.started = time.perf_counter()
+                device.transport.write(command.request)
+                command.written = time.perf_counter()
+                command.record.write_s = command.written - start
+                command.deadline = command.written + job.timeout
+                device.in_flight.append((command, job))
+                heapq.heappush(
+                    self._deadlines,
+                    (command.deadline, next(self._sequence), device, command, job),
+                )
+                if device.log.isEnabledFor(logging.DEBUG):
+                    device.log.debug("> %s", command.request.decode("ascii", "replace"))
+        except Exception as e:
+            self._fail(device, e)
+
+    def _on_readable(self, device: _Device):
+        transport = device.transport
+        try:
+            data = transport.read(max(transport.in_waiting, 1))
+        except Exception as e:
+            self._fail(device, e)
+            return
+        if not data:
+            return
+        now = time.perf_counter()
+        for command, _ in device.in_flight:
+            if command.record.first_byte_s is None:
+                command.record.first_byte_s = now - command.written
+        device.buffer += data
+        while True:
+            end = device.buffer.find(b"\n")
+            if end < 0:
+                break
+            line = device.buffer[: end + 1].decode("ascii", "replace")
+            device.buffer = device.buffer[end + 1 :]
+            self._dispatch(device, line)
+        self._fill(device)
+
+    def _dispatch(self, device: _Device, line: str):
+        frame = time.perf_counter()
+        waiting = None
+        for command, job in device.in_flight:
+            if command.head in line:
+                command.record.bytes_in += len(line)
+                if device.log.isEnabledFor(logging.DEBUG):
+                    device.log.debug("< %s", line.rstrip())
+                if command.expect in line and ERROR_FRAME not in line:
+                    command.result = line
+                    command.finish(metrics.OK, time.perf_counter(), frame)
+                    if observers:
+                        observe(device.name, command.request, line)
+                else:
+                    command.finish(metrics.ERROR, time.perf_counter(), frame)
+                self._done(device, command, job)
+                return
+            if waiting is None:
+                waiting, owner = command, job
+        if waiting is not None:
+            # display output belongs to the oldest command still waiting
+            waiting.record.bytes_in += len(line)
+            if observers:
+                observe(device.name, waiting.request, line)
+            if owner.on_line is not None:
+                owner.on_line(line)
+        device.log.info("%s", line.rstrip())
+
+    def _done(self, device: _Device, command, job: _Job):
+        device.in_flight = [entry for entry in device.in_flight if entry[0] is not command]
+        job.left -= 1
+        if job.left == 0:
+            job.complete()
+        if not device.in_flight and not device.queue:
+            self._timed.discard(device)
+
+    def _expire(self):
+        now = time.perf_counter()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, device, command, job = heapq.heappop(self._deadlines)
+            if not command.done:
+                command.finish(metrics.TIMEOUT, now)
+                self._done(device, command, job)
+                self._fill(device)
+
+    def _fail(self, device: _Device, error: Exception):
+        """The port broke (unplugged...): fail its commands, reopen on the next."""
+        device.log.warning("Port %s failed: %s", device.port, error)
+        with self._lock:
+            if self._devices.get(device.port) is device:
+                del self._devices[device.port]
+        self._close(device)
+
+    def _close(self, device: _Device):
+        if device.failed:
+            return
+        device.failed = True
+        if device.fd is not None and device.fd in self._selector.get_map():
+            self._selector.unregister(device.fd)
+        self._timed.discard(device)
+        jobs = {id(job): job for _, job in list(device.in_flight) + list(device.queue)}
+        device.in_flight = []
+        device.queue.clear()
+        for job in jobs.values():
+            _fail_job(job)
+        try:
+            device.transport.close()
+        finally:
+            device.lock.release()
+
+
+class ReactorSession(Session):
+    """
+    The Session API on a Reactor (or zuss.fleet.Fleet), for the blocking SDK
+    functions (``zuss.set_host_port(reactor.session(port), 2)``).  The reactor
+    owns the port: open() and close() only add the device or do nothing.
+    A zuss.watchdog works on it like on a Session: the outcomes of the
+    commands count as answers or failures, while down they fail at once.
+    """
+
+    def __init__(self, reactor: Reactor, port: str, timeout: float = None):
+        super().__init__(port, reactor.timeout if timeout is None else timeout)
+        self.reactor = reactor
+
+    @property
+    def is_open(self):
+        return self.port in self.reactor.ports()
+
+    def open(self):
+        self.reactor.add(self.port)
+        return self
+
+    def close(self):
+        pass
+
+    def _down(self, commands):
+        """Fail ``commands`` with DOWN without queueing them."""
+        batch = next(_batches)
+        for request, expect in commands:
+            command = _Pending(request, expect, self.name)
+            command.record.batch = batch
+            command.record.thread = threading.get_ident()
+            command.finish(metrics.DOWN)
+            metrics.emit(command.record)
+        return [None] * len(commands)
+
+    def _account(self, future):
+        """Count the answers and timeouts of a finished submit()."""
+        for outcome in future.outcomes:
+            if outcome == metrics.TIMEOUT:
+                self._timed_out()
+            elif outcome in (metrics.OK, metrics.ERROR):
+                self.answered = time.perf_counter()
+                self.failures = 0
+
+    def pipeline(self, commands, timeout: float = None, priority: int = None):
+        if self.down:
+            return self._down(commands)
+        timeout = self.timeout if timeout is None else timeout
+        future = self.reactor.submit(self.port, commands, timeout, priority)
+        lines = future.result()
+        self._account(future)
+        return lines
+
+    def probe(self, request: bytes, expect: str, timeout: float = None) -> bool:
+        """Like Session.probe(), through the reactor also while down."""
+        timeout = self.timeout if timeout is None else timeout
+        future = self.reactor.submit(self.port, [(request, expect)], timeout)
+        future.result()
+        self._account(future)
+        return future.outcomes[0] == metrics.OK
+
+    def stream(self, request: bytes, expect: str, timeout: float = None,
+               priority: int = None):
+        """
+        Like Session.stream(), the lines come from the reactor thread.  Closed
+        early, the command still runs to its end in the reactor and the rest
+        of its lines are dropped.
+        """
+        if self.down:
+            self._down([(request, expect)])
+            return metrics.DOWN
+        timeout = self.timeout if timeout is None else timeout
+        lines = queue.SimpleQueue()
+        future = self.reactor.submit(self.port, [(request, expect)], timeout, priority,
+                                     on_line=lines.put)
+        future.add_done_callback(lambda _: lines.put(None))
+        while True:
+            line = lines.get()
+            if line is None:
+                break
+            yield line
+        future.result()
+        self._account(future)
+        return future.outcomes[0]
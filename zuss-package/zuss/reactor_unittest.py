@@ -0,0 +1,111 @@
+# -----------------------------------------------------------------------------
+# - File              reactor_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    reactor_unittest
+# - Brief             reactor_unittest for the single thread reactor
+# -----------------------------------------------------------------------------
+import threading
+import time
+import unittest
+
+import zuss
+from zuss import log, metrics
+from zuss.reactor import Reactor
+from zuss.session import EMERGENCY, Session
+from zuss.simulator import Simulator
+
+
+class TestReactor(unittest.TestCase):
+    def test_many_devices_one_thread(self):
+        with Simulator(latency=0.002) as simulator:
+            switches = [simulator.add_switch().port for _ in range(30)]
+            converters = [simulator.add_converter().port for _ in range(10)]
+            threads = threading.active_count()
+            with Reactor() as reactor:
+                futures = [
+                    reactor.submit(port, [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")] * 20)
+                    for port in switches
+                ]
+                futures += [
+                    reactor.submit(port, [(b"<GET_ETH_SPEED{1}>", "[GET_ETH_SPEED{")] * 20)
+                    for port in converters
+                ]
+                answers = [future.result(10) for future in futures]
+                self.assertEqual(threads + 1, threading.active_count())
+                self.assertEqual(sorted(switches + converters), reactor.ports())
+        self.assertTrue(all(all(lines) for lines in answers))
+
+    def test_blocking_sdk(self):
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            with Reactor() as reactor:
+                session = reactor.session(port)
+                self.assertTrue(zuss.set_host_port(session, 3))
+                self.assertEqual(3, zuss.get_host_port(session))
+                with log.capture(port) as lines:
+                    self.assertTrue(zuss.disp_config(session))
+                self.assertTrue(lines)
+                self.assertTrue(session.is_open)
+                reactor.remove(port)
+                self.assertFalse(session.is_open)
+                # opened again
+                self.assertEqual(3, zuss.get_host_port(session))
+
+    def test_stream(self):
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            with Session(port) as session:
+                expected = list(session.stream(b"<DISP_CONFIG{}>", "[DISP_CONFIG{ok}]"))
+            with Reactor() as reactor:
+                lines = reactor.session(port).stream(b"<DISP_CONFIG{}>", "[DISP_CONFIG{ok}]")
+                self.assertEqual(expected, list(lines))
+                self.assertTrue(expected)
+                # stopped early, the reactor goes on
+                for line in reactor.session(port).stream(b"<DISP_CONFIG{}>",
+                                                         "[DISP_CONFIG{ok}]"):
+                    break
+                self.assertEqual(1, zuss.get_host_port(reactor.session(port)))
+
+    def test_down(self):
+        records = []
+        metrics.add_hook(records.append)
+        self.addCleanup(metrics.remove_hook, records.append)
+        with Simulator() as simulator:
+            port = simulator.add_switch().port
+            with Reactor() as reactor:
+                session = reactor.session(port)
+                session.down = True
+                self.assertIsNone(zuss.get_host_port(session))
+                self.assertEqual([], list(session.stream(b"<DISP_CONFIG{}>",
+                                                         "[DISP_CONFIG{ok}]")))
+        self.assertEqual([metrics.DOWN, metrics.DOWN], [record.outcome for record in records])
+
+    def test_in_memory_transport(self):
+        records = []
+        metrics.add_hook(records.append)
+        with Reactor(timeout=0.2) as reactor:
+            port = "fake://switch/reactor?latency=0.01"
+            start = time.monotonic()
+            lines = reactor.pipeline(port, [(b"<SET_RELAY_MASK{0x5}>", "[SET_RELAY_MASK{0x5}]"),
+                                            (b"<NO_SUCH_CMD{}>", "[NO_SUCH_CMD{")])
+            elapsed = time.monotonic() - start
+            first = reactor.submit(port, [(b"<GET_RELAY_MASK{}>", "[GET_RELAY_MASK{")])
+            urgent = reactor.submit(port, [(b"<SET_POWER_MASK{0x0}>", "[SET_POWER_MASK{0x0}]")],
+                                    priority=EMERGENCY)
+            self.assertTrue(all(urgent.result() + first.result()))
+        metrics.remove_hook(records.append)
+        self.assertIsNotNone(lines[0])
+        self.assertIsNone(lines[1])
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual([metrics.OK, metrics.TIMEOUT], [r.outcome for r in records[:2]])
+
+    def test_open_failure(self):
+        with Reactor() as reactor:
+            self.assertEqual([None], reactor.pipeline("/dev/does-not-exist",
+                                                      [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")]))
+
+
+if __name__ == "__main__":
+    unittest.main()
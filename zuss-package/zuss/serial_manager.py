@@ -1,11 +1,12 @@
-import serial
+from zuss.log import device_logger
+from zuss.transport import open_transport
 
 
 class SerialPort:
     def __init__(self, port, baudrate=115200, timeout=2, bytesize=8):
         """
         初始化串口
-        :param port: 串口号，如'COM3'（Windows）或'/dev/ttyUSB0'（Linux）
+        :param port: 串口号，如'COM3'（Windows）或'/dev/ttyUSB0'（Linux），或 URL
         :param baudrate: 波特率
         :param timeout: 读取操作的超时时间（秒）
         """
@@ -14,23 +15,27 @@ class SerialPort:
         self.timeout = timeout
         self.bytesize = bytesize
         self._serial = None
+        self._owned = True
 
     def open(self):
-        """打开串口"""
+        """打开串口
+        port 可以是串口号、pyserial URL（socket://、rfc2217:// 等，见 zuss.transport），
+        也可以是已打开的传输对象（如 capture.ReplayTransport），此时直接使用，退出时不关闭。
+        """
+        self._owned = isinstance(self.port, str)
         try:
-            self._serial = serial.Serial(
-                port=self.port,
+            self._serial = open_transport(
+                self.port,
                 baudrate=self.baudrate,
                 timeout=self.timeout,
                 bytesize=self.bytesize,
-                stopbits=serial.STOPBITS_ONE,
             )
         except Exception as e:
-            print(f"打开串口 {self.port} 失败: {e}")
+            device_logger(self.port).warning("打开串口 %s 失败: %s", self.port, e)
 
     def close(self):
         """关闭串口"""
-        if self._serial is not None and self._serial.isOpen():
+        if self._serial is not None and self._owned and self._serial.isOpen():
             self._serial.close()
 
     def write(self, data):
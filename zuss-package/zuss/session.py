@@ -0,0 +1,666 @@
+# -----------------------------------------------------------------------------
+# - File              session.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Command session on one open transport
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+A :class:`Session` keeps one transport open and runs commands on it.
+
+A command is finished as soon as the device answers with a frame of the same
+name (``<SET_HOST_PORT{3}>`` is answered by ``[SET_HOST_PORT{...}]``), so no
+fixed polling window is waited out.  :meth:`Session.pipeline` writes several
+requests before reading the answers, which hides the round-trip time of a
+network link (``socket://``, ``rfc2217://``)::
+
+    with Session("socket://rack7:4001") as session:
+        session.pipeline([
+            (b"<SET_HOST_PORT{2}>", "[SET_HOST_PORT{2}]"),
+            (b"<SET_DEVICE_PORT{3}>", "[SET_DEVICE_PORT{3}]"),
+        ])
+
+:meth:`Session.stream` yields the display lines of a ``DISP_*`` command as they
+arrive and stops at its answer frame; the consumer may stop earlier.
+
+Threads sharing a session take turns by priority, and round-robin between
+threads (clients) of one priority.  An emergency stops the running pipeline
+after its commands in flight and drops the pending background reads::
+
+    with scheduling(EMERGENCY):
+        zuss.set_pwr_mask(session, 0)
+"""
+
+import functools
+import itertools
+import logging
+import select
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+from zuss import metrics
+from zuss.lock import LOCK_TIMEOUT, port_lock
+from zuss.log import device_logger, device_name
+from zuss.transport import BAUDRATE, _fileno, open_transport
+
+# default time to wait for the answer of a command (seconds)
+TIMEOUT = 5
+# read timeout of the transport, bounds how late a timeout is noticed
+POLL = 0.05
+# requests written ahead of their answers in a pipeline
+WINDOW = 8
+
+# priorities of a pipeline, see scheduling()
+EMERGENCY = 0
+NORMAL = 1
+# runs with one command in flight, its reads are dropped for an emergency
+BACKGROUND = 2
+
+# answers of these can be thrown away, nothing changes on the device
+READS = ("GET_", "DISP_")
+# answer to a request the device refused, ``[GET_RELAY{error}]``; it also
+# starts like the answer of a getter
+ERROR_FRAME = "{error}"
+
+_batches = itertools.count(1)
+_context = threading.local()
+
+# called with (device, request, line) for every expected answer and every
+# display line of a command, e.g. by zuss.state
+observers = []
+
+
+def observe(device: str, request: bytes, line: str):
+    for observer in list(observers):
+        try:
+            observer(device, request, line)
+        except Exception:
+            # like the metrics hooks, never at the expense of the command
+            pass
+
+
+@contextmanager
+def scheduling(priority: int = NORMAL, client=None):
+    """
+    Run the commands of this thread with ``priority`` and, if given, as
+    ``client`` (any hashable; by default every thread is a client of its own).
+    """
+    saved = getattr(_context, "priority", NORMAL), getattr(_context, "client", None)
+    _context.priority = priority
+    _context.client = saved[1] if client is None else client
+    try:
+        yield
+    finally:
+        _context.priority, _context.client = saved
+
+
+@functools.lru_cache(1024)
+def frame_name(request: bytes) -> str:
+    """``b"<SET_HOST_PORT{3}>"`` -> ``"SET_HOST_PORT"``"""
+    return request[1 : request.index(b"{")].decode("ascii")
+
+
+@functools.lru_cache(1024)
+def _head(name: str) -> str:
+    """Start of the answer frames of command ``name``."""
+    return f"[{name}{{"
+
+
+class _Pending:
+    __slots__ = (
+        "request",
+        "head",
+        "expect",
+        "written",
+        "deadline",
+        "result",
+        "done",
+        "record",
+    )
+
+    def __init__(self, request: bytes, expect: str, device: str):
+        name = frame_name(request)
+        self.request = request
+        self.head = _head(name)
+        self.expect = expect
+        self.written = None
+        self.deadline = None
+        self.result = None
+        self.done = False
+        self.record = metrics.CommandRecord(name, device)
+        self.record.bytes_out = len(request)
+
+    def finish(self, outcome: str, now: float = None, frame: float = None):
+        self.done = True
+        record = self.record
+        record.outcome = outcome
+        if now is not None and self.written is not None:
+            record.wait_s = now - self.written
+            if frame is not None:
+                record.frame_s = frame - self.written
+                record.parse_s = now - frame
+
+
+class _Ticket:
+    """A pipeline waiting for or having its turn."""
+
+    __slots__ = ("priority", "client", "reads", "dropped")
+
+    def __init__(self, priority: int, client, reads: bool):
+        self.priority = priority
+        self.client = client
+        self.reads = reads
+        self.dropped = False
+
+
+class _Scheduler:
+    """
+    Turns on one session, a pipeline per turn: the highest priority first,
+    round-robin between the clients of one priority, first come first served
+    for one client.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # per priority: client -> tickets, the next client to serve first
+        self._queues = [OrderedDict() for _ in range(BACKGROUND + 1)]
+        self._running = None
+        # emergencies waiting, read without the lock by the running pipeline
+        self.urgent = 0
+
+    def _next(self):
+        for queue in self._queues:
+            if queue:
+                return next(iter(queue.values()))[0]
+        return None
+
+    def _remove(self, ticket: _Ticket):
+        queue = self._queues[ticket.priority]
+        tickets = queue[ticket.client]
+        tickets.remove(ticket)
+        if tickets:
+            # the other clients of this priority come first
+            queue.move_to_end(ticket.client)
+        else:
+            del queue[ticket.client]
+
+    def enter(self, ticket: _Ticket) -> bool:
+        """Wait for the turn of ``ticket``, False if it was dropped."""
+        with self._cond:
+            self._queues[ticket.priority].setdefault(ticket.client, deque()).append(ticket)
+            if ticket.priority == EMERGENCY:
+                self.urgent += 1
+                for tickets in list(self._queues[BACKGROUND].values()):
+                    for waiting in [t for t in tickets if t.reads]:
+                        waiting.dropped = True
+                        self._remove(waiting)
+                self._cond.notify_all()
+            try:
+                while not ticket.dropped and (
+                    self._running is not None or self._next() is not ticket
+                ):
+                    self._cond.wait()
+            finally:
+                if ticket.priority == EMERGENCY:
+                    self.urgent -= 1
+                if not ticket.dropped:
+                    self._remove(ticket)
+            if ticket.dropped:
+                return False
+            self._running = ticket
+            return True
+
+    def leave(self, ticket: _Ticket):
+        with self._cond:
+            if self._running is ticket:
+                self._running = None
+            self._cond.notify_all()
+
+    def preempted(self, ticket: _Ticket) -> bool:
+        return self.urgent > 0 and ticket.priority != EMERGENCY
+
+
+class Session:
+    """
+    One open connection to a device.
+
+    :param port: port name, URL or transport object, see zuss.transport
+    :param timeout: default time to wait for an answer (seconds)
+    :param window: number of requests in flight during a pipeline
+    :param lock_timeout: time to wait for a port used by another thread or
+        process, None waits forever, 0 fails at once (see zuss.lock)
+    """
+
+    def __init__(self, port, timeout: float = TIMEOUT, baudrate: int = BAUDRATE,
+                 window: int = WINDOW, lock_timeout: float = LOCK_TIMEOUT):
+        self.port = port
+        self.timeout = timeout
+        self.baudrate = baudrate
+        self.window = window
+        self.lock_timeout = lock_timeout
+        self.name = device_name(port)
+        # the port opened, the current tty of a usb-serial:// name (zuss.identity)
+        self.device = None
+        self.log = device_logger(port)
+        self._transport = None
+        self._owned = isinstance(port, str)
+        # transport objects handed in are the caller's business
+        self._port_lock = port_lock(port) if self._owned else None
+        # named by serial number, see zuss.identity
+        self._followed = self._owned and port.startswith("usb-serial://")
+        self._buffer = b""
+        self._open_s = 0.0
+        self._in_flight = []
+        # (answer head, deadline) of streams closed before their answer frame
+        self._orphans = []
+        self._debug = False
+        # health, see zuss.watchdog: commands fail at once while down
+        self.down = False
+        self.failures = 0  # commands timed out since the last answer
+        self.answered = time.perf_counter()
+        self.watchdog = None
+        self._lock = threading.RLock()
+        self._scheduler = _Scheduler()
+
+    def __repr__(self):
+        return f"<Session {self.port}>"
+
+    @property
+    def is_open(self):
+        return self._transport is not None
+
+    def open(self):
+        """Open the transport, a failure is logged and leaves the session closed."""
+        if self._transport is not None:
+            return self
+        start = time.perf_counter()
+        device = self.port
+        if self._followed:
+            from zuss import identity
+
+            # follow the device to its next tty
+            identity.watch(self)
+            device = identity.resolve(self.port)
+            if device is None:
+                self.log.warning("Device %s is not attached", self.port)
+                return self
+            # the same lock as for users naming the tty
+            self._port_lock = port_lock(device)
+        # the input reset below would eat the answers of another user
+        if not self._acquire():
+            return self
+        try:
+            self._transport = open_transport(device, self.baudrate, timeout=POLL)
+        except Exception as e:
+            self.log.warning("Failed to open serial port %s: %s", self.port, e)
+            return self
+        else:
+            if not self._owned:
+                self._transport.timeout = POLL
+            self.device = device
+            self._buffer = b""
+            self._orphans = []
+            self.answered = time.perf_counter()
+            # drop answers to commands of an earlier, aborted session
+            self._transport.reset_input_buffer()
+        finally:
+            self._release()
+        # accounted to the first command of the session
+        self._open_s = time.perf_counter() - start
+        return self
+
+    def _acquire(self) -> bool:
+        try:
+            if self._port_lock is None or self._port_lock.acquire(self.lock_timeout):
+                return True
+        except OSError as e:
+            # e.g. a lock file of another user without write permission
+            self.log.warning("Cannot lock port %s: %s", self.port, e)
+            return False
+        self.log.warning("Port %s is in use, gave up after %ss", self.port, self.lock_timeout)
+        return False
+
+    def _release(self):
+        if self._port_lock is not None:
+            self._port_lock.release()
+
+    def close(self):
+        if self._followed:
+            from zuss import identity
+
+            identity.unwatch(self)
+        self._close()
+
+    def _close(self):
+        with self._lock:
+            if self._transport is not None and self._owned:
+                self._transport.close()
+            self._transport = None
+            self.device = None
+
+    def rebind(self):
+        """Reopen the session on the current tty of its device, see zuss.identity."""
+        with self._lock:
+            self._close()
+            self.open()
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def on_line(self, line: str):
+        """Called with every received line which is no answer to a command."""
+        self.log.info("%s", line.rstrip())
+
+    def _readline(self, deadline: float):
+        """Next received line (str) or None once ``deadline`` has passed."""
+        transport = self._transport
+        fd = False  # looked up when first needed
+        while True:
+            end = self._buffer.find(b"\n")
+            if end >= 0:
+                line, self._buffer = self._buffer[: end + 1], self._buffer[end + 1 :]
+                return line.decode("ascii", "replace")
+            now = time.perf_counter()
+            if now >= deadline:
+                return None
+            waiting = transport.in_waiting
+            if not waiting:
+                if fd is False:
+                    fd = _fileno(transport)
+                if fd is not None:
+                    # wait for the answer and take it in one read, not byte by byte
+                    if not select.select([fd], [], [], min(POLL, deadline - now))[0]:
+                        continue
+                    waiting = transport.in_waiting
+            chunk = transport.read(waiting or 1)
+            if chunk:
+                self._buffer += chunk
+                now = time.perf_counter()
+                for command in self._in_flight:
+                    if command.record.first_byte_s is None:
+                        command.record.first_byte_s = now - command.written
+
+    def _dispatch(self, line: str, pending):
+        """Match ``line`` to a command, returns the command a display line belongs to."""
+        frame = time.perf_counter()
+        if self._orphans:
+            self._orphans = [o for o in self._orphans if o[1] > frame]
+            if self._orphans:
+                # the device answers in order: the rest of an abandoned stream
+                if self._orphans[0][0] in line:
+                    self._orphans.pop(0)
+                else:
+                    self.on_line(line)
+                return None
+        waiting = None
+        for command in pending:
+            if command.done:
+                continue
+            if command.head in line:
+                self.answered = frame
+                self.failures = 0
+                command.record.bytes_in += len(line)
+                if self._debug:
+                    self.log.debug("< %s", line.rstrip())
+                if command.expect in line and ERROR_FRAME not in line:
+                    command.result = line
+                    command.finish(metrics.OK, time.perf_counter(), frame)
+                    if observers:
+                        observe(self.name, command.request, line)
+                else:
+                    command.finish(metrics.ERROR, time.perf_counter(), frame)
+                return None
+            if waiting is None:
+                waiting = command
+        if waiting is not None:
+            # display output belongs to the oldest command still waiting
+            waiting.record.bytes_in += len(line)
+            if observers:
+                observe(self.name, waiting.request, line)
+        self.on_line(line)
+        return waiting
+
+    def pipeline(self, commands, timeout: float = None, priority: int = None):
+        """
+        Run ``[(request bytes, expected text), ...]`` with up to ``window``
+        requests in flight.  Returns the answer line of every command, or None
+        for a command which failed or timed out.
+
+        ``priority`` defaults to the one set with :func:`scheduling`.  An
+        emergency waits at most for the commands in flight: the rest of a
+        running pipeline continues after it, or is dropped if it is a
+        background read.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        pending = [_Pending(request, expect, self.name) for request, expect in commands]
+        if not pending:
+            return []
+        priority = getattr(_context, "priority", NORMAL) if priority is None else priority
+        client = getattr(_context, "client", None)
+        ticket = _Ticket(
+            priority,
+            threading.get_ident() if client is None else client,
+            all(command.record.name.startswith(READS) for command in pending),
+        )
+        batch = next(_batches)
+        thread = threading.get_ident()
+        for command in pending:
+            command.record.batch = batch
+            command.record.thread = thread
+        queue = pending
+        while queue:
+            if self.down:
+                # without waiting for the turn of the watchdog
+                for command in queue:
+                    command.finish(metrics.DOWN)
+                queue = []
+                break
+            if not self._scheduler.enter(ticket):
+                break
+            try:
+                queue = self._turn(queue, timeout, ticket)
+            finally:
+                self._scheduler.leave(ticket)
+            if priority == BACKGROUND:
+                ticket.reads = True
+                for command in queue:
+                    if command.record.name.startswith(READS):
+                        command.finish(metrics.DROPPED)
+                    else:
+                        ticket.reads = False
+                queue = [command for command in queue if not command.done]
+        for command in queue:
+            command.finish(metrics.DROPPED)
+        for command in pending:
+            metrics.emit(command.record)
+        return [command.result for command in pending]
+
+    def _turn(self, queue, timeout: float, ticket: _Ticket, probe: bool = False):
+        """Run ``queue`` until done or preempted, returns the commands not sent."""
+        with self._lock:
+            if self._transport is None:
+                for command in queue:
+                    command.finish(metrics.CLOSED)
+                return []
+            if self.down and not probe:
+                for command in queue:
+                    command.finish(metrics.DOWN)
+                return []
+            start = time.perf_counter()
+            if not self._acquire():
+                for command in queue:
+                    command.finish(metrics.REJECTED)
+                return []
+            locked = time.perf_counter()
+            first = queue[0].record
+            first.open_s += self._open_s
+            first.lock_wait_s += locked - start
+            self._open_s = 0.0
+            try:
+                return self._run(queue, timeout, ticket, probe)
+            finally:
+                self._in_flight = []
+                self._release()
+                first.lock_hold_s += time.perf_counter() - locked
+
+    def _run(self, pending, timeout: float, ticket: _Ticket, probe: bool = False):
+        queue = list(pending)
+        in_flight = self._in_flight = []
+        window = 1 if ticket.priority == BACKGROUND else self.window
+        preempted = self._scheduler.preempted
+        # checked once per pipeline, formatting costs nothing while quiet
+        self._debug = self.log.isEnabledFor(logging.DEBUG)
+        while in_flight or (queue and not preempted(ticket) and (probe or not self.down)):
+            while queue and len(in_flight) < window and not preempted(ticket):
+                command = queue.pop(0)
+                lanes = {c.record.lane for c in in_flight}
+                command.record.lane = next(i for i in itertools.count() if i not in lanes)
+                self._write(command, timeout)
+                in_flight.append(command)
+            if not in_flight:
+                break
+            line = self._readline(min(command.deadline for command in in_flight))
+            if line is None:
+                now = time.perf_counter()
+                for command in in_flight:
+                    if command.deadline <= now:
+                        command.finish(metrics.TIMEOUT, now)
+                        self._timed_out()
+            else:
+                self._dispatch(line, in_flight)
+            in_flight[:] = [command for command in in_flight if not command.done]
+        return queue
+
+    def _timed_out(self):
+        self.failures += 1
+        if self.watchdog is not None:
+            self.watchdog.wake()
+
+    def probe(self, request: bytes, expect: str, timeout: float = None) -> bool:
+        """
+        Send a background command also while the session is down, True if it
+        was answered (for zuss.watchdog).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        command = _Pending(request, expect, self.name)
+        command.record.batch = next(_batches)
+        command.record.thread = threading.get_ident()
+        ticket = _Ticket(BACKGROUND, threading.get_ident(), True)
+        if self._scheduler.enter(ticket):
+            try:
+                self._turn([command], timeout, ticket, probe=True)
+            finally:
+                self._scheduler.leave(ticket)
+        if not command.done:
+            command.finish(metrics.DROPPED)
+        metrics.emit(command.record)
+        return command.record.outcome == metrics.OK
+
+    def _write(self, command: _Pending, timeout: float):
+        start = command.record.started = time.perf_counter()
+        self._transport.write(command.request)
+        if self._debug:
+            self.log.debug("> %s", command.request.decode("ascii", "replace"))
+        command.written = time.perf_counter()
+        command.record.write_s = command.written - start
+        command.deadline = command.written + timeout
+
+    def stream(self, request: bytes, expect: str, timeout: float = None,
+               priority: int = None):
+        """
+        Write one request and yield its display lines (str) as they arrive.
+        Ends at the answer frame, on an error frame or on timeout and returns
+        the outcome, which is also in its metrics record.  The port stays in
+        use until the generator is exhausted or closed, closing it early is fine::
+
+            for line in session.stream(b"<DISP_PORT_STATUS{}>", "[DISP_PORT_STATUS{ok}]"):
+                if line.startswith("ETH2:"):
+                    break
+        """
+        timeout = self.timeout if timeout is None else timeout
+        command = _Pending(request, expect, self.name)
+        record = command.record
+        record.batch = next(_batches)
+        record.thread = threading.get_ident()
+        priority = getattr(_context, "priority", NORMAL) if priority is None else priority
+        client = getattr(_context, "client", None)
+        ticket = _Ticket(priority, threading.get_ident() if client is None else client,
+                         record.name.startswith(READS))
+        if self.down or not self._scheduler.enter(ticket):
+            command.finish(metrics.DOWN if self.down else metrics.DROPPED)
+            metrics.emit(record)
+            return record.outcome
+        try:
+            with self._lock:
+                if self._transport is None:
+                    command.finish(metrics.CLOSED)
+                    return record.outcome
+                if self.down:
+                    command.finish(metrics.DOWN)
+                    return record.outcome
+                start = time.perf_counter()
+                if not self._acquire():
+                    command.finish(metrics.REJECTED)
+                    return record.outcome
+                locked = time.perf_counter()
+                record.open_s, self._open_s = self._open_s, 0.0
+                record.lock_wait_s = locked - start
+                try:
+                    self._debug = self.log.isEnabledFor(logging.DEBUG)
+                    self._in_flight = [command]
+                    self._write(command, timeout)
+                    while True:
+                        line = self._readline(command.deadline)
+                        if line is None:
+                            command.finish(metrics.TIMEOUT, time.perf_counter())
+                            self._timed_out()
+                            return record.outcome
+                        owner = self._dispatch(line, self._in_flight)
+                        if command.done:
+                            return record.outcome
+                        if owner is command:
+                            yield line
+                finally:
+                    self._in_flight = []
+                    if not command.done:
+                        # its remaining lines and answer frame are skipped
+                        self._orphans.append((command.head, command.deadline))
+                        command.finish(metrics.STOPPED, time.perf_counter())
+                    self._release()
+                    record.lock_hold_s = time.perf_counter() - locked
+        finally:
+            self._scheduler.leave(ticket)
+            metrics.emit(record)
+
+    def request(self, request: bytes, expect: str, timeout: float = None,
+                priority: int = None):
+        """
+        Write one request and wait for the frame answering it.
+        Returns the answer line if it contains ``expect``, otherwise None.
+        """
+        return self.pipeline([(request, expect)], timeout, priority)[0]
+
+
+@contextmanager
+def open_session(port, **kwargs):
+    """
+    Yield an open Session for ``port``.  An already opened Session is used as
+    it is and stays open, so several SDK calls can share one connection.
+    """
+    if isinstance(port, Session):
+        yield port
+        return
+    session = Session(port, **kwargs)
+    session.open()
+    try:
+        yield session
+    finally:
+        session.close()
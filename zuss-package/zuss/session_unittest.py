@@ -0,0 +1,200 @@
+# -----------------------------------------------------------------------------
+# - File              session_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    session_unittest
+# - Brief             session_unittest for transports and command sessions
+# -----------------------------------------------------------------------------
+import socket
+import threading
+import time
+import unittest
+
+from zuss import *
+from zuss import metrics
+from zuss.session import (
+    BACKGROUND, EMERGENCY, NORMAL, Session, _Scheduler, _Ticket, open_session, scheduling,
+)
+from zuss.simulator import ConverterModel, SwitchModel
+from zuss.transport import FakeTransport, open_transport
+
+
+class ModelServer:
+    """TCP server answering like a ser2net raw port in front of a switch."""
+
+    def __init__(self):
+        self.model = SwitchModel()
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen()
+        self.url = "socket://127.0.0.1:%d" % self.server.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                con, _ = self.server.accept()
+            except OSError:
+                return
+            with con:
+                while True:
+                    data = con.recv(1024)
+                    if not data:
+                        break
+                    for line in self.model.feed(data):
+                        con.sendall(line.encode() + b"\r\n")
+
+    def close(self):
+        self.server.close()
+
+
+class TestTransport(unittest.TestCase):
+    def test_fake_keeps_state(self):
+        self.assertTrue(set_host_port("fake://switch/state", 4))
+        self.assertEqual(4, get_host_port("fake://switch/state"))
+
+    def test_fake_unknown_device(self):
+        with self.assertRaises(ValueError):
+            open_transport("fake://toaster")
+
+    def test_loop(self):
+        with open_transport("loop://", timeout=0.1) as transport:
+            transport.write(b"[GET_HOST_PORT{2}]\r\n")
+            self.assertEqual(b"[GET_HOST_PORT{2}]\r\n", transport.readline())
+
+    def test_socket(self):
+        server = ModelServer()
+        try:
+            self.assertTrue(set_dev_port(server.url, 3))
+            self.assertEqual(3, get_dev_port(server.url))
+        finally:
+            server.close()
+
+
+class TestSession(unittest.TestCase):
+    def test_error_frame_fails_fast(self):
+        with Session("fake://switch/error") as session:
+            start = time.monotonic()
+            self.assertIsNone(
+                session.request(b"<SET_HOST_PORT{5}>", "[SET_HOST_PORT{5}]")
+            )
+            self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_timeout(self):
+        with Session("fake://switch/timeout", timeout=0.2) as session:
+            start = time.monotonic()
+            self.assertIsNone(session.request(b"<NO_SUCH_CMD{}>", "[NO_SUCH_CMD{"))
+            self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_pipeline_hides_latency(self):
+        transport = FakeTransport(SwitchModel(), latency=0.02)
+        commands = [(b"<SET_HOST_PORT{%d}>" % n, "[SET_HOST_PORT{%d}]" % n) for n in (1, 2, 3, 4)]
+        commands += [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{4}]")]
+        with Session(transport) as session:
+            start = time.monotonic()
+            results = session.pipeline(commands)
+            elapsed = time.monotonic() - start
+        self.assertTrue(all(results))
+        self.assertLess(elapsed, 0.08)
+
+    def test_shared_session(self):
+        with open_session("fake://switch/shared") as session:
+            self.assertTrue(set_relay_mask(session, 0x5))
+            self.assertEqual(0x5, get_relay_mask(session))
+            self.assertTrue(session.is_open)
+        self.assertFalse(session.is_open)
+
+    def test_stream(self):
+        with Session("fake://converter/stream") as session:
+            lines = list(session.stream(b"<DISP_PORT_STATUS{}>", "[DISP_PORT_STATUS{ok}]"))
+        self.assertEqual(["ETH1", "ETH2", "BRR1", "BRR2"], [line[:4] for line in lines])
+
+    def test_stream_closed_early(self):
+        records = []
+        metrics.add_hook(records.append)
+        self.addCleanup(metrics.remove_hook, records.append)
+        transport = FakeTransport(ConverterModel(), latency=0.02)
+        request = (b"<DISP_PORT_STATUS{}>", "[DISP_PORT_STATUS{ok}]")
+        with Session(transport) as session:
+            for line in session.stream(*request):
+                break
+            self.assertTrue(line.startswith("ETH1:"))
+            # the rest of the first output must not be taken for the second
+            lines = list(session.stream(*request))
+            self.assertEqual("ETH1", lines[0][:4])
+            self.assertEqual(4, len(lines))
+            self.assertTrue(session.request(b"<GET_OP_MODE{}>", "[GET_OP_MODE{"))
+        self.assertEqual([metrics.STOPPED, metrics.OK, metrics.OK],
+                         [record.outcome for record in records])
+
+    def test_open_failure(self):
+        session = Session("/dev/does-not-exist").open()
+        self.assertFalse(session.is_open)
+        self.assertIsNone(session.request(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{"))
+
+
+class TestScheduling(unittest.TestCase):
+    def test_emergency_preempts_background(self):
+        records = []
+        metrics.add_hook(records.append)
+        transport = FakeTransport(SwitchModel(), latency=0.01)
+        polls = [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")] * 100
+        with Session(transport) as session:
+            poller = threading.Thread(target=session.pipeline, args=(polls, None, BACKGROUND))
+            poller.start()
+            time.sleep(0.05)
+            start = time.monotonic()
+            with scheduling(EMERGENCY):
+                self.assertTrue(set_pwr_mask(session, 0))
+            elapsed = time.monotonic() - start
+            poller.join()
+        metrics.remove_hook(records.append)
+        # one poll in flight, then the power off
+        self.assertLess(elapsed, 0.05)
+        outcomes = [r.outcome for r in records if r.name == "GET_HOST_PORT"]
+        self.assertIn(metrics.DROPPED, outcomes)
+        self.assertLess(outcomes.count(metrics.OK), 20)
+
+    def test_preempted_writes_continue(self):
+        transport = FakeTransport(SwitchModel(), latency=0.01)
+        commands = [(b"<SET_HOST_PORT{%d}>" % n, "[SET_HOST_PORT{%d}]" % n) for n in (1, 2, 3, 4)]
+        commands += [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")] * 4
+        with Session(transport) as session:
+            results = []
+            worker = threading.Thread(
+                target=lambda: results.extend(session.pipeline(commands, None, BACKGROUND)))
+            worker.start()
+            time.sleep(0.015)
+            self.assertTrue(session.request(b"<SET_POWER_MASK{0x0}>", "[SET_POWER_MASK{0x0}]",
+                                            priority=EMERGENCY))
+            worker.join()
+        # the switch ports are set, the reads made way
+        self.assertTrue(all(results[:4]))
+        self.assertIn(None, results[4:])
+
+    def test_round_robin_between_clients(self):
+        scheduler = _Scheduler()
+        holder = _Ticket(NORMAL, "holder", False)
+        self.assertTrue(scheduler.enter(holder))
+        order = []
+
+        def run(ticket):
+            scheduler.enter(ticket)
+            order.append(ticket.client)
+            scheduler.leave(ticket)
+
+        threads = []
+        for client in "aaab":
+            threads.append(threading.Thread(target=run, args=(_Ticket(NORMAL, client, False),)))
+            threads[-1].start()
+            while sum(len(q) for q in scheduler._queues[NORMAL].values()) < len(threads):
+                time.sleep(0.001)
+        scheduler.leave(holder)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(list("abaa"), order)
+
+
+if __name__ == "__main__":
+    unittest.main()
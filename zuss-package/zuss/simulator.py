@@ -0,0 +1,532 @@
+# -----------------------------------------------------------------------------
+# - File              simulator.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Virtual ZD USB Switch / ZD-Converter2000 on a Linux pty
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Device simulator speaking the ``<CMD{...}>`` / ``[CMD{...}]`` UART protocol.
+
+Every virtual device is a pseudo-terminal: the SDK opens ``device.port``
+(e.g. ``/dev/pts/7``) exactly like a real ``/dev/ttyUSB0``.  All devices of a
+:class:`Simulator` are served by a single background thread, so dozens of
+devices can be created on a plain Linux box::
+
+    with Simulator(latency=0.002, jitter=0.001) as sim:
+        switch = sim.add_switch()
+        converter = sim.add_converter()
+        zuss.set_host_port(switch.port, 3)
+
+The ``DISP_*`` body lines are illustrative; only the acknowledge frames are
+taken from the device manuals.
+"""
+
+import heapq
+import os
+import random
+import re
+import selectors
+import threading
+import time
+
+FRAME_END = "\r\n"
+
+_REQUEST = re.compile(rb"<([A-Z_]+)\{([^}<>]*)\}>")
+
+
+def _ints(args: str):
+    """Split a request payload such as ``"1, 0"`` into ints, None if invalid."""
+    if not args.strip():
+        return []
+    try:
+        return [int(a.strip(), 0) for a in args.split(",")]
+    except ValueError:
+        return None
+
+
+class DeviceModel:
+    """
+    Protocol state machine shared by both device types.
+
+    Subclasses implement one ``_cmd_<name>`` method per command.  Each method
+    receives the decoded integer arguments and returns the payloads of the
+    response lines; the last line becomes the ``[NAME{...}]`` acknowledge.
+    """
+
+    kind = None
+    version = None
+
+    def __init__(self, version: str = None):
+        if version is not None:
+            self.version = version
+        self.saved = self.defaults()
+        self.config = self.defaults()
+        self._buffer = b""
+        self.commands = 0
+
+    def defaults(self):
+        raise NotImplementedError
+
+    def feed(self, data: bytes):
+        """
+        Consume request bytes and return the response lines (without line end).
+        Incomplete requests are kept until the rest arrives.
+        """
+        self._buffer += data
+        lines = []
+        end = 0
+        for match in _REQUEST.finditer(self._buffer):
+            end = match.end()
+            lines.extend(
+                self.handle(match.group(1).decode("ascii"), match.group(2).decode())
+            )
+        if end:
+            self._buffer = self._buffer[end:]
+        elif len(self._buffer) > 256:
+            # garbage without any frame, keep only a possible partial request
+            self._buffer = self._buffer[self._buffer.rfind(b"<") :]
+        return lines
+
+    def handle(self, name: str, args: str):
+        """Execute one request, returns the response lines."""
+        self.commands += 1
+        method = getattr(self, "_cmd_" + name.lower(), None)
+        if method is None:
+            # unknown commands are silently ignored by the firmware
+            return []
+        values = _ints(args)
+        if values is None:
+            return [f"[{name}{{error}}]"]
+        try:
+            payloads = method(*values)
+        except TypeError:
+            # wrong number of arguments
+            payloads = None
+        if payloads is None:
+            return [f"[{name}{{error}}]"]
+        *body, ack = payloads
+        return list(body) + [f"[{name}{{{ack}}}]"]
+
+    def _cmd_get_sw_version(self):
+        return [self.version]
+
+    def _cmd_reboot_sys(self):
+        self.config = dict(self.saved)
+        return ["ok"]
+
+    def _cmd_save_config(self):
+        self.saved = dict(self.config)
+        return ["ok"]
+
+    def _cmd_disp_config(self):
+        return [f"{key}={value}" for key, value in self.config.items()] + ["ok"]
+
+
+class SwitchModel(DeviceModel):
+    """ZD USB Switch: host/device ports, relay and power masks."""
+
+    kind = "zuss"
+    version = "v2.1.2 2021-09-27"
+    # commands of firmware v2.1
+    RELAY_COMMANDS = ("SET_RELAY", "GET_RELAY", "SET_POWER", "GET_POWER")
+
+    def handle(self, name: str, args: str):
+        if name in self.RELAY_COMMANDS and self._firmware() < (2, 1):
+            # older firmware ignores them like any unknown command
+            self.commands += 1
+            return []
+        return super().handle(name, args)
+
+    def _firmware(self):
+        return tuple(int(part) for part in self.version.split()[0].lstrip("v").split("."))
+
+    def defaults(self):
+        return {"host_port": 1, "device_port": 1, "relay_mask": 0x0, "power_mask": 0xF}
+
+    def _cmd_clear_config(self):
+        self.saved = self.defaults()
+        self.config = self.defaults()
+        return ["ok"]
+
+    def _cmd_disp_config(self):
+        return [
+            f"host_port={self.config['host_port']}",
+            f"device_port={self.config['device_port']}",
+            f"relay_mask={hex(self.config['relay_mask'])}",
+            f"power_mask={hex(self.config['power_mask'])}",
+            "ok",
+        ]
+
+    def _set_port(self, key, num):
+        if num not in (1, 2, 3, 4):
+            return None
+        self.config[key] = num
+        return [str(num)]
+
+    def _set_mask(self, key, mask):
+        if not 0 <= mask <= 0xF:
+            return None
+        self.config[key] = mask
+        return [hex(mask)]
+
+    def _set_bit(self, key, index, control):
+        if index not in (1, 2, 3, 4) or control not in (0, 1):
+            return None
+        bit = 1 << (index - 1)
+        if control:
+            self.config[key] |= bit
+        else:
+            self.config[key] &= ~bit
+        return [f"{index},{control}"]
+
+    def _get_bit(self, key, index):
+        if index not in (1, 2, 3, 4):
+            return None
+        return [f"{index},{(self.config[key] >> (index - 1)) & 1}"]
+
+    def _cmd_set_host_port(self, num=0):
+        return self._set_port("host_port", num)
+
+    def _cmd_get_host_port(self):
+        return [str(self.config["host_port"])]
+
+    def _cmd_set_device_port(self, num=0):
+        return self._set_port("device_port", num)
+
+    def _cmd_get_device_port(self):
+        return [str(self.config["device_port"])]
+
+    def _cmd_set_relay_mask(self, mask=-1):
+        return self._set_mask("relay_mask", mask)
+
+    def _cmd_get_relay_mask(self):
+        return [hex(self.config["relay_mask"])]
+
+    def _cmd_set_power_mask(self, mask=-1):
+        return self._set_mask("power_mask", mask)
+
+    def _cmd_get_power_mask(self):
+        return [hex(self.config["power_mask"])]
+
+    def _cmd_set_relay(self, relay=0, control=-1):
+        return self._set_bit("relay_mask", relay, control)
+
+    def _cmd_get_relay(self, relay=0):
+        return self._get_bit("relay_mask", relay)
+
+    def _cmd_set_power(self, device=0, control=-1):
+        return self._set_bit("power_mask", device, control)
+
+    def _cmd_get_power(self, device=0):
+        return self._get_bit("power_mask", device)
+
+
+class ConverterModel(DeviceModel):
+    """
+    ZD-Converter2000: op mode, ETH/BRR speed, force down, BRR role and mode.
+    Settings are written to RAM; the reported status only follows after a
+    reboot, like on the real converter.
+    """
+
+    kind = "zcts"
+    version = "v1.0.3 2021-06-21"
+
+    PORTS = ("ETH1", "ETH2", "BRR1", "BRR2")
+
+    def __init__(self, version: str = None):
+        super().__init__(version)
+        self.active = dict(self.config)
+        self.statistics = {
+            port: dict.fromkeys(
+                ("TxFrames", "RxFrames", "TxBytes", "RxBytes", "TxDrop", "RxDrop"), 0
+            )
+            for port in self.PORTS
+        }
+
+    def defaults(self):
+        config = {"op_mode": -1}
+        for port in self.PORTS:
+            config[port + "_speed"] = 1000
+            config[port + "_down"] = 0
+        for port in ("BRR1", "BRR2"):
+            config[port + "_role"] = 0
+            config[port + "_mode"] = 0
+        return config
+
+    def _cmd_reboot_sys(self):
+        lines = super()._cmd_reboot_sys()
+        self.active = dict(self.config)
+        return lines
+
+    def _cmd_clear_config(self):
+        self.saved = self.defaults()
+        return ["ok"]
+
+    def _link(self, port):
+        return "down" if self.active[port + "_down"] else "up"
+
+    def _cmd_disp_port_status(self):
+        lines = []
+        for port in self.PORTS:
+            line = f"{port}: speed={self.active[port + '_speed']} link={self._link(port)}"
+            if port.startswith("BRR"):
+                line += (
+                    f" role={('master', 'slave')[self.active[port + '_role']]}"
+                    f" mode={('ieee', 'legacy')[self.active[port + '_mode']]}"
+                )
+            lines.append(line)
+        return lines + ["ok"]
+
+    def _cmd_disp_port_statistics(self):
+        lines = []
+        for port in self.PORTS:
+            counters = self.statistics[port]
+            if self._link(port) == "up":
+                frames = random.randint(10, 100)
+                counters["TxFrames"] += frames
+                counters["RxFrames"] += frames
+                counters["TxBytes"] += frames * 64
+                counters["RxBytes"] += frames * 64
+            values = " ".join(f"{key}={value}" for key, value in counters.items())
+            lines.append(f"{port}: {values}")
+        return lines + ["ok"]
+
+    def _cmd_set_op_mode(self, value=-1):
+        if value not in (0, 1, 2, 3):
+            return None
+        self.config["op_mode"] = value
+        return [str(value)]
+
+    def _cmd_get_op_mode(self):
+        config = self.config["op_mode"]
+        status = max(self.active["op_mode"], 0)
+        return [f"{int(config != -1)},{config},{status}"]
+
+    def _set(self, prefix, port, key, value, valid, spaced=False):
+        if port not in (1, 2) or value not in valid:
+            return None
+        self.config[f"{prefix}{port}_{key}"] = value
+        return [f"{port}, {value}" if spaced else f"{port},{value}"]
+
+    def _get(self, prefix, port, key):
+        if port not in (1, 2):
+            return None
+        name = f"{prefix}{port}_{key}"
+        return [f"{port},{self.config[name]},{self.active[name]}"]
+
+    def _cmd_set_eth_speed(self, port=0, speed=0):
+        return self._set("ETH", port, "speed", speed, (100, 1000))
+
+    def _cmd_get_eth_speed(self, port=0):
+        return self._get("ETH", port, "speed")
+
+    def _cmd_set_eth_down(self, port=0, com=-1):
+        return self._set("ETH", port, "down", com, (0, 1), spaced=True)
+
+    def _cmd_get_eth_down(self, port=0):
+        return self._get("ETH", port, "down")
+
+    def _cmd_set_brr_speed(self, port=0, speed=0):
+        return self._set("BRR", port, "speed", speed, (100, 1000))
+
+    def _cmd_get_brr_speed(self, port=0):
+        return self._get("BRR", port, "speed")
+
+    def _cmd_set_brr_down(self, port=0, com=-1):
+        return self._set("BRR", port, "down", com, (0, 1), spaced=True)
+
+    def _cmd_get_brr_down(self, port=0):
+        return self._get("BRR", port, "down")
+
+    def _cmd_set_brr_role(self, port=0, com=-1):
+        return self._set("BRR", port, "role", com, (0, 1), spaced=True)
+
+    def _cmd_get_brr_role(self, port=0):
+        return self._get("BRR", port, "role")
+
+    def _cmd_set_brr_mode(self, port=0, com=-1):
+        return self._set("BRR", port, "mode", com, (0, 1), spaced=True)
+
+    def _cmd_get_brr_mode(self, port=0):
+        return self._get("BRR", port, "mode")
+
+
+class VirtualDevice:
+    """One simulated device behind a pseudo-terminal."""
+
+    def __init__(self, model: DeviceModel, latency: float, jitter: float):
+        self.model = model
+        self.latency = latency
+        self.jitter = jitter
+        import tty
+
+        self.master_fd, self.slave_fd = os.openpty()
+        # raw mode: no echo and no CR/LF translation on the device side
+        tty.setraw(self.slave_fd)
+        os.set_blocking(self.master_fd, False)
+        self.port = os.ttyname(self.slave_fd)
+
+    @property
+    def kind(self):
+        return self.model.kind
+
+    def close(self):
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __repr__(self):
+        return f"<VirtualDevice {self.kind} {self.port}>"
+
+
+class Simulator:
+    """
+    Owns a set of virtual devices and serves all of them from one thread.
+
+    :param latency: fixed delay (seconds) before a device answers a request
+    :param jitter: additional uniformly distributed random delay (seconds)
+    :param seed: seed of the jitter random generator, for reproducible runs
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.devices = []
+        self._random = random.Random(seed)
+        self._selector = selectors.DefaultSelector()
+        self._pending = []  # heap of (due, sequence, device, data)
+        self._sequence = 0
+        self._added = []  # devices registered by the serving thread
+        self._lock = threading.Lock()
+        self._wake_r, self._wake_w = os.pipe()
+        self._selector.register(self._wake_r, selectors.EVENT_READ, None)
+        self._thread = None
+        self._running = False
+
+    def add_device(
+        self, model: DeviceModel, latency: float = None, jitter: float = None
+    ) -> VirtualDevice:
+        device = VirtualDevice(
+            model,
+            self.latency if latency is None else latency,
+            self.jitter if jitter is None else jitter,
+        )
+        with self._lock:
+            self.devices.append(device)
+            self._added.append(device)
+        self._wake()
+        return device
+
+    def add_switch(self, **kwargs) -> VirtualDevice:
+        version = kwargs.pop("version", None)
+        return self.add_device(SwitchModel(version), **kwargs)
+
+    def add_converter(self, **kwargs) -> VirtualDevice:
+        version = kwargs.pop("version", None)
+        return self.add_device(ConverterModel(version), **kwargs)
+
+    def start(self):
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name="zuss-simulator", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        self._wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for device in self.devices:
+            device.close()
+        self.devices = []
+        self._selector.close()
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _wake(self):
+        os.write(self._wake_w, b"\0")
+
+    def _schedule(self, device, lines):
+        delay = device.latency
+        if device.jitter:
+            delay += self._random.uniform(0, device.jitter)
+        data = "".join(line + FRAME_END for line in lines).encode("ascii")
+        self._sequence += 1
+        heapq.heappush(
+            self._pending, (time.monotonic() + delay, self._sequence, device, data)
+        )
+
+    def _run(self):
+        while self._running:
+            with self._lock:
+                added, self._added = self._added, []
+            for device in added:
+                self._selector.register(device.master_fd, selectors.EVENT_READ, device)
+            timeout = None
+            if self._pending:
+                timeout = max(0.0, self._pending[0][0] - time.monotonic())
+            for key, _ in self._selector.select(timeout):
+                device = key.data
+                if device is None:
+                    os.read(self._wake_r, 512)
+                    continue
+                try:
+                    data = os.read(device.master_fd, 4096)
+                except (BlockingIOError, OSError):
+                    continue
+                lines = device.model.feed(data)
+                if lines:
+                    self._schedule(device, lines)
+            now = time.monotonic()
+            while self._pending and self._pending[0][0] <= now:
+                _, _, device, data = heapq.heappop(self._pending)
+                try:
+                    os.write(device.master_fd, data)
+                except OSError:
+                    pass
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="zuss-simulator",
+        description="Virtual ZD USB Switch / ZD-Converter2000 devices on ptys",
+    )
+    parser.add_argument("--switches", type=int, default=1, help="Number of USB switches")
+    parser.add_argument("--converters", type=int, default=0, help="Number of converters")
+    parser.add_argument("--latency", type=float, default=0.0, help="Answer delay in s")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay in s")
+    parser.add_argument("--seed", type=int, help="Seed of the jitter generator")
+    args = parser.parse_args(argv)
+
+    with Simulator(args.latency, args.jitter, args.seed) as sim:
+        for _ in range(args.switches):
+            print(f"zuss {sim.add_switch().port}")
+        for _ in range(args.converters):
+            print(f"zcts {sim.add_converter().port}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
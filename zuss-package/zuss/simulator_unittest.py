@@ -0,0 +1,86 @@
+# -----------------------------------------------------------------------------
+# - File              simulator_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    simulator_unittest
+# - Brief             simulator_unittest for the virtual ZD devices
+# -----------------------------------------------------------------------------
+import time
+import unittest
+
+import serial
+
+from zuss.simulator import ConverterModel, Simulator, SwitchModel
+
+
+class TestSwitchModel(unittest.TestCase):
+    def test_ports_and_masks(self):
+        model = SwitchModel()
+        self.assertEqual(["[SET_HOST_PORT{3}]"], model.feed(b"<SET_HOST_PORT{3}>"))
+        self.assertEqual(["[GET_HOST_PORT{3}]"], model.feed(b"<GET_HOST_PORT{}>"))
+        self.assertEqual(["[SET_HOST_PORT{error}]"], model.feed(b"<SET_HOST_PORT{5}>"))
+        self.assertEqual(["[SET_RELAY_MASK{0xa}]"], model.feed(b"<SET_RELAY_MASK{0xa}>"))
+        self.assertEqual(["[GET_RELAY{2,1}]"], model.feed(b"<GET_RELAY{2}>"))
+        self.assertEqual(["[SET_POWER{4,0}]"], model.feed(b"<SET_POWER{4,0}>"))
+        self.assertEqual(["[GET_POWER_MASK{0x7}]"], model.feed(b"<GET_POWER_MASK{}>"))
+
+    def test_partial_request(self):
+        model = SwitchModel()
+        self.assertEqual([], model.feed(b"<GET_DEVICE"))
+        self.assertEqual(["[GET_DEVICE_PORT{1}]"], model.feed(b"_PORT{}>"))
+
+    def test_save_and_clear(self):
+        model = SwitchModel()
+        model.feed(b"<SET_DEVICE_PORT{4}><SAVE_CONFIG{}><SET_DEVICE_PORT{2}>")
+        model.feed(b"<REBOOT_SYS{}>")
+        self.assertEqual(4, model.config["device_port"])
+        self.assertEqual(["[CLEAR_CONFIG{ok}]"], model.feed(b"<CLEAR_CONFIG{}>"))
+        self.assertEqual(1, model.config["device_port"])
+
+
+class TestConverterModel(unittest.TestCase):
+    def test_status_follows_after_reboot(self):
+        model = ConverterModel()
+        self.assertEqual(["[SET_ETH_SPEED{2,100}]"], model.feed(b"<SET_ETH_SPEED{2,100}>"))
+        self.assertEqual(["[GET_ETH_SPEED{2,100,1000}]"], model.feed(b"<GET_ETH_SPEED{2}>"))
+        model.feed(b"<SAVE_CONFIG{}><REBOOT_SYS{}>")
+        self.assertEqual(["[GET_ETH_SPEED{2,100,100}]"], model.feed(b"<GET_ETH_SPEED{2}>"))
+
+    def test_set_acks(self):
+        model = ConverterModel()
+        self.assertEqual(["[SET_BRR_ROLE{1, 1}]"], model.feed(b"<SET_BRR_ROLE{1,1}>"))
+        self.assertEqual(["[SET_OP_MODE{2}]"], model.feed(b"<SET_OP_MODE{2}>"))
+        self.assertEqual(["[GET_OP_MODE{1,2,0}]"], model.feed(b"<GET_OP_MODE{}>"))
+        self.assertEqual(["[SET_BRR_SPEED{error}]"], model.feed(b"<SET_BRR_SPEED{3,100}>"))
+
+    def test_display_terminator(self):
+        lines = ConverterModel().feed(b"<DISP_PORT_STATISTICS{}>")
+        self.assertEqual(5, len(lines))
+        self.assertEqual("[DISP_PORT_STATISTICS{ok}]", lines[-1])
+
+
+class TestSimulator(unittest.TestCase):
+    def test_many_devices(self):
+        with Simulator() as sim:
+            devices = [sim.add_switch() for _ in range(16)]
+            devices += [sim.add_converter() for _ in range(16)]
+            for device in devices:
+                with serial.Serial(device.port, 115200, timeout=1) as con:
+                    con.write(b"<GET_SW_VERSION{}>")
+                    self.assertIn(b"[GET_SW_VERSION{v", con.readline())
+
+    def test_latency(self):
+        with Simulator(latency=0.05, jitter=0.01, seed=1) as sim:
+            device = sim.add_switch()
+            with serial.Serial(device.port, 115200, timeout=1) as con:
+                start = time.monotonic()
+                con.write(b"<GET_HOST_PORT{}>")
+                self.assertEqual(b"[GET_HOST_PORT{1}]\r\n", con.readline())
+                elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertLess(elapsed, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# -----------------------------------------------------------------------------
+# - File              startup_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    startup_unittest
+# - Brief             startup_unittest for import time and lazy imports
+# -----------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import unittest
+
+# cumulative import time of the zuss package, override on slow machines
+IMPORT_BUDGET_MS = float(os.environ.get("ZUSS_IMPORT_BUDGET_MS", 150))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY = ("colorama", "serial", "serial.tools.list_ports", "argparse")
+
+
+def run_python(*args):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def loaded_after(code: str):
+    script = code + "\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    return set(run_python("-c", script).stdout.split())
+
+
+class TestStartup(unittest.TestCase):
+    def test_lazy_imports(self):
+        modules = loaded_after("import zuss")
+        for name in LAZY:
+            self.assertNotIn(name, modules)
+
+    def test_cli_without_color(self):
+        modules = loaded_after(
+            "import runpy, sys\n"
+            "sys.argv = ['zuss', '-P', 'fake://switch', '--gethost']\n"
+            "try:\n"
+            "    runpy.run_module('zuss.cmd', run_name='__main__')\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        self.assertNotIn("colorama", modules)
+        self.assertNotIn("serial", modules)
+
+    def test_color_on_demand(self):
+        modules = loaded_after("import zuss\nzuss.detect_comports()")
+        self.assertIn("colorama", modules)
+        self.assertIn("serial.tools.list_ports", modules)
+
+    def test_import_budget(self):
+        best = None
+        for _ in range(3):
+            # -X importtime: "import time: self | cumulative | name" on stderr
+            lines = run_python("-X", "importtime", "-c", "import zuss").stderr.splitlines()
+            total = [int(line.split("|")[1]) for line in lines if line.endswith("| zuss")]
+            best = total[0] if best is None else min(best, total[0])
+        self.assertLess(best / 1000, IMPORT_BUDGET_MS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,289 @@
+# -----------------------------------------------------------------------------
+# - File              state.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Device state table in shared memory
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+The last known state of every device in shared memory: host port, device port,
+relay and power mask of the switches, op mode and speed, force down and link
+of the converter ports.  The sessions of a publishing process (zussd, the
+fleet workers, a test runner) fill it in from the answers of the devices, any
+process of the machine reads it without sending a command::
+
+    zuss.state.publish()
+
+    table = zuss.state.StateTable.open()
+    table.get("/dev/ttyUSB0").host_port
+
+Values are -1 until the device reported them.  A record carries a sequence
+number, odd while it is written, and the time.time() of its last update; a
+read copies the record straight out of the shared buffer and retries if the
+sequence number moved meanwhile.  Converter settings count once active, so
+only GET_* answers and DISP_PORT_STATUS change them, not SET_* acks.
+
+The table stays until :meth:`StateTable.unlink`, the name is
+``$ZUSS_STATE`` or ``zuss-state``.
+"""
+
+import os
+import struct
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+from zuss import lock, session
+from zuss.frames import parse_control, parse_display, parse_int, parse_op_mode, parse_setting
+from zuss.session import frame_name
+
+NAME = os.environ.get("ZUSS_STATE") or "zuss-state"
+# records of a new table
+SLOTS = 256
+
+PORTS = ("ETH1", "ETH2", "BRR1", "BRR2")
+KINDS = (None, "zuss", "zcts")
+
+_HEADER = struct.Struct("<4sHHI")  # magic, version, record size, slots
+_MAGIC = b"ZSST"
+_SEQUENCE = struct.Struct("<I")
+# sequence, timestamp, port, kind, host port, device port, relay mask,
+# power mask, op mode, speed[4], down[4], link[4]
+_RECORD = struct.Struct("<Id64sBbbhhb4h4b4b")
+_NAME_OFFSET = 12
+
+DeviceState = namedtuple(
+    "DeviceState",
+    "port kind sequence timestamp host_port device_port relay_mask power_mask "
+    "op_mode speed down link",
+)
+
+_FIELDS = {
+    "host_port": 4,
+    "device_port": 5,
+    "relay_mask": 6,
+    "power_mask": 7,
+    "op_mode": 8,
+}
+_SPEED, _DOWN, _LINK = 9, 13, 17
+# host port ... link[3] of a device nothing is known about
+_UNKNOWN = [-1] * 17
+
+
+def _shared_memory(name: str, create: bool, size: int = 0):
+    try:
+        return shared_memory.SharedMemory(name, create, size, track=False)
+    except TypeError:
+        # before Python 3.13 every process registers the segment and the
+        # resource tracker removes it when that process exits
+        from multiprocessing import resource_tracker
+
+        memory = shared_memory.SharedMemory(name, create, size)
+        resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+class StateTable:
+    """A state table in shared memory, see :meth:`open`."""
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.name = memory.name
+        magic, version, size, self.slots = _HEADER.unpack_from(memory.buf, 0)
+        if magic != _MAGIC or size != _RECORD.size:
+            raise ValueError(f"{self.name} is no zuss state table")
+        self._slots = {}  # port -> slot index, slots never move
+
+    @classmethod
+    def open(cls, name: str = NAME, slots: int = SLOTS) -> "StateTable":
+        """Attach to table ``name``, create it with ``slots`` records if missing."""
+        with lock.port_lock(f"state-{name}"):
+            try:
+                memory = _shared_memory(name, False)
+            except FileNotFoundError:
+                memory = _shared_memory(name, True, _HEADER.size + slots * _RECORD.size)
+                memory.buf[: len(memory.buf)] = bytes(len(memory.buf))
+                _HEADER.pack_into(memory.buf, 0, _MAGIC, 1, _RECORD.size, slots)
+        return cls(memory)
+
+    def close(self):
+        self.memory.close()
+
+    def unlink(self):
+        """Remove the table from the system."""
+        if not hasattr(self.memory, "_track"):
+            # unlink() unregisters it again, see _shared_memory()
+            from multiprocessing import resource_tracker
+
+            resource_tracker.register(self.memory._name, "shared_memory")
+        self.memory.unlink()
+
+    def _offset(self, slot: int) -> int:
+        return _HEADER.size + slot * _RECORD.size
+
+    def _find(self, port: str, create: bool):
+        slot = self._slots.get(port)
+        if slot is not None:
+            return slot
+        key = port.encode("utf8")[:64].ljust(64, b"\0")
+        buf = self.memory.buf
+        for slot in range(self.slots):
+            start = self._offset(slot) + _NAME_OFFSET
+            name = bytes(buf[start : start + 64])
+            if name == key:
+                self._slots[port] = slot
+                return slot
+            if name[0] == 0:
+                break
+        if not create:
+            return None
+        with lock.port_lock(f"state-{self.name}"):
+            for slot in range(self.slots):
+                start = self._offset(slot) + _NAME_OFFSET
+                name = bytes(buf[start : start + 64])
+                if name == key:
+                    break
+                if name[0] == 0:
+                    _RECORD.pack_into(buf, self._offset(slot), 0, time.time(), key, 0, *_UNKNOWN)
+                    break
+            else:
+                raise ValueError(f"state table {self.name} is full")
+        self._slots[port] = slot
+        return slot
+
+    def _read(self, slot: int) -> DeviceState:
+        buf = self.memory.buf
+        offset = self._offset(slot)
+        while True:
+            values = _RECORD.unpack_from(buf, offset)
+            # odd: being written; moved: written meanwhile
+            if not values[0] & 1 and _SEQUENCE.unpack_from(buf, offset)[0] == values[0]:
+                break
+        return DeviceState(
+            values[2].rstrip(b"\0").decode("utf8"),
+            KINDS[values[3]],
+            values[0] // 2,
+            values[1],
+            *values[4:9],
+            values[_SPEED : _SPEED + 4],
+            values[_DOWN : _DOWN + 4],
+            values[_LINK : _LINK + 4],
+        )
+
+    def get(self, port: str) -> DeviceState:
+        """The state of ``port``, None if it was never seen."""
+        slot = self._find(port, False)
+        return None if slot is None else self._read(slot)
+
+    def devices(self):
+        return [self._read(slot) for slot in range(self.slots)
+                if self.memory.buf[self._offset(slot) + _NAME_OFFSET] != 0]
+
+    def update(self, port: str, kind: str = None, reset: bool = False, **fields):
+        """
+        Write ``fields`` (host_port=2, speed={0: 1000}, ...) of ``port``;
+        ``reset`` forgets the known values first.  One writer per device.
+        """
+        buf = self.memory.buf
+        offset = self._offset(self._find(port, True))
+        values = list(_RECORD.unpack_from(buf, offset))
+        sequence = values[0] + 1
+        _SEQUENCE.pack_into(buf, offset, sequence)
+        if reset:
+            values[4:] = _UNKNOWN
+        if kind is not None:
+            values[3] = KINDS.index(kind)
+        for name, value in fields.items():
+            if name in _FIELDS:
+                values[_FIELDS[name]] = value
+            else:
+                base = {"speed": _SPEED, "down": _DOWN, "link": _LINK}[name]
+                for index, item in value.items():
+                    values[base + index] = item
+        values[0] = sequence
+        values[1] = time.time()
+        _RECORD.pack_into(buf, offset, *values)
+        _SEQUENCE.pack_into(buf, offset, sequence + 1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _bit(mask: int, index: int, control: int) -> int:
+    if mask < 0:
+        return mask
+    bit = 1 << (index - 1)
+    return mask | bit if control else mask & ~bit
+
+
+class _Publisher:
+    """Session observer turning answers into table updates."""
+
+    SWITCH = {
+        "SET_HOST_PORT": "host_port", "GET_HOST_PORT": "host_port",
+        "SET_DEVICE_PORT": "device_port", "GET_DEVICE_PORT": "device_port",
+        "SET_RELAY_MASK": "relay_mask", "GET_RELAY_MASK": "relay_mask",
+        "SET_POWER_MASK": "power_mask", "GET_POWER_MASK": "power_mask",
+    }
+    BITS = {"SET_RELAY": "relay_mask", "GET_RELAY": "relay_mask",
+            "SET_POWER": "power_mask", "GET_POWER": "power_mask"}
+    CONVERTER = {"GET_ETH_SPEED": ("speed", 0), "GET_ETH_DOWN": ("down", 0),
+                 "GET_BRR_SPEED": ("speed", 2), "GET_BRR_DOWN": ("down", 2)}
+
+    def __init__(self, table: StateTable):
+        self.table = table
+
+    def __call__(self, device: str, request: bytes, line: str):
+        name = frame_name(request)
+        update = self.table.update
+        if not line.startswith("["):
+            if name == "DISP_PORT_STATUS":
+                # ETH1: speed=1000 link=up ...
+                display = parse_display(line)
+                index = PORTS.index(display.port)
+                update(device, "zcts", speed={index: display.values["speed"]},
+                       link={index: int(display.values["link"] == "up")})
+            return
+        if name in self.SWITCH:
+            update(device, "zuss", **{self.SWITCH[name]: parse_int(line)})
+        elif name in self.BITS:
+            index, control = parse_control(line)
+            field = self.BITS[name]
+            state = self.table.get(device)
+            mask = -1 if state is None else getattr(state, field)
+            update(device, "zuss", **{field: _bit(mask, index, control)})
+        elif name in self.CONVERTER:
+            field, base = self.CONVERTER[name]
+            setting = parse_setting(line)
+            update(device, "zcts", **{field: {base + setting.port - 1: setting.active}})
+        elif name == "GET_OP_MODE":
+            update(device, "zcts", op_mode=parse_op_mode(line).status)
+        elif name in ("REBOOT_SYS", "CLEAR_CONFIG"):
+            # what the device runs with now is unknown until asked
+            update(device, reset=True)
+
+
+_publisher = None
+
+
+def publish(name: str = NAME) -> StateTable:
+    """Update table ``name`` from the answers of all sessions of this process."""
+    global _publisher
+    if _publisher is None:
+        _publisher = _Publisher(StateTable.open(name))
+        session.observers.append(_publisher)
+    return _publisher.table
+
+
+def unpublish():
+    global _publisher
+    if _publisher is not None:
+        session.observers.remove(_publisher)
+        _publisher.table.close()
+        _publisher = None
@@ -0,0 +1,89 @@
+# -----------------------------------------------------------------------------
+# - File              state_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    state_unittest
+# - Brief             state_unittest for the shared memory state table
+# -----------------------------------------------------------------------------
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+import zuss
+from zuss import state
+from zuss.session import Session
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+READ = """
+import sys
+from zuss.state import StateTable
+print(StateTable.open(sys.argv[1]).get(sys.argv[2]).host_port)
+"""
+
+
+class TestState(unittest.TestCase):
+    def setUp(self):
+        self.name = f"zuss-test-{os.getpid()}"
+        self.table = state.publish(self.name)
+
+    def tearDown(self):
+        state.unpublish()
+        table = state.StateTable.open(self.name)
+        table.unlink()
+        table.close()
+
+    def test_switch(self):
+        port = "fake://switch/state"
+        with Session(port) as session:
+            self.assertIsNone(self.table.get(port))
+            self.assertTrue(zuss.set_host_port(session, 3))
+            self.assertTrue(zuss.set_relay_mask(session, 0x5))
+            self.assertTrue(zuss.set_relay(session, 2, 1))
+            zuss.get_pwr_mask(session)
+        record = self.table.get(port)
+        self.assertEqual(("zuss", 3, -1, 0x7, 0xF), (
+            record.kind, record.host_port, record.device_port, record.relay_mask,
+            record.power_mask))
+        self.assertEqual(4, record.sequence)
+        self.assertLess(time.time() - record.timestamp, 5)
+        with Session(port) as session:
+            zuss.reboot_sys(session)
+        self.assertEqual(-1, self.table.get(port).host_port)
+
+    def test_converter(self):
+        port = "fake://converter/state"
+        with Session(port) as session:
+            session.request(b"<GET_ETH_SPEED{2}>", "[GET_ETH_SPEED{")
+            session.request(b"<DISP_PORT_STATUS{}>", "[DISP_PORT_STATUS{ok}]")
+        record = self.table.get(port)
+        self.assertEqual("zcts", record.kind)
+        self.assertEqual((1000, 1000, 1000, 1000), record.speed)
+        self.assertEqual((1, 1, 1, 1), record.link)
+        self.assertEqual((-1, -1, -1, -1), record.down)
+
+    def test_other_process(self):
+        port = "fake://switch/shared-state"
+        zuss.set_host_port(port, 2)
+        env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+        output = subprocess.run([sys.executable, "-c", READ, self.name, port],
+                                env=env, capture_output=True, text=True, check=True).stdout
+        self.assertEqual("2", output.strip())
+
+    def test_read_cost(self):
+        port = "fake://switch/cost"
+        zuss.get_host_port(port)
+        reader = state.StateTable.open(self.name)
+        start = time.perf_counter()
+        for _ in range(10000):
+            reader.get(port)
+        reader.close()
+        # microseconds, not a serial round-trip
+        self.assertLess((time.perf_counter() - start) / 10000, 50e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+# -----------------------------------------------------------------------------
+# - File              trace.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Chrome trace / Perfetto timeline of SDK activity
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Timeline of every command in the Chrome trace event format, to be opened with
+https://ui.perfetto.dev or chrome://tracing::
+
+    from zuss import trace
+
+    with trace.tracing("run.json"):
+        zuss.set_host_port("/dev/ttyUSB0", 3)
+
+Each device is shown as a process with one track per pipeline lane; a command
+is a slice with the children ``open``, ``write``, ``wait`` and ``parse``.  The
+threads of the program get a track each, with one slice per SDK call (a whole
+pipeline is one slice).  Commands which failed or timed out are coloured red.
+
+The tracer is a zuss.metrics hook: a command only appends its record to a
+buffer, the events are formatted and written by a background thread.
+"""
+
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+from zuss import metrics
+
+# seconds between two writes of the buffered events
+FLUSH_INTERVAL = 0.5
+
+_tracer = None
+
+
+def _us(seconds: float) -> float:
+    return round(seconds * 1e6, 3)
+
+
+class Tracer:
+    """
+    Writes the commands reported by zuss.metrics to a trace file.
+
+    The file is a JSON array which stays valid for the trace viewers even if
+    the program dies before :meth:`close` writes the closing bracket.
+    """
+
+    def __init__(self, path: str, interval: float = FLUSH_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._pid = os.getpid()
+        self._records = deque()
+        self._threads = {}  # thread ident -> name written to the trace
+        self._devices = {}  # device -> trace pid
+        self._lanes = set()
+        self._batches = {}  # thread ident -> [batch, start, end, names, failed]
+        self._first = True
+        self._file = open(path, "w", encoding="utf8")
+        self._file.write("[\n")
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._emit(self._meta("process_name", self._pid, 0, f"zuss threads ({self._pid})"))
+        self._thread = threading.Thread(target=self._loop, name="zuss-trace", daemon=True)
+        self._thread.start()
+
+    def __call__(self, record: metrics.CommandRecord):
+        """metrics hook, runs in the thread of the command: keep it cheap."""
+        if record.started is not None:
+            self._records.append((record, threading.current_thread().name))
+
+    @staticmethod
+    def _meta(kind: str, pid: int, tid: int, name: str):
+        return {"ph": "M", "name": kind, "pid": pid, "tid": tid, "args": {"name": name}}
+
+    def _emit(self, event: dict):
+        self._file.write(("" if self._first else ",\n") + json.dumps(event))
+        self._first = False
+
+    def _device(self, device: str) -> int:
+        pid = self._devices.get(device)
+        if pid is None:
+            # synthetic process ids after the real one, one per device
+            pid = self._devices[device] = self._pid * 1000 + len(self._devices) + 1
+            self._emit(self._meta("process_name", pid, 0, f"device {device}"))
+        return pid
+
+    def _span(self, name: str, pid: int, tid: int, start: float, duration: float,
+              args: dict = None, failed: bool = False):
+        event = {
+            "ph": "X",
+            "name": name,
+            "pid": pid,
+            "tid": tid,
+            "ts": _us(start),
+            "dur": _us(max(duration, 0.0)),
+        }
+        if args:
+            event["args"] = args
+        if failed:
+            event["cname"] = "terrible"
+        self._emit(event)
+
+    def _command(self, record: metrics.CommandRecord, thread_name: str):
+        pid = self._device(record.device)
+        tid = record.lane
+        if (pid, tid) not in self._lanes:
+            self._lanes.add((pid, tid))
+            self._emit(self._meta("thread_name", pid, tid, f"lane {tid}"))
+        failed = record.outcome != metrics.OK
+        start = record.started - record.open_s
+        written = record.started + record.write_s
+        end = written + record.wait_s
+        args = {
+            "outcome": record.outcome,
+            "bytes_out": record.bytes_out,
+            "bytes_in": record.bytes_in,
+        }
+        if record.first_byte_s is not None:
+            args["first_byte_ms"] = round(record.first_byte_s * 1000, 3)
+        self._span(record.name, pid, tid, start, end - start, args, failed)
+        if record.open_s:
+            self._span("open", pid, tid, start, record.open_s)
+        self._span("write", pid, tid, record.started, record.write_s)
+        wait = record.wait_s - record.parse_s
+        self._span("wait", pid, tid, written, wait, failed=failed)
+        if record.parse_s:
+            self._span("parse", pid, tid, written + wait, record.parse_s)
+        self._thread_slice(record, thread_name, start, end)
+
+    def _thread_slice(self, record: metrics.CommandRecord, thread_name: str,
+                      start: float, end: float):
+        current = self._batches.get(record.thread)
+        if current is not None and current[0] == record.batch:
+            current[1] = min(current[1], start)
+            current[2] = max(current[2], end)
+            current[3].append(record.name)
+            current[4] = current[4] or record.outcome != metrics.OK
+            return
+        if current is not None:
+            self._end_batch(record.thread)
+        if self._threads.get(record.thread) != thread_name:
+            # idents of finished threads are reused by new ones
+            self._threads[record.thread] = thread_name
+            self._emit(self._meta("thread_name", self._pid, record.thread, thread_name))
+        self._batches[record.thread] = [
+            record.batch, start, end, [record.name], record.outcome != metrics.OK
+        ]
+
+    def _end_batch(self, thread: int):
+        _, start, end, names, failed = self._batches.pop(thread)
+        name = names[0] if len(names) == 1 else f"pipeline ({len(names)})"
+        args = {"commands": names} if len(names) > 1 else None
+        self._span(name, self._pid, thread, start, end - start, args, failed)
+
+    def flush(self, final: bool = False):
+        """Write the buffered events, the open thread slices too if ``final``."""
+        with self._write_lock:
+            if self._file.closed:
+                return
+            while self._records:
+                self._command(*self._records.popleft())
+            if final:
+                for thread in list(self._batches):
+                    self._end_batch(thread)
+            self._file.flush()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        self.flush(final=True)
+        with self._write_lock:
+            if not self._file.closed:
+                self._file.write("\n]\n")
+                self._file.close()
+
+
+def start_tracing(path: str, interval: float = FLUSH_INTERVAL) -> Tracer:
+    """Trace all commands from now on into ``path``."""
+    global _tracer
+    stop_tracing()
+    _tracer = Tracer(path, interval)
+    metrics.add_hook(_tracer)
+    return _tracer
+
+
+def stop_tracing():
+    global _tracer
+    if _tracer is not None:
+        metrics.remove_hook(_tracer)
+        _tracer.close()
+        _tracer = None
+
+
+@contextmanager
+def tracing(path: str, interval: float = FLUSH_INTERVAL):
+    tracer = start_tracing(path, interval)
+    try:
+        yield tracer
+    finally:
+        stop_tracing()
@@ -0,0 +1,100 @@
+# -----------------------------------------------------------------------------
+# - File              trace_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    trace_unittest
+# - Brief             trace_unittest for the Chrome trace export
+# -----------------------------------------------------------------------------
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from zuss import *
+from zuss import trace
+from zuss.session import Session
+from zuss.simulator import SwitchModel
+from zuss.transport import FakeTransport
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+
+    def tearDown(self):
+        trace.stop_tracing()
+        os.remove(self.path)
+
+    def load(self):
+        with open(self.path) as f:
+            return json.load(f)
+
+    def test_command_slices(self):
+        with trace.tracing(self.path):
+            self.assertTrue(set_host_port("fake://switch/trace", 2))
+        events = self.load()
+        spans = [e for e in events if e["ph"] == "X"]
+        names = [e["name"] for e in spans]
+        for name in ("open", "write", "wait", "parse"):
+            self.assertIn(name, names)
+        device = [e for e in events if e["ph"] == "M" and e["name"] == "process_name"
+                  and e["args"]["name"] == "device fake://switch/trace"]
+        self.assertEqual(1, len(device))
+        command = [e for e in spans if e["name"] == "SET_HOST_PORT"]
+        # one slice on the device lane, one on the thread track
+        self.assertEqual(2, len(command))
+        self.assertEqual({device[0]["pid"], os.getpid()}, {e["pid"] for e in command})
+        lane = [e for e in command if e["pid"] == device[0]["pid"]][0]
+        self.assertEqual("ok", lane["args"]["outcome"])
+        for child in spans:
+            if child["pid"] == lane["pid"] and child["name"] != "SET_HOST_PORT":
+                self.assertGreaterEqual(child["ts"], lane["ts"])
+                self.assertLessEqual(child["ts"] + child["dur"], lane["ts"] + lane["dur"] + 1)
+
+    def test_pipeline_lanes(self):
+        transport = FakeTransport(SwitchModel(), latency=0.005, port="sw-trace")
+        with trace.tracing(self.path):
+            with Session(transport, timeout=0.05, window=4) as session:
+                session.pipeline([(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")] * 4)
+                session.request(b"<NO_SUCH_CMD{}>", "[NO_SUCH_CMD{")
+        spans = [e for e in self.load() if e["ph"] == "X"]
+        lanes = {e["tid"] for e in spans if e["name"] == "GET_HOST_PORT"}
+        self.assertEqual({0, 1, 2, 3}, lanes)
+        threads = [e for e in spans if e["pid"] == os.getpid()]
+        self.assertEqual(["pipeline (4)", "NO_SUCH_CMD"], [e["name"] for e in threads])
+        self.assertEqual("terrible", threads[1]["cname"])
+
+    def test_threads(self):
+        def worker(number):
+            get_host_port(f"fake://switch/trace{number}")
+
+        with trace.tracing(self.path, interval=0.01):
+            threads = [
+                threading.Thread(target=worker, args=(n,), name=f"worker-{n}")
+                for n in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        names = {e["args"]["name"] for e in self.load()
+                 if e["ph"] == "M" and e["name"] == "thread_name"}
+        self.assertTrue({"worker-0", "worker-1", "worker-2"} <= names)
+
+    def test_unterminated_file(self):
+        tracer = trace.start_tracing(self.path)
+        get_version("fake://switch/trace")
+        tracer.flush()
+        with open(self.path) as f:
+            text = f.read()
+        # a crashed run leaves the array open, the viewers accept that
+        self.assertTrue(text.startswith("[\n"))
+        self.assertFalse(text.rstrip().endswith("]"))
+        json.loads(text + "]")
+
+
+if __name__ == "__main__":
+    unittest.main()
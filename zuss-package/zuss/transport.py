@@ -0,0 +1,195 @@
+# -----------------------------------------------------------------------------
+# - File              transport.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Transports: local tty, pyserial URLs, in-memory fake
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+Every way of reaching a device is a *transport*: an object with the pyserial
+subset used by the SDK (``write``, ``read``, ``readline``, ``in_waiting``,
+``reset_input_buffer``, ``close``, ``is_open``, ``timeout``).
+
+:func:`open_transport` accepts
+
+* a local port name: ``COM13``, ``/dev/ttyUSB0``
+* ``usb-serial://A50285BI``: the tty of the USB adapter with that serial
+  number, see zuss.identity
+* any pyserial URL: ``socket://rack7:4001`` (ser2net raw), ``rfc2217://rack7:4002``,
+  ``loop://``
+* ``fake://switch`` or ``fake://converter/2?latency=0.02``: an in-memory
+  simulated device, state is kept per URL as long as the process lives
+* ``replay://capture.jsonl?speed=1.0``: a capture written by zuss.capture
+* an already opened transport object, returned as it is
+"""
+
+import heapq
+import time
+
+BAUDRATE = 115200
+
+
+def open_transport(url, baudrate: int = BAUDRATE, timeout: float = 2, bytesize: int = 8):
+    """Open the transport described by ``url``, see the module documentation."""
+    if not isinstance(url, str):
+        return url
+    if url.startswith("usb-serial://"):
+        from zuss.identity import resolve
+
+        port = resolve(url)
+        if port is None:
+            raise OSError(f"device {url} is not attached")
+        url = port
+    if url.startswith("fake://"):
+        return FakeTransport.from_url(url, timeout)
+    if url.startswith("replay://"):
+        from zuss.capture import ReplayTransport
+
+        return ReplayTransport.from_url(url, timeout)
+    # pyserial is only imported for real ports, it is the bulk of the start-up
+    import serial
+
+    from zuss import capture
+
+    serial_con = serial.serial_for_url(
+        url,
+        baudrate=baudrate,
+        timeout=timeout,
+        bytesize=bytesize,
+        stopbits=serial.STOPBITS_ONE,
+    )
+    # record the traffic while a zuss.capture recording is active
+    return capture.wrap(serial_con, url)
+
+
+def _fileno(transport):
+    """Descriptor to wait on, None for in-memory transports."""
+    try:
+        return transport.fileno()
+    except (AttributeError, OSError):
+        # pyserial socket:// has no fileno()
+        sock = getattr(transport, "_socket", None)
+        return None if sock is None else sock.fileno()
+
+
+def _query(url: str):
+    from urllib.parse import parse_qs, urlsplit
+
+    parts = urlsplit(url)
+    query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+    return parts, query
+
+
+class QueueTransport:
+    """
+    Base of the in-process transports.  Incoming data is queued with the time
+    it becomes readable; reads block like pyserial up to ``timeout``.
+    """
+
+    def __init__(self, port: str, timeout: float = 2):
+        self.port = port
+        self.timeout = timeout
+        self.is_open = True
+        self._pending = []  # heap of (due time, sequence, data)
+        self._sequence = 0
+        self._buffer = b""
+
+    def isOpen(self):
+        return self.is_open
+
+    def _push(self, data: bytes, due: float):
+        self._sequence += 1
+        heapq.heappush(self._pending, (due, self._sequence, data))
+
+    def _collect(self):
+        now = time.monotonic()
+        while self._pending and self._pending[0][0] <= now:
+            self._buffer += heapq.heappop(self._pending)[2]
+
+    def _wait(self, ready):
+        deadline = time.monotonic() + (self.timeout or 0)
+        while True:
+            self._collect()
+            if ready():
+                return
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            wake = deadline
+            if self._pending:
+                wake = min(wake, self._pending[0][0])
+            time.sleep(max(0.0, wake - now))
+
+    def due(self):
+        """time.monotonic() when the next data becomes readable, None if none is coming."""
+        return self._pending[0][0] if self._pending else None
+
+    @property
+    def in_waiting(self):
+        self._collect()
+        return len(self._buffer)
+
+    def read(self, size: int = 1):
+        self._wait(lambda: len(self._buffer) >= size)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self):
+        self._wait(lambda: b"\n" in self._buffer)
+        end = self._buffer.find(b"\n") + 1 or len(self._buffer)
+        data, self._buffer = self._buffer[:end], self._buffer[end:]
+        return data
+
+    def reset_input_buffer(self):
+        self._collect()
+        self._buffer = b""
+
+    def close(self):
+        self.is_open = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class FakeTransport(QueueTransport):
+    """
+    In-memory device backed by a zuss.simulator model, no pty or port needed.
+
+    :param model: a SwitchModel / ConverterModel instance
+    :param latency: delay until the answer to a request becomes readable
+    """
+
+    # models of fake:// URLs, so a device keeps its state between two opens
+    devices = {}
+
+    def __init__(self, model, latency: float = 0.0, timeout: float = 2, port: str = "fake"):
+        super().__init__(port, timeout)
+        self.model = model
+        self.latency = latency
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 2):
+        from zuss.simulator import ConverterModel, SwitchModel
+
+        parts, query = _query(url)
+        kinds = {"switch": SwitchModel, "converter": ConverterModel}
+        if parts.netloc not in kinds:
+            raise ValueError(f"unknown fake device {parts.netloc!r} in {url}")
+        key = parts.netloc + parts.path
+        model = cls.devices.get(key)
+        if model is None:
+            model = cls.devices[key] = kinds[parts.netloc](query.get("version"))
+        return cls(model, float(query.get("latency", 0)), timeout, url)
+
+    def write(self, data: bytes):
+        lines = self.model.feed(bytes(data))
+        if lines:
+            answer = "".join(line + "\r\n" for line in lines).encode("ascii")
+            self._push(answer, time.monotonic() + self.latency)
+        return len(data)
@@ -8,14 +8,18 @@
 # - History
 #       2021.06.09    Initial version.                   Zhengkun Li
 #       2021.09.27    Add set_relay/set_power commands.  Yu-Ling Xie
+#       2026.10.19    Run commands on zuss.session, wait for the answer
+#                     frame instead of fixed delays.
+#       2026.10.19    Import colorama and list_ports only when used.
+#       2026.10.19    Add stream_config.
+#       2026.10.19    Getters return int and zuss.frames.Control.
+#       2026.10.19    Run the commands of zuss.commands.SWITCH.
+#       2026.10.19    Add set_relays/set_pwrs.
 # -----------------------------------------------------------------------------
 
-import serial.tools.list_ports as port_list
-import time
-import colorama
-from zuss.serial_manager import SerialPort
-
-colorama.init()
+from zuss.commands import SWITCH, Unsupported
+from zuss.log import device_logger, enable_color
+from zuss.session import open_session
 
 
 class bcolors:
@@ -36,8 +40,11 @@ class bcolors:
 # Returns: The list of serial COM ports in use :list                           #
 ################################################################################
 def detect_comports():
+    import serial.tools.list_ports as port_list
+
     com_ports_details = list(port_list.comports())
     com_ports = []
+    enable_color()
     for p in com_ports_details:
         print(f"{bcolors.OKGREEN}{p}{bcolors.ENDC}")
         com_ports.append(str(p).split(" ")[0])
@@ -51,34 +58,16 @@ def detect_comports():
 # Returns: None                                                                #
 ################################################################################
 def get_version(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(b"<GET_SW_VERSION{}>")
-        serial_str = ""  # Used to hold data coming over UART
-        strData = []
-        res = [None]
-
-        serial_str = serial_con.readline()
-        if "[GET_SW_VERSION{v" in serial_str:
-            strData = serial_str.strip().lstrip("[GET_SW_VERSION{").rstrip("}]")
-            res = strData.split(" ")
-            return res[0]
+    return SWITCH["GET_SW_VERSION"].run(dev_port)
 
 
 ################################################################################
 # Description : Reboot System                                                  #
 # Argument: dev_port: str                                                      #
-# Returns: None                                                                #
+# Returns: Reboot status: bool                                                 #
 ################################################################################
 def reboot_sys(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(b"<REBOOT_SYS{}>")
-        serial_str = ""  # Used to hold data coming over UART
-
-        serial_str = serial_con.readline()
-        if "REBOOT_SYS{ok}" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["REBOOT_SYS"].run(dev_port)
 
 
 ################################################################################
@@ -87,15 +76,7 @@ def reboot_sys(dev_port: str):
 # Returns: Save status: bool                                                   #
 ################################################################################
 def save_config(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(b"<SAVE_CONFIG{}>")
-        serial_str = ""  # Used to hold data coming over UART
-
-        serial_str = serial_con.readline()
-        if "[SAVE_CONFIG{ok}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["SAVE_CONFIG"].run(dev_port)
 
 
 ################################################################################
@@ -106,15 +87,7 @@ def save_config(dev_port: str):
 # Returns: Clear status:bool                                                   #
 ################################################################################
 def clr_config(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(b"<CLEAR_CONFIG{}>")
-        serial_str = ""  # Used to hold data coming over UART
-
-        serial_str = serial_con.readline()
-        if "[CLEAR_CONFIG{ok}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["CLEAR_CONFIG"].run(dev_port)
 
 
 ################################################################################
@@ -123,15 +96,16 @@ def clr_config(dev_port: str):
 # Returns: Display result: bool                                                #
 ################################################################################
 def disp_config(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(b"<DISP_CONFIG{}>")
-        serial_str = ""  # Used to hold data coming over UART
+    return SWITCH["DISP_CONFIG"].run(dev_port)
+
 
-        serial_str = serial_con.readline()
-        if "[DISP_CONFIG{ok}]" in serial_str:
-            return True
-        else:
-            return False
+################################################################################
+# Description : Stream Current Configuration in Ram                            #
+# Argument: dev_port: str                                                      #
+# Returns: Generator of configuration lines: zuss.frames.Display               #
+################################################################################
+def stream_config(dev_port: str):
+    return SWITCH["DISP_CONFIG"].stream(dev_port)
 
 
 ################################################################################
@@ -140,16 +114,7 @@ def disp_config(dev_port: str):
 # Returns: Set Enable Host Port result: bool                                   #
 ################################################################################
 def set_host_port(dev_port: str, port_num: int):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes(f"<SET_HOST_PORT{{{port_num}}}>", encoding="utf8"))
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if f"[SET_HOST_PORT{{{port_num}}}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["SET_HOST_PORT"].run(dev_port, port_num)
 
 
 ################################################################################
@@ -158,17 +123,7 @@ def set_host_port(dev_port: str, port_num: int):
 # Returns:  Currently Enabled Host Port: int                                   #
 ################################################################################
 def get_host_port(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes("<GET_HOST_PORT{}>", encoding="utf8"))
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if "[GET_HOST_PORT{" in serial_str:
-            res = serial_str.strip("[GET_HOST_PORT{")[0]
-            return res
-        else:
-            return None
+    return SWITCH["GET_HOST_PORT"].run(dev_port)
 
 
 ################################################################################
@@ -177,15 +132,7 @@ def get_host_port(dev_port: str):
 # Returns: Set enable port of Device status: bool                              #
 ################################################################################
 def set_dev_port(dev_port: str, port_num: int):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes(f"<SET_DEVICE_PORT{{{port_num}}}>", encoding="utf8"))
-
-        time.sleep(2)
-        serial_str = serial_con.readline()
-        if f"[SET_DEVICE_PORT{{{port_num}}}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["SET_DEVICE_PORT"].run(dev_port, port_num)
 
 
 ################################################################################
@@ -194,16 +141,7 @@ def set_dev_port(dev_port: str, port_num: int):
 # Returns:  Currently Enabled Device Port: int                                 #
 ################################################################################
 def get_dev_port(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes("<GET_DEVICE_PORT{}>", encoding="utf8"))
-
-        time.sleep(2)
-        serial_str = serial_con.readline()
-        if "[GET_DEVICE_PORT{" in serial_str:
-            res = serial_str.strip("[GET_DEVICE_PORT{")[0]
-            return res
-        else:
-            return None
+    return SWITCH["GET_DEVICE_PORT"].run(dev_port)
 
 
 ################################################################################
@@ -214,16 +152,7 @@ def get_dev_port(dev_port: str):
 # Relay1 to Relay4. : bool                                                     #
 ################################################################################
 def set_relay_mask(dev_port: str, mask: int):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes(f"<SET_RELAY_MASK{{{hex(mask)}}}>", encoding="utf8"))
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if f"[SET_RELAY_MASK{{{hex(mask)}}}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["SET_RELAY_MASK"].run(dev_port, mask)
 
 
 ################################################################################
@@ -233,17 +162,7 @@ def set_relay_mask(dev_port: str, mask: int):
 # Get the current Mask of Relays, Bit0 to Bit3 stand for Relay1 to Relay4: int #
 ################################################################################
 def get_relay_mask(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes("<GET_RELAY_MASK{}>", encoding="utf8"))
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if "[GET_RELAY_MASK{" in serial_str:
-            res = int(serial_str.strip().lstrip("[GET_RELAY_MASK{").rstrip("}]"), 0)
-            return res
-        else:
-            return None
+    return SWITCH["GET_RELAY_MASK"].run(dev_port)
 
 
 ################################################################################
@@ -257,16 +176,7 @@ def get_relay_mask(dev_port: str):
 #      <SET_POWER_MASK{0xf}> (Binary:1111), all device port can power supply.  #
 ################################################################################
 def set_pwr_mask(dev_port: str, mask: int):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes(f"<SET_POWER_MASK{{{hex(mask)}}}>", encoding="utf8"))
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if f"[SET_POWER_MASK{{{hex(mask)}}}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["SET_POWER_MASK"].run(dev_port, mask)
 
 
 ################################################################################
@@ -280,17 +190,7 @@ def set_pwr_mask(dev_port: str, mask: int):
 #      <SET_POWER_MASK{0xf}> (Binary:1111), all device port can power supply.  #
 ################################################################################
 def get_pwr_mask(dev_port: str):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(bytes("<GET_POWER_MASK{}>", encoding="utf8"))
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if "[GET_POWER_MASK{" in serial_str:
-            res = int(serial_str.strip().lstrip("[GET_POWER_MASK{").rstrip("}]"), 0)
-            return res
-        else:
-            return None
+    return SWITCH["GET_POWER_MASK"].run(dev_port)
 
 
 ################################################################################
@@ -301,45 +201,17 @@ def get_pwr_mask(dev_port: str):
 # Relay1 to Relay4. : bool                                                     #
 ################################################################################
 def set_relay(dev_port: str, relay_port: int, control: int):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(
-            bytes(
-                "<SET_RELAY{" + str(relay_port) + "," + str(control) + "}>",
-                encoding="utf8",
-            )
-        )
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if "[SET_RELAY{" + str(relay_port) + "," + str(control) + "}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["SET_RELAY"].run(dev_port, relay_port, control)
 
 
 ################################################################################
 # Description : Get Relay                                                      #
 # Argument: dev_port: str, relay_port: int                                     #
-# Returns:                                                                     #
+# Returns: zuss.frames.Control(index, control)                                #
 # Get the current control of Relay                                             #
 ################################################################################
 def get_relay(dev_port: str, relay_port: int):
-    with SerialPort(port=dev_port) as serial_con:
-        data = [0] * 2
-        serial_con.write(bytes("<GET_RELAY{" + str(relay_port) + "}>", encoding="utf8"))
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if "[GET_RELAY{" in serial_str:
-            res = serial_str.strip().lstrip("[GET_RELAY{").rstrip("}]")
-            strData = res.split(",")
-            data[0] = int(strData[0])
-            data[1] = int(strData[1])
-            return data
-        else:
-            return data
+    return SWITCH["GET_RELAY"].run(dev_port, relay_port)
 
 
 ################################################################################
@@ -351,46 +223,64 @@ def get_relay(dev_port: str, relay_port: int):
 # e.g. <SET_POWER{1, 0}> , device1 is set to power down.                       #
 ################################################################################
 def set_pwr(dev_port: str, power_device: int, control: int):
-    with SerialPort(port=dev_port) as serial_con:
-        serial_con.write(
-            bytes(
-                bytes(
-                    "<SET_POWER{" + str(power_device) + "," + str(control) + "}>",
-                    encoding="utf8",
-                )
-            )
-        )
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if "[SET_POWER{" + str(power_device) + "," + str(control) + "}]" in serial_str:
-            return True
-        else:
-            return False
+    return SWITCH["SET_POWER"].run(dev_port, power_device, control)
 
 
 ################################################################################
 # Description : Get Power Supply Status                                        #
 # Argument: power_device: int                                                  #
+# Returns: zuss.frames.Control(index, control)                                #
 # Description                                                                  #
 # Get the current control status of the Device Port                            #
 ################################################################################
 def get_pwr(dev_port: str, power_device: int):
-    with SerialPort(port=dev_port) as serial_con:
-        data = [0] * 2
-        serial_con.write(
-            bytes("<GET_POWER{" + str(power_device) + "}>", encoding="utf8")
-        )
-
-        time.sleep(2)
-
-        serial_str = serial_con.readline()
-        if "[GET_POWER{" in serial_str:
-            res = serial_str.strip().lstrip("[GET_POWER{").rstrip("}]")
-            strData = res.split(",")
-            data[0] = int(strData[0])
-            data[1] = int(strData[1])
-            return data
-        else:
-            return data
+    return SWITCH["GET_POWER"].run(dev_port, power_device)
+
+
+################################################################################
+# Description : Set Several Relays                                             #
+# Argument: dev_port: str, controls: dict {relay_port: control}                #
+# Returns: All set: bool                                                       #
+# Set all four relays with one mask write, others with SET_RELAY, or on       #
+# firmware without SET_RELAY by reading and writing the mask.                  #
+################################################################################
+def set_relays(dev_port: str, controls: dict):
+    return _set_bits(dev_port, "SET_RELAY", "RELAY_MASK", controls)
+
+
+################################################################################
+# Description : Set Power Supply of Several Device Ports                       #
+# Argument: dev_port: str, controls: dict {power_device: control}              #
+# Returns: All set: bool                                                       #
+# Like set_relays, with SET_POWER and the power supply mask.                   #
+################################################################################
+def set_pwrs(dev_port: str, controls: dict):
+    return _set_bits(dev_port, "SET_POWER", "POWER_MASK", controls)
+
+
+def _set_bits(dev_port, single: str, mask: str, controls: dict):
+    """The fewest round trips the firmware of the device allows."""
+    # like set_relay: a call which cannot succeed does not open the port
+    try:
+        if not controls:
+            raise ValueError(f"{single}: no {SWITCH[single].args[0].name} to set")
+        for index, control in controls.items():
+            SWITCH[single].check((index, control))
+    except ValueError as e:
+        device_logger(dev_port).warning("%s", e)
+        return False
+    bits = sum(1 << (index - 1) for index, control in controls.items() if control)
+    with open_session(dev_port, **SWITCH.session) as session:
+        if set(controls) == {1, 2, 3, 4}:
+            return SWITCH["SET_" + mask].run(session, bits)
+        try:
+            SWITCH[single].require(session)
+        except Unsupported:
+            current = SWITCH["GET_" + mask].run(session)
+            if current is None:
+                return False
+            keep = current & ~sum(1 << (index - 1) for index in controls)
+            return SWITCH["SET_" + mask].run(session, keep | bits)
+        # one pipeline: a single round trip
+        return all(SWITCH.pipeline(session, [(single, index, control)
+                                             for index, control in controls.items()]))
@@ -6,9 +6,30 @@
 # - Classification    usbswsdk_unittest
 # - Brief             usbswsdk_unittest for ZD USB Switch
 # ----------------------------------------------------------------------------- 
+import os
 import unittest
 from zuss import *
-comport = "COM13"
+
+# Set ZUSS_TEST_PORT (e.g. COM13) to run against real hardware, otherwise the
+# tests run against a simulated switch.
+comport = os.environ.get("ZUSS_TEST_PORT")
+simulator = None
+
+
+def setUpModule():
+    global comport, simulator
+    if comport is None:
+        from zuss.simulator import Simulator
+
+        simulator = Simulator().start()
+        comport = simulator.add_switch().port
+
+
+def tearDownModule():
+    if simulator is not None:
+        simulator.stop()
+
+
 class TestTemplate(unittest.TestCase):
     def test_set_host_port(self):
         a = set_host_port(comport,3)
@@ -18,10 +39,10 @@ class TestTemplate(unittest.TestCase):
     def test_get_host_port(self):
         set_host_port(comport,3)
         a = get_host_port(comport)
-        self.assertEqual("3",a)
+        self.assertEqual(3,a)
         set_host_port(comport,1)
         a = get_host_port(comport)
-        self.assertEqual("1",a)
+        self.assertEqual(1,a)
     def test_set_dev_port(self):
         a = set_dev_port(comport,1)
         self.assertTrue(a)
@@ -36,10 +57,10 @@ class TestTemplate(unittest.TestCase):
     def  test_get_dev_port(self):
         set_dev_port(comport,3)
         a = get_dev_port(comport)
-        self.assertEqual("3",a)
+        self.assertEqual(3,a)
         set_dev_port(comport,1)
         a = get_dev_port(comport)
-        self.assertEqual("1",a)
+        self.assertEqual(1,a)
     def test_set_relay_mask(self):
         for i in range(0,15):   
             a = set_relay_mask(comport,i)
@@ -58,5 +79,11 @@ class TestTemplate(unittest.TestCase):
             set_pwr_mask(comport,i)
             a = get_pwr_mask(comport)
             self.assertEqual(i, a)
+    def test_get_relay(self):
+        set_relay_mask(comport,0x2)
+        a = get_relay(comport,2)
+        self.assertEqual((2,1),a)
+        self.assertEqual(1,a.control)
+        self.assertEqual(0,get_relay(comport,1).control)
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
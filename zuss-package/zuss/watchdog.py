@@ -0,0 +1,144 @@
+# -----------------------------------------------------------------------------
+# - File              watchdog.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    Python SDK
+# - Brief             Health check and reconnection of long lived sessions
+# - History
+#       2026.10.19    Initial version.
+# -----------------------------------------------------------------------------
+"""
+A :class:`Watchdog` keeps a long lived zuss.session.Session usable when the
+USB serial adapter of its device hiccups::
+
+    session = Session("/dev/ttyUSB0").open()
+    with Watchdog(session):
+        ...
+
+It sends ``GET_SW_VERSION`` when the port was quiet for ``idle`` seconds.
+After ``failures`` commands in a row went unanswered (probes or commands of
+the callers) the device is down: the commands of the session fail at once
+with the outcome "down" instead of each waiting for its timeout, and the
+watchdog reopens the port, with growing pauses, until a probe is answered.
+
+zussd runs one per device with ``--watchdog``.
+"""
+
+import logging
+import threading
+import time
+
+from zuss.commands import SWITCH
+
+# probe a port quiet for this long (seconds)
+IDLE = 10.0
+# commands in a row without an answer after which the device is down
+FAILURES = 2
+# time to wait for the answer of a probe (seconds)
+PROBE_TIMEOUT = 1.0
+# first and longest pause between two attempts to reopen the port (seconds)
+RETRY = 0.5
+MAX_RETRY = 30.0
+
+# the same for the switch and the converter
+PROBE = SWITCH["GET_SW_VERSION"].encode()
+
+logger = logging.getLogger("zuss.watchdog")
+
+
+class Watchdog:
+    """Health check thread of one session, see the module documentation."""
+
+    def __init__(self, session, idle: float = IDLE, failures: int = FAILURES,
+                 timeout: float = PROBE_TIMEOUT):
+        self.session = session
+        self.idle = idle
+        self.failures = failures
+        self.timeout = timeout
+        self.reconnects = 0
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+
+    def __repr__(self):
+        return f"<Watchdog {self.session.port} {'up' if self.healthy else 'down'}>"
+
+    @property
+    def healthy(self) -> bool:
+        return not self.session.down
+
+    def start(self):
+        if self._thread is None:
+            self._stopped = False
+            self.session.watchdog = self
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name=f"zuss-watchdog-{self.session.name}")
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.session.watchdog is self:
+            self.session.watchdog = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def wake(self):
+        """Look at the session now (a command timed out)."""
+        self._wake.set()
+
+    def check(self) -> bool:
+        """Probe the device now, True if it answered."""
+        return self.session.probe(*PROBE, self.timeout)
+
+    def _down(self):
+        session = self.session
+        session.down = True
+        logger.warning("%s does not answer, reconnecting", session.port)
+        # waits for the commands in flight
+        session.close()
+
+    def _reconnect(self) -> bool:
+        session = self.session
+        session.close()
+        session.open()
+        if not session.is_open or not self.check():
+            return False
+        session.failures = 0
+        session.down = False
+        self.reconnects += 1
+        logger.warning("%s answers again", session.port)
+        return True
+
+    def _run(self):
+        retry = RETRY
+        while not self._stopped:
+            session = self.session
+            if session.down:
+                if self._reconnect():
+                    retry = RETRY
+                    continue
+                pause, retry = retry, min(retry * 2, MAX_RETRY)
+            elif session.failures >= self.failures:
+                self._down()
+                continue
+            else:
+                quiet = time.perf_counter() - session.answered
+                pause = self.idle - quiet
+                if pause <= 0 or not session.is_open:
+                    failures = session.failures
+                    if session.is_open and not self.check() and session.failures > failures:
+                        # unanswered, the next probe follows at once
+                        continue
+                    pause = self.idle
+            self._wake.wait(pause)
+            self._wake.clear()
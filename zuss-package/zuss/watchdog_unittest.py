@@ -0,0 +1,111 @@
+# -----------------------------------------------------------------------------
+# - File              watchdog_unittest.py
+# - Owner             Zhengkun Li
+# - Version           1.0
+# - Date              19.10.2026
+# - Classification    watchdog_unittest
+# - Brief             watchdog_unittest for health checks and reconnection
+# -----------------------------------------------------------------------------
+import time
+import unittest
+
+from zuss import *
+from zuss import metrics
+from zuss.reactor import Reactor
+from zuss.session import Session
+from zuss.transport import FakeTransport
+from zuss.watchdog import Watchdog
+
+
+def wait_for(condition, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+class TestWatchdog(unittest.TestCase):
+    def setUp(self):
+        self.records = []
+        metrics.add_hook(self.records.append)
+        self.session = Session("fake://switch/watchdog", timeout=0.2).open()
+        self.model = FakeTransport.devices["switch/watchdog"]
+        self.watchdog = Watchdog(self.session, idle=0.05, timeout=0.05)
+
+    def hang(self):
+        """The adapter stops passing data until repair()."""
+        self.model.feed = lambda data: []
+        self.addCleanup(self.repair)
+
+    def repair(self):
+        self.model.__dict__.pop("feed", None)
+
+    def tearDown(self):
+        self.watchdog.stop()
+        self.session.close()
+        metrics.remove_hook(self.records.append)
+
+    def test_probe_when_idle(self):
+        with self.watchdog:
+            wait_for(lambda: len(self.records) >= 3)
+        self.assertEqual({"GET_SW_VERSION"}, {record.name for record in self.records})
+        self.assertTrue(self.watchdog.healthy)
+
+    def test_down_fails_fast_and_recovers(self):
+        self.watchdog.start()
+        self.hang()
+        self.assertFalse(set_host_port(self.session, 2))
+        wait_for(lambda: not self.watchdog.healthy)
+        start = time.monotonic()
+        self.assertFalse(set_host_port(self.session, 3))
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertEqual(metrics.DOWN, [record.outcome for record in self.records
+                                         if record.name == "SET_HOST_PORT"][-1])
+        self.repair()
+        wait_for(lambda: self.watchdog.healthy)
+        self.assertTrue(set_host_port(self.session, 3))
+        self.assertEqual(1, self.watchdog.reconnects)
+
+    def test_commands_count_as_failures(self):
+        self.watchdog.idle = 60
+        self.watchdog.start()
+        self.hang()
+        self.assertEqual([None, None], self.session.pipeline(
+            [(b"<GET_HOST_PORT{}>", "[GET_HOST_PORT{")] * 2))
+        wait_for(lambda: not self.watchdog.healthy)
+
+
+class TestReactorWatchdog(unittest.TestCase):
+    def setUp(self):
+        self.records = []
+        metrics.add_hook(self.records.append)
+        self.addCleanup(metrics.remove_hook, self.records.append)
+        self.reactor = Reactor(timeout=0.2).start()
+        self.addCleanup(self.reactor.stop)
+        self.session = self.reactor.session("fake://switch/watchdog-reactor").open()
+        self.model = FakeTransport.devices["switch/watchdog-reactor"]
+        self.watchdog = Watchdog(self.session, idle=0.05, timeout=0.05)
+        self.addCleanup(self.watchdog.stop)
+
+    def test_probe(self):
+        self.assertTrue(self.watchdog.check())
+        self.assertEqual(metrics.OK, self.records[-1].outcome)
+
+    def test_down_fails_fast_and_recovers(self):
+        self.watchdog.start()
+        self.model.feed = lambda data: []
+        self.addCleanup(self.model.__dict__.pop, "feed", None)
+        wait_for(lambda: not self.watchdog.healthy)
+        start = time.monotonic()
+        self.assertFalse(set_host_port(self.session, 3))
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertEqual(metrics.DOWN, [record.outcome for record in self.records
+                                         if record.name == "SET_HOST_PORT"][-1])
+        del self.model.feed
+        wait_for(lambda: self.watchdog.healthy)
+        self.assertTrue(set_host_port(self.session, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()